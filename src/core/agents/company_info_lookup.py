@@ -0,0 +1,168 @@
+'''
+Cached company research in front of the search agent.
+'''
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from src.core.agents.search_agents import CompanySearchAgentPool, search_company_info
+from src.core.domain.company_names import CompanyNameIndex
+from src.core.domain.company_search import CompanyInfo, PartialCompanyInfo
+from src.core.domain.config import CompanyCacheConfig
+from src.core.ports.secondary.company_info_cache import CompanyInfoCache
+from src.core.ports.secondary.template_service import TemplateService
+
+logger = logging.getLogger("core.agents.company_info_lookup")
+
+CompanySearch = Callable[[str], Awaitable[Optional[CompanyInfo]]]
+
+
+class CachedCompanySearch:
+    '''
+    Looks up company information through a persistent cache.
+
+    Fresh entries are returned directly. Stale entries are returned immediately
+    while a background task researches the company again. Failed lookups are
+    cached too, so a company that cannot be found is not searched for on every
+    resume. Search errors are not cached but raised, so they can be retried,
+    and partial results of a search stopped by its budget are returned but not
+    cached.
+    Concurrent lookups of the same company share a single search.
+
+    :param cache: Persistent store of lookups
+    :type cache: CompanyInfoCache
+    :param template_service: Template service for the search agent prompts
+    :type template_service: TemplateService
+    :param config: TTL configuration, defaults to CompanyCacheConfig()
+    :type config: Optional[CompanyCacheConfig]
+    :param model_name: Model used by the search agent
+    :type model_name: str
+    :param search: Uncached lookup, defaults to the company search agent
+    :type search: Optional[CompanySearch]
+    :param name_index: Index mapping spellings of a company name to the cache key
+    :type name_index: Optional[CompanyNameIndex]
+    :param agent_pool: Agents of the default search, defaults to the pool shared by the template service
+    :type agent_pool: Optional[CompanySearchAgentPool]
+    '''
+    def __init__(self, cache: CompanyInfoCache, template_service: TemplateService,
+                 config: Optional[CompanyCacheConfig] = None,
+                 model_name: str = "gpt-4.1-mini",
+                 search: Optional[CompanySearch] = None,
+                 name_index: Optional[CompanyNameIndex] = None,
+                 agent_pool: Optional[CompanySearchAgentPool] = None):
+        self._cache = cache
+        self.name_index = name_index or CompanyNameIndex()
+        self._config = config or CompanyCacheConfig()
+        self._template_service = template_service
+        self._model_name = model_name
+        self._search = search
+        self._agent_pool = agent_pool
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+
+    async def search(self, company_name: str,
+                     agent_pool: Optional[CompanySearchAgentPool] = None) -> Optional[CompanyInfo]:
+        '''
+        Get information about a company, researching it only if needed.
+
+        :param company_name: Company name as written in the resume or job description
+        :type company_name: str
+        :param agent_pool: Agents of the default search on a cache miss or refresh, e.g. configured
+            by the graph's CompanyResearcher, defaults to the pool given to the constructor
+        :type agent_pool: Optional[CompanySearchAgentPool]
+        :return: Company information, or None if it could not be found
+        :rtype: Optional[CompanyInfo]
+        '''
+        # Never a typo match, which depends on the names seen in this process
+        key = self.name_index.key(company_name)
+        entry = self._cache.get(key)
+        if entry is not None:
+            age = time.time() - entry.fetched_at
+            if entry.company_info is None:
+                if age < self._config.negative_ttl_seconds:
+                    logger.info(f"Skipping {company_name}, lookup failed recently")
+                    return None
+            elif age < self._config.ttl_seconds:
+                return entry.company_info
+            elif age < self._config.ttl_seconds + self._config.max_stale_seconds:
+                logger.info(f"Refreshing stale information on {company_name} in the background")
+                self._refresh_in_background(key, company_name, agent_pool)
+                return entry.company_info
+
+        # Shielded so a cancelled caller does not cancel the search shared with others
+        return await asyncio.shield(self._lookup(key, company_name, agent_pool))
+
+    def _lookup(self, key: str, company_name: str,
+                agent_pool: Optional[CompanySearchAgentPool] = None) -> asyncio.Task:
+        '''
+        Research a company and cache the result, sharing the search with concurrent callers.
+
+        :param key: Canonical company name
+        :type key: str
+        :param company_name: Company name as written
+        :type company_name: str
+        :param agent_pool: Agents of the default search
+        :type agent_pool: Optional[CompanySearchAgentPool]
+        :return: Task resolving to the company information
+        :rtype: asyncio.Task
+        '''
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._search_and_store(key, company_name, agent_pool))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return task
+
+    def _search_company(self, company_name: str,
+                        agent_pool: Optional[CompanySearchAgentPool]) -> Awaitable[Optional[CompanyInfo]]:
+        if self._search is not None:
+            return self._search(company_name)
+        return search_company_info(company_name=company_name, template_service=self._template_service,
+                                   model_name=self._model_name, agent_pool=agent_pool or self._agent_pool)
+
+    async def _search_and_store(self, key: str, company_name: str,
+                                agent_pool: Optional[CompanySearchAgentPool] = None) -> Optional[CompanyInfo]:
+        # Only "not found" is cached; errors such as rate limits are raised to the
+        # caller to retry, unless information found earlier can be served instead
+        try:
+            company_info = await self._search_company(company_name, agent_pool)
+        except Exception as e:
+            previous = self._cache.get(key)
+            if previous is not None and previous.company_info is not None:
+                logger.warning(f"Refreshing {company_name} failed, keeping the stale entry: {str(e)}")
+                return previous.company_info
+            raise
+
+        if company_info is None:
+            # A failed refresh must not replace information found earlier
+            previous = self._cache.get(key)
+            if previous is not None and previous.company_info is not None:
+                logger.warning(f"Refreshing {company_name} failed, keeping the stale entry")
+                return previous.company_info
+
+        if isinstance(company_info, PartialCompanyInfo):
+            logger.info(f"Not caching the partial information on {company_name}")
+            return company_info
+
+        self._cache.set(key, company_info)
+        return company_info
+
+    def _refresh_in_background(self, key: str, company_name: str,
+                               agent_pool: Optional[CompanySearchAgentPool] = None) -> None:
+        task = self._lookup(key, company_name, agent_pool)
+        # Keep a reference so the task is not garbage collected before it finishes
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        task.add_done_callback(self._log_refresh_error)
+
+    @staticmethod
+    def _log_refresh_error(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Background refresh failed: {str(task.exception())}")
+
+    async def wait_for_refreshes(self) -> None:
+        '''Wait until all background refreshes have finished, e.g. before shutting down.'''
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
@@ -0,0 +1,148 @@
+'''
+Bounded, rate-limit aware fan-out of company research.
+'''
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Dict, Iterable, Optional
+
+from src.core.domain.company_search import CompanyInfo, CompanyResearchOutcome, PartialCompanyInfo
+from src.core.domain.config import CompanyResearchConfig
+
+logger = logging.getLogger("core.agents.company_research")
+
+CompanySearch = Callable[[str], Awaitable[Optional[CompanyInfo]]]
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    '''
+    Check whether an error means a backend is throttling us (HTTP 429).
+
+    Covers the OpenAI client (``status_code``), httpx (``response.status_code``)
+    and aiohttp (``status``), which the model and the search tool raise.
+
+    :param error: Error raised by a search
+    :type error: BaseException
+    :return: True if the search should be retried after a backoff
+    :rtype: bool
+    '''
+    response = getattr(error, "response", None)
+    status_codes = (
+        getattr(error, "status_code", None),
+        getattr(error, "status", None),
+        getattr(response, "status_code", None),
+    )
+    return 429 in status_codes or type(error).__name__ == "RateLimitError"
+
+
+def backoff_delay(attempt: int, config: CompanyResearchConfig) -> float:
+    '''
+    Delay before a retry: exponential in the attempt number, capped, with jitter
+    so that companies throttled together do not retry together.
+
+    :param attempt: Number of the failed attempt, starting at 1
+    :type attempt: int
+    :param config: Backoff configuration
+    :type config: CompanyResearchConfig
+    :return: Delay in seconds
+    :rtype: float
+    '''
+    delay = min(config.backoff_max_seconds, config.backoff_base_seconds * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class CompanyResearcher:
+    '''
+    Researches companies concurrently within the configured limits.
+
+    A single researcher shared by the nodes of a graph bounds the number of
+    companies researched at once across all of them. Each company is retried
+    on rate limit errors and given up on at its deadline, and every company
+    gets an outcome, so failures are reported rather than dropped.
+
+    :param config: Concurrency, retry and deadline configuration, defaults to CompanyResearchConfig()
+    :type config: Optional[CompanyResearchConfig]
+    '''
+    def __init__(self, config: Optional[CompanyResearchConfig] = None):
+        self.config = config or CompanyResearchConfig()
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # One semaphore per event loop, since a semaphore cannot be shared between loops
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            self._semaphores = {
+                known: value for known, value in self._semaphores.items() if not known.is_closed()
+            }
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.config.max_concurrency)
+        return semaphore
+
+    async def research(self, company_names: Iterable[str], search: CompanySearch) -> Dict[str, CompanyResearchOutcome]:
+        '''
+        Research several companies.
+
+        :param company_names: Names of the companies to research
+        :type company_names: Iterable[str]
+        :param search: Lookup of a single company
+        :type search: CompanySearch
+        :return: Outcome per company name, in input order
+        :rtype: Dict[str, CompanyResearchOutcome]
+        '''
+        company_names = list(dict.fromkeys(company_names))
+        outcomes = await asyncio.gather(*[self.research_company(name, search) for name in company_names])
+        return dict(zip(company_names, outcomes))
+
+    async def research_company(self, company_name: str, search: CompanySearch) -> CompanyResearchOutcome:
+        '''
+        Research a single company, retrying on rate limits until its deadline.
+
+        The deadline starts once a concurrency slot is free, so waiting for other
+        companies does not count against it.
+
+        :param company_name: Name of the company
+        :type company_name: str
+        :param search: Lookup of a single company
+        :type search: CompanySearch
+        :return: Outcome of the research
+        :rtype: CompanyResearchOutcome
+        '''
+        async with self._semaphore():
+            started = time.monotonic()
+            outcome = CompanyResearchOutcome(company_name=company_name, status="failed")
+            try:
+                await asyncio.wait_for(self._search_with_retries(company_name, search, outcome),
+                                       timeout=self.config.deadline_seconds)
+            except asyncio.TimeoutError:
+                logger.warning(f"Research on {company_name} exceeded {self.config.deadline_seconds}s")
+                outcome.status = "timed_out"
+                outcome.error = outcome.error or "Deadline exceeded"
+            outcome.elapsed_seconds = time.monotonic() - started
+            return outcome
+
+    async def _search_with_retries(self, company_name: str, search: CompanySearch,
+                                   outcome: CompanyResearchOutcome) -> None:
+        while True:
+            outcome.attempts += 1
+            try:
+                company_info = await search(company_name)
+            except Exception as e:
+                outcome.error = f"{type(e).__name__}: {str(e)}"
+                if not is_rate_limit_error(e) or outcome.attempts > self.config.max_retries:
+                    logger.error(f"Error searching for company info on {company_name}: {str(e)}")
+                    outcome.status = "failed"
+                    return
+                delay = backoff_delay(outcome.attempts, self.config)
+                logger.info(f"Rate limited researching {company_name}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            outcome.company_info = company_info
+            if isinstance(company_info, PartialCompanyInfo):
+                outcome.status = "partial"
+            else:
+                outcome.status = "found" if company_info else "not_found"
+            outcome.error = None
+            return
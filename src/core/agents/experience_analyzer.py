@@ -117,16 +117,18 @@ async def analyze_experience_node(
         logger.warning("No experience found in resume. Skipping experience analysis.")
         return {"experience_alignment": None} 
 
-    # 1. Prepare data for the prompt
+    # 1. Prepare data for the prompt, reusing the job's precomputed fragments when available
     total_years = await calculate_years_experience(resume.experiences)
     experiences_text = await format_experiences_for_prompt(resume.experiences)
+    job_profile = state.get('job_profile')
+    job_details = job_profile.prompt_fragments if job_profile else await format_job_details_for_prompt(job_description)
 
     try:
         # Call the LLM and parse the response
         alignment = await extractor.generate_structured_output(
             template_path="prompts/agents/experience_analyzer.j2",
             template_vars={"resume_experiences": experiences_text,
-                          "job_description": job_description,
+                          "job_description": job_details,
                           "total_years_experience": total_years,
                           "hr_feedback": state.get("company_alignment_feedback")},
             output_model=ExperienceAlignment
@@ -5,38 +5,114 @@ from src.core.domain.config import OpenAIConfig, TemplateConfig
 from src.core.domain.constants import TEST_RESUME_FILE_PATH, TEST_JOB_DESCRIPTION_FILE_PATH
 
 # agent
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph, START, END
 from langchain.schema.runnable import RunnableMap
-from src.core.agents.utils.nodes import parse_resume_node, parse_job_description_node, search_company_info_node
+from langgraph.types import Send
+from src.core.agents.utils.nodes import (
+    parse_resume_node, parse_job_description_node, search_company_info_node, merge_analysis_node,
+    prepare_job_node, analyze_job_pair_node
+)
 from src.core.agents.company_alignment_analyzer import company_alignment_analyzer
-from src.core.agents.utils.state import AgentState
+from src.core.agents.utils.state import AgentState, MultiJobState
+from src.core.agents.utils.memoization import NodeCache, memoize_node
+from src.core.agents.utils.job_profiles import JobProfileStore
+from src.core.agents.company_info_lookup import CachedCompanySearch
+from src.core.agents.company_research import CompanyResearcher
+from src.core.agents.search_agents import CompanySearchAgentPool
+from src.core.ports.secondary.ai_provider import AIProvider
+from src.core.ports.secondary.llm_extractor import LLMExtractor
+from src.core.ports.secondary.template_service import TemplateService
 import logging
-from src.infrastructure.components import llm_extractor
+from src.infrastructure import components
 from functools import partial
+from typing import Dict, List, Optional
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("core.agents.graph_builder")
 
-def build_resume_analysis_graph():
+# Analysis nodes and the upstream nodes whose output they read. In parallel mode
+# each analyzer starts as soon as its own inputs are ready.
+ANALYSIS_DEPENDENCIES: Dict[str, List[str]] = {
+    "company_alignment_analyzer": ["resume_company_research", "job_company_research"],
+    "experience_analyzer": ["parse_resume", "parse_job_description"],
+}
+
+def build_resume_analysis_graph(parallel: bool = False,
+                                llm_extractor: Optional[LLMExtractor] = None,
+                                ai_provider: Optional[AIProvider] = None,
+                                template_service: Optional[TemplateService] = None,
+                                node_cache: Optional[NodeCache] = None,
+                                checkpointer: Optional[BaseCheckpointSaver] = None,
+                                company_search: Optional[CachedCompanySearch] = None,
+                                company_researcher: Optional[CompanyResearcher] = None,
+                                agent_pool: Optional[CompanySearchAgentPool] = None):
+    """
+    Build the resume analysis graph.
+
+    In the default sequential mode the experience analyzer runs after the
+    company alignment analyzer and receives its feedback. In parallel mode the
+    analyzers run concurrently and are joined by a merge node, so the analysis
+    takes as long as the slowest branch rather than the sum of the LLM calls.
+    The experience analyzer then runs without company alignment feedback.
+
+    :param parallel: Run the analysis nodes concurrently
+    :type parallel: bool
+    :param llm_extractor: Extractor used for parsing and structured analysis, defaults to the shared component
+    :type llm_extractor: Optional[LLMExtractor]
+    :param ai_provider: AI provider for free-text analysis, defaults to the shared component
+    :type ai_provider: Optional[AIProvider]
+    :param template_service: Template service for prompts, defaults to the shared component
+    :type template_service: Optional[TemplateService]
+    :param node_cache: When given, LLM nodes reuse cached outputs for unchanged inputs, e.g. the
+        resume-side nodes when only the job description changes
+    :type node_cache: Optional[NodeCache]
+    :param checkpointer: When given, the state is saved after every step so that interrupted
+        runs can be resumed with :func:`run_resumable`
+    :type checkpointer: Optional[BaseCheckpointSaver]
+    :param company_search: Cached company lookup used instead of researching every company on every run
+    :type company_search: Optional[CachedCompanySearch]
+    :param company_researcher: Limits on concurrency, rate and duration of company research, shared by
+        all research nodes of the graph
+    :type company_researcher: Optional[CompanyResearcher]
+    :param agent_pool: Company search agents, also used by company_search on cache misses, defaults to a
+        pool with the configuration of company_researcher if one is given, else to the searches' own default
+    :type agent_pool: Optional[CompanySearchAgentPool]
+    :return: Compiled graph
+    """
+    llm_extractor = llm_extractor or components.llm_extractor
+    ai_provider = ai_provider or components.ai_provider
+    template_service = template_service or components.template_service
+    agent_pool = agent_pool or _default_agent_pool(template_service, company_researcher)
+    company_researcher = company_researcher or CompanyResearcher()
+
     workflow = StateGraph(AgentState)
-    logger.info("Building workflow...")
+    logger.info(f"Building {'parallel' if parallel else 'sequential'} workflow...")
+
+    def add_node(name, node):
+        if node_cache is not None:
+            node = memoize_node(node, name, node_cache, template_service=template_service)
+        workflow.add_node(name, node)
 
     # Use functools.partial to inject dependencies into the nodes
-    workflow.add_node("parse_resume", partial(parse_resume_node, extractor=llm_extractor))
-    workflow.add_node("job_company_research", partial(search_company_info_node, 
-                                                      template_service=template_service, 
-                                                      branch="job_description",
-                                                      model_name="gpt-4.1-mini"))
-    workflow.add_node("resume_company_research", partial(search_company_info_node, 
-                                                         template_service=template_service, 
-                                                         branch="resume",
-                                                         model_name="gpt-4.1-mini"))
-
-    workflow.add_node("parse_job_description", partial(parse_job_description_node, extractor=llm_extractor))
-    workflow.add_node("experience_analyzer", partial(analyze_experience_node, extractor=llm_extractor))
-    workflow.add_node("company_alignment_analyzer", partial(company_alignment_analyzer, 
-                                                            ai_provider=ai_provider,
-                                                            template_service=template_service))
+    add_node("parse_resume", partial(parse_resume_node, extractor=llm_extractor))
+    add_node("job_company_research", partial(search_company_info_node, 
+                                             template_service=template_service, 
+                                             branch="job_description",
+                                             model_name="gpt-4.1-mini",
+                                             company_search=company_search,
+                                             company_researcher=company_researcher,
+                                             agent_pool=agent_pool))
+    add_node("resume_company_research", partial(search_company_info_node, 
+                                                template_service=template_service, 
+                                                branch="resume",
+                                                model_name="gpt-4.1-mini",
+                                                company_search=company_search,
+                                                company_researcher=company_researcher,
+                                                agent_pool=agent_pool))
+
+    add_node("parse_job_description", partial(parse_job_description_node, extractor=llm_extractor))
+    _add_analysis_nodes(add_node, llm_extractor, ai_provider, template_service)
     
     #### RESUME PATH ###
     workflow.add_edge(START, "parse_resume")
@@ -47,16 +123,227 @@ def build_resume_analysis_graph():
     workflow.add_edge("parse_job_description", "job_company_research")
 
     #### ANALYSIS PATH ###
-    workflow.add_edge("resume_company_research", "company_alignment_analyzer")
-    workflow.add_edge("job_company_research", "company_alignment_analyzer")
-    workflow.add_edge("company_alignment_analyzer", "experience_analyzer")
-    workflow.add_edge("experience_analyzer", END)
+    if parallel:
+        workflow.add_node("merge_analysis", merge_analysis_node)
+        for node, dependencies in ANALYSIS_DEPENDENCIES.items():
+            workflow.add_edge(dependencies, node)
+        workflow.add_edge(list(ANALYSIS_DEPENDENCIES), "merge_analysis")
+        workflow.add_edge("merge_analysis", END)
+    else:
+        workflow.add_edge("resume_company_research", "company_alignment_analyzer")
+        workflow.add_edge("job_company_research", "company_alignment_analyzer")
+        workflow.add_edge("company_alignment_analyzer", "experience_analyzer")
+        workflow.add_edge("experience_analyzer", END)
     
     # Compile and return the graph
+    return workflow.compile(checkpointer=checkpointer)
+
+def _default_agent_pool(template_service: TemplateService,
+                        company_researcher: Optional[CompanyResearcher]) -> Optional[CompanySearchAgentPool]:
+    """
+    Build a pool with the researcher's rates and budgets. Without a researcher
+    the searches keep their own default, e.g. the pool given to a CachedCompanySearch.
+    """
+    if company_researcher is not None:
+        return CompanySearchAgentPool(template_service, company_researcher.config)
+    return None
+
+def _add_analysis_nodes(add_node, llm_extractor: LLMExtractor, ai_provider: AIProvider,
+                        template_service: TemplateService) -> None:
+    """Add the analysis nodes, injecting their dependencies."""
+    add_node("experience_analyzer", partial(analyze_experience_node, extractor=llm_extractor))
+    add_node("company_alignment_analyzer", partial(company_alignment_analyzer, 
+                                                   ai_provider=ai_provider,
+                                                   template_service=template_service))
+
+def build_job_pair_analysis_graph(parallel: bool = False,
+                                  llm_extractor: Optional[LLMExtractor] = None,
+                                  ai_provider: Optional[AIProvider] = None,
+                                  template_service: Optional[TemplateService] = None,
+                                  node_cache: Optional[NodeCache] = None):
+    """
+    Build a graph running only the analysis nodes on an already parsed and researched pair.
+
+    :param parallel: Run the analysis nodes concurrently
+    :type parallel: bool
+    :param llm_extractor: Extractor used for structured analysis, defaults to the shared component
+    :type llm_extractor: Optional[LLMExtractor]
+    :param ai_provider: AI provider for free-text analysis, defaults to the shared component
+    :type ai_provider: Optional[AIProvider]
+    :param template_service: Template service for prompts, defaults to the shared component
+    :type template_service: Optional[TemplateService]
+    :param node_cache: When given, analysis nodes reuse cached outputs for unchanged inputs
+    :type node_cache: Optional[NodeCache]
+    :return: Compiled graph
+    """
+    llm_extractor = llm_extractor or components.llm_extractor
+    ai_provider = ai_provider or components.ai_provider
+    template_service = template_service or components.template_service
+
+    workflow = StateGraph(AgentState)
+
+    def add_node(name, node):
+        if node_cache is not None:
+            node = memoize_node(node, name, node_cache, template_service=template_service)
+        workflow.add_node(name, node)
+
+    _add_analysis_nodes(add_node, llm_extractor, ai_provider, template_service)
+
+    if parallel:
+        workflow.add_node("merge_analysis", merge_analysis_node)
+        for node in ANALYSIS_DEPENDENCIES:
+            workflow.add_edge(START, node)
+        workflow.add_edge(list(ANALYSIS_DEPENDENCIES), "merge_analysis")
+        workflow.add_edge("merge_analysis", END)
+    else:
+        workflow.add_edge(START, "company_alignment_analyzer")
+        workflow.add_edge("company_alignment_analyzer", "experience_analyzer")
+        workflow.add_edge("experience_analyzer", END)
+
     return workflow.compile()
 
+def build_multi_job_analysis_graph(parallel: bool = False,
+                                   llm_extractor: Optional[LLMExtractor] = None,
+                                   ai_provider: Optional[AIProvider] = None,
+                                   template_service: Optional[TemplateService] = None,
+                                   node_cache: Optional[NodeCache] = None,
+                                   checkpointer: Optional[BaseCheckpointSaver] = None,
+                                   job_profiles: Optional[JobProfileStore] = None,
+                                   company_search: Optional[CachedCompanySearch] = None,
+                                   company_researcher: Optional[CompanyResearcher] = None,
+                                   agent_pool: Optional[CompanySearchAgentPool] = None):
+    """
+    Build a graph matching one resume against many job descriptions.
+
+    The resume is parsed and its companies researched once, while a profile of
+    every job description is built concurrently, or taken from the job profile
+    store if the job was seen before. Once both sides are
+    ready, the analysis nodes run for every pair concurrently, sharing the
+    resume-side state. Invoke with ``resume_path`` and ``job_description_paths``;
+    results are returned in ``job_analyses`` keyed by job description path.
+
+    :param parallel: Run the analysis nodes of each pair concurrently
+    :type parallel: bool
+    :param llm_extractor: Extractor used for parsing and structured analysis, defaults to the shared component
+    :type llm_extractor: Optional[LLMExtractor]
+    :param ai_provider: AI provider for free-text analysis, defaults to the shared component
+    :type ai_provider: Optional[AIProvider]
+    :param template_service: Template service for prompts, defaults to the shared component
+    :type template_service: Optional[TemplateService]
+    :param node_cache: When given, LLM nodes reuse cached outputs for unchanged inputs
+    :type node_cache: Optional[NodeCache]
+    :param checkpointer: When given, the state is saved after every step
+    :type checkpointer: Optional[BaseCheckpointSaver]
+    :param job_profiles: Store of job profiles reused across runs and candidates
+    :type job_profiles: Optional[JobProfileStore]
+    :param company_search: Cached company lookup used instead of researching every company on every run
+    :type company_search: Optional[CachedCompanySearch]
+    :param company_researcher: Limits on concurrency, rate and duration of company research, shared by
+        all research nodes of the graph
+    :type company_researcher: Optional[CompanyResearcher]
+    :param agent_pool: Company search agents, also used by company_search on cache misses, defaults to a
+        pool with the configuration of company_researcher if one is given, else to the searches' own default
+    :type agent_pool: Optional[CompanySearchAgentPool]
+    :return: Compiled graph
+    """
+    llm_extractor = llm_extractor or components.llm_extractor
+    ai_provider = ai_provider or components.ai_provider
+    template_service = template_service or components.template_service
+    agent_pool = agent_pool or _default_agent_pool(template_service, company_researcher)
+    company_researcher = company_researcher or CompanyResearcher()
+
+    def memoized(name, node):
+        if node_cache is not None:
+            return memoize_node(node, name, node_cache, template_service=template_service)
+        return node
+
+    workflow = StateGraph(MultiJobState)
+    logger.info("Building multi-job workflow...")
+
+    #### RESUME PATH ###
+    workflow.add_node("parse_resume", memoized("parse_resume", partial(parse_resume_node, extractor=llm_extractor)))
+    workflow.add_node("resume_company_research", memoized("resume_company_research", partial(
+        search_company_info_node, template_service=template_service, branch="resume", model_name="gpt-4.1-mini",
+        company_search=company_search, company_researcher=company_researcher, agent_pool=agent_pool,
+    )))
+    workflow.add_edge(START, "parse_resume")
+    workflow.add_edge("parse_resume", "resume_company_research")
+
+    #### JOB DESCRIPTION PATH, ONE BRANCH PER JOB ###
+    workflow.add_node("prepare_job", partial(
+        prepare_job_node,
+        parse_node=memoized("parse_job_description", partial(parse_job_description_node, extractor=llm_extractor)),
+        research_node=memoized("job_company_research", partial(
+            search_company_info_node, template_service=template_service,
+            branch="job_description", model_name="gpt-4.1-mini", company_search=company_search,
+            company_researcher=company_researcher, agent_pool=agent_pool,
+        )),
+        job_profiles=job_profiles,
+    ))
+    workflow.add_conditional_edges(START, _dispatch_jobs, ["prepare_job"])
+
+    #### ANALYSIS PATH, ONE BRANCH PER PAIR ###
+    workflow.add_node("collect_jobs", lambda state: {})
+    workflow.add_edge(["resume_company_research", "prepare_job"], "collect_jobs")
+    workflow.add_node("analyze_pair", partial(
+        analyze_job_pair_node,
+        analysis_app=build_job_pair_analysis_graph(parallel, llm_extractor, ai_provider, template_service, node_cache),
+    ))
+    workflow.add_conditional_edges("collect_jobs", _dispatch_pairs, ["analyze_pair"])
+    workflow.add_edge("analyze_pair", END)
+
+    return workflow.compile(checkpointer=checkpointer)
+
+def _dispatch_jobs(state: MultiJobState) -> List[Send]:
+    """Start one branch per job description."""
+    return [Send("prepare_job", {"job_description_path": path}) for path in state["job_description_paths"]]
+
+def _dispatch_pairs(state: MultiJobState) -> List[Send]:
+    """Start one analysis per prepared job description, sharing the resume-side state."""
+    return [
+        Send("analyze_pair", {
+            "resume_path": state["resume_path"],
+            "job_description_path": path,
+            "resume": state["resume"],
+            "resume_company_info": state.get("resume_company_info"),
+            "job_description": state["job_profiles"][path].job_description,
+            "job_description_company_info": state["job_profiles"][path].company_info,
+            "job_profile": state["job_profiles"][path],
+        })
+        for path in state["job_description_paths"]
+        if path in state.get("job_profiles", {})
+    ]
+
+async def run_resumable(app, state: AgentState, thread_id: str) -> AgentState:
+    """
+    Run a checkpointed graph, resuming from the last finished step if the run was interrupted.
+
+    Nodes that completed before a crash or a provider outage are not run again.
+    A run that already finished returns its saved final state.
+
+    :param app: Graph compiled with a checkpointer
+    :param state: Initial state, used when the run has not started yet
+    :type state: AgentState
+    :param thread_id: Identifier of the run in the checkpoint store
+    :type thread_id: str
+    :return: Final graph state
+    :rtype: AgentState
+    """
+    config = {"configurable": {"thread_id": thread_id}}
+    snapshot = await app.aget_state(config)
+    if snapshot.next:
+        logger.info(f"Resuming run {thread_id} at {', '.join(snapshot.next)}")
+        return await app.ainvoke(None, config)
+    if snapshot.values:
+        logger.info(f"Run {thread_id} already finished")
+        return snapshot.values
+    return await app.ainvoke(state, config)
+
 if __name__ == "__main__":
     import asyncio
+    import hashlib
+    import sys
+    from src.infrastructure.checkpointing.sqlite_checkpointer import sqlite_checkpointer
     
     logger.info("Building graph...")
     from dotenv import load_dotenv
@@ -73,9 +360,20 @@ if __name__ == "__main__":
         "resume_path": resume_path,
         "job_description_path": job_description_path
     }
-    app = build_resume_analysis_graph()
 
-    print("\n--- LangGraph ASCII Diagram ---")
-    print(app.get_graph().draw_ascii())
+    async def main():
+        async with sqlite_checkpointer() as checkpointer:
+            app = build_resume_analysis_graph(parallel="--parallel" in sys.argv,
+                                              llm_extractor=components.create_llm_extractor(ai_provider, template_service),
+                                              ai_provider=ai_provider,
+                                              template_service=template_service,
+                                              checkpointer=checkpointer)
+
+            print("\n--- LangGraph ASCII Diagram ---")
+            print(app.get_graph().draw_ascii())
+
+            # Rerunning with the same inputs resumes an interrupted run
+            thread_id = hashlib.sha256(f"{resume_path}|{job_description_path}".encode()).hexdigest()[:16]
+            await run_resumable(app, agent_state, thread_id)
 
-    asyncio.run(app.ainvoke(agent_state))
\ No newline at end of file
+    asyncio.run(main())
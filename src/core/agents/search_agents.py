@@ -1,30 +1,105 @@
 import asyncio
+import time
+import weakref
+from contextlib import aclosing
 from langgraph.prebuilt import create_react_agent
 from langchain_community.tools.tavily_search import TavilySearchResults
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import LLMResult
+from langchain_core.rate_limiters import BaseRateLimiter, InMemoryRateLimiter
+from langchain_core.tools import BaseTool
 from langchain_openai import ChatOpenAI
 
 from pydantic import BaseModel, Field
-from typing import Type, Optional, Dict, Any, List, Literal
+from typing import Type, Optional, Dict, Any, List, Literal, Tuple
 import logging
 
+from src.core.ports.secondary.company_directory import CompanyDirectory
 from src.core.ports.secondary.template_service import TemplateService
 from src.core.agents.utils.state import AgentState
-from src.core.domain.company_search import CompanyInfo
+from src.core.agents.utils.search_compaction import SearchResultCompactor
+from src.core.domain.company_search import CompanyInfo, PartialCompanyInfo
+from src.core.domain.config import CompanyResearchConfig
+from src.core.domain.schemas import get_model_schema
 
 logger = logging.getLogger("core.agents.search_agents")
 
-def get_search_tool(max_results=3, time_range="month"):
+class RateLimitedTavilySearchResults(TavilySearchResults):
+    """
+    Tavily search tool that waits for its rate limiter before every search and
+    compacts the results before they are returned to the model.
+    """
+    rate_limiter: Optional[BaseRateLimiter] = None
+    compactor: Optional[SearchResultCompactor] = None
+
+    def _run(self, query: str, run_manager=None):
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        return self._compact(query, *super()._run(query, run_manager=run_manager))
+
+    async def _arun(self, query: str, run_manager=None):
+        if self.rate_limiter:
+            await self.rate_limiter.aacquire()
+        return self._compact(query, *await super()._arun(query, run_manager=run_manager))
+
+    def _compact(self, query: str, results, raw_results):
+        # Errors come back as a string; the raw results stay complete in the artifact
+        if self.compactor and isinstance(results, list):
+            results = self.compactor.compact(results, query)
+        return results, raw_results
+
+
+class CompanyDirectorySearchInput(BaseModel):
+    """Input for the local company directory search."""
+    query: str = Field(description="search query to look up")
+
+
+class CompanyDirectorySearchTool(BaseTool):
+    """
+    Search tool over the local company directory, a drop-in for the Tavily tool.
+
+    It takes the same input and returns results in the same format, so the
+    agent can use either, but answers in milliseconds and without network.
+    """
+    name: str = "local_company_search"
+    description: str = (
+        "A directory of known companies. Fast and works offline. "
+        "Search it first; input should be a search query such as a company name."
+    )
+    args_schema: Type[BaseModel] = CompanyDirectorySearchInput
+    response_format: Literal["content", "content_and_artifact"] = "content_and_artifact"
+    directory: Any
+    max_results: int = 3
+
+    def _run(self, query: str, run_manager=None):
+        results = self.directory.search(query, max_results=self.max_results)
+        if not results:
+            return "No companies found in the local directory.", {"query": query, "results": []}
+        return results, {"query": query, "results": results}
+
+    async def _arun(self, query: str, run_manager=None):
+        # Index lookups take about a millisecond, not worth a thread hop
+        return self._run(query)
+
+
+def get_search_tool(max_results=3, time_range="month", rate_limiter: Optional[BaseRateLimiter] = None,
+                    compactor: Optional[SearchResultCompactor] = None):
     """
     Create a Tavily search tool optimized for recent and accurate company information.
     
     Args:
         max_results: Maximum number of search results to return
         time_range: Time range for search results (day, week, month, year)
+        rate_limiter: Limiter shared by all searches against the Tavily API
+        compactor: Compaction applied to the results before the model sees them
         
     Returns:
         Configured TavilySearchResults tool
     """
-    return TavilySearchResults(
+    return RateLimitedTavilySearchResults(
+        rate_limiter=rate_limiter,
+        compactor=compactor,
         max_results=max_results,
         include_answer=True,
         include_raw_content=False,  # Keep this False to reduce token usage
@@ -34,66 +109,321 @@ def get_search_tool(max_results=3, time_range="month"):
 
 def create_company_search_agent(response_format: Type[BaseModel], 
                                 template_service: TemplateService,
-                                model_name="gpt-3.5-turbo"):
+                                model_name="gpt-3.5-turbo",
+                                llm_rate_limiter: Optional[BaseRateLimiter] = None,
+                                search_rate_limiter: Optional[BaseRateLimiter] = None,
+                                directory: Optional[CompanyDirectory] = None,
+                                web_search: bool = True,
+                                compactor: Optional[SearchResultCompactor] = None):
     """
     Create a company information search agent that prioritizes web searches.
     
     Args:
         response_format: Pydantic model defining the structured output format
         model_name: Name of the OpenAI model to use
+        llm_rate_limiter: Limiter shared by all calls to the model
+        search_rate_limiter: Limiter shared by all calls to the search tool
+        directory: Local company directory the agent searches before the web
+        web_search: Give the agent the web search tool
+        compactor: Compaction applied to web search results before the model sees them
     
     Returns:
         A LangGraph agent that can search for company information
     """
-    search_tool = get_search_tool()
+    tools = []
+    if directory is not None:
+        tools.append(CompanyDirectorySearchTool(directory=directory))
+    if web_search:
+        tools.append(get_search_tool(rate_limiter=search_rate_limiter, compactor=compactor))
+    if not tools:
+        raise ValueError("The company search agent needs web search or a local company directory")
     
     model = ChatOpenAI(
         model=model_name, 
         temperature=0.2,
+        rate_limiter=llm_rate_limiter,
     )
     
     system_prompt = template_service.render_prompt(
-        "prompts/company_search/system_prompt.j2"
+        "prompts/company_search/system_prompt.j2",
+        local_directory=directory is not None,
+        web_search=web_search,
     )
                         
     agent = create_react_agent(
         model=model,
-        tools=[search_tool],
+        tools=tools,
         response_format=response_format,
         prompt=system_prompt,
     )
 
     return agent
 
+def create_partial_result_extractor(response_format: Type[BaseModel],
+                                    model_name="gpt-3.5-turbo",
+                                    llm_rate_limiter: Optional[BaseRateLimiter] = None):
+    """
+    Create the model call extracting a partial result from the searches of an interrupted agent run.
+
+    Args:
+        response_format: Pydantic model defining the structured output format
+        model_name: Name of the OpenAI model to use
+        llm_rate_limiter: Limiter shared by all calls to the model
+
+    Returns:
+        Runnable returning an instance of response_format
+    """
+    model = ChatOpenAI(model=model_name, temperature=0, rate_limiter=llm_rate_limiter)
+    return model.with_structured_output(response_format)
+
+
+class AgentBudget(AsyncCallbackHandler):
+    """
+    Tracks a single agent run against its limits on tool calls, tokens and time.
+
+    Passed to the run as a callback, it counts tool calls as they start and
+    tokens as model calls finish.
+
+    Args:
+        max_tool_calls: Maximum number of tool calls
+        max_tokens: Maximum number of prompt and completion tokens
+        time_budget_seconds: Maximum wall-clock time
+    """
+    def __init__(self, max_tool_calls: int, max_tokens: int, time_budget_seconds: float):
+        self.max_tool_calls = max_tool_calls
+        self.max_tokens = max_tokens
+        self.time_budget_seconds = time_budget_seconds
+        self.tool_calls = 0
+        self.tokens = 0
+        self.started = time.monotonic()
+
+    @classmethod
+    def from_config(cls, config: CompanyResearchConfig) -> "AgentBudget":
+        return cls(config.max_tool_calls, config.max_agent_tokens, config.agent_time_budget_seconds)
+
+    async def on_tool_start(self, serialized: Dict[str, Any], input_str: str, **kwargs: Any) -> None:
+        self.tool_calls += 1
+
+    async def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    self.tokens += usage.get("total_tokens", 0)
+
+    @property
+    def remaining_seconds(self) -> float:
+        return self.time_budget_seconds - (time.monotonic() - self.started)
+
+    def exhausted(self, pending_tool_calls: int = 0) -> Optional[str]:
+        """
+        Check whether the run has to stop.
+
+        Args:
+            pending_tool_calls: Tool calls the model has just requested
+
+        Returns:
+            The limit that was reached, or None if the run may continue
+        """
+        if self.tool_calls + pending_tool_calls > self.max_tool_calls:
+            return f"{self.max_tool_calls} tool calls"
+        if self.tokens >= self.max_tokens:
+            return f"{self.max_tokens} tokens"
+        if self.remaining_seconds <= 0:
+            return f"{self.time_budget_seconds}s"
+        return None
+
+
+class CompanySearchAgentPool:
+    """
+    Builds each company search agent once and shares it between searches.
+
+    A compiled agent holds no per-run state, so one instance per model and
+    response format serves any number of concurrent searches. Reusing it also
+    reuses its model client and therefore its open connections to the model
+    endpoint. Agents are rebuilt when the system prompt template changes.
+    All agents of a pool share one rate limiter per backend.
+
+    Args:
+        template_service: Template service for the system prompt
+        config: Request rates of the model and the search tool, and whether to search the web
+        directory: Local company directory tried before the agent and given to it as a tool
+    """
+    def __init__(self, template_service: TemplateService, config: Optional[CompanyResearchConfig] = None,
+                 directory: Optional[CompanyDirectory] = None):
+        self._template_service = template_service
+        config = config or CompanyResearchConfig()
+        self.config = config
+        self.directory = directory
+        self.web_search = config.web_search
+        self.llm_rate_limiter = InMemoryRateLimiter(requests_per_second=config.llm_requests_per_second)
+        self.search_rate_limiter = InMemoryRateLimiter(requests_per_second=config.search_requests_per_second)
+        self.compactor = SearchResultCompactor(config.max_result_tokens) if config.compact_search_results else None
+        self._agents: Dict[Tuple[str, Type[BaseModel]], Tuple[str, Any]] = {}
+        self._extractors: Dict[Tuple[str, Type[BaseModel]], Any] = {}
+
+    def get(self, response_format: Type[BaseModel] = CompanyInfo, model_name: str = "gpt-3.5-turbo"):
+        """
+        Get the agent for a model and response format, building it on first use.
+
+        Args:
+            response_format: Pydantic model defining the structured output format
+            model_name: Name of the OpenAI model to use
+
+        Returns:
+            A LangGraph agent that can search for company information
+        """
+        key = (model_name, response_format)
+        fingerprint = self._template_service.get_template_fingerprint("prompts/company_search/system_prompt.j2")
+        cached = self._agents.get(key)
+        if cached is None or cached[0] != fingerprint:
+            logger.info(f"Building company search agent for {model_name}")
+            cached = (fingerprint, create_company_search_agent(
+                response_format, self._template_service, model_name,
+                llm_rate_limiter=self.llm_rate_limiter, search_rate_limiter=self.search_rate_limiter,
+                directory=self.directory, web_search=self.web_search, compactor=self.compactor,
+            ))
+            self._agents[key] = cached
+        return cached[1]
+
+    def get_partial_result_extractor(self, response_format: Type[BaseModel] = CompanyInfo,
+                                     model_name: str = "gpt-3.5-turbo"):
+        """
+        Get the extractor used when an agent run exceeds its budget, building it on first use.
+
+        Args:
+            response_format: Pydantic model defining the structured output format
+            model_name: Name of the OpenAI model to use
+
+        Returns:
+            Runnable returning an instance of response_format
+        """
+        key = (model_name, response_format)
+        if key not in self._extractors:
+            self._extractors[key] = create_partial_result_extractor(
+                response_format, model_name, llm_rate_limiter=self.llm_rate_limiter
+            )
+        return self._extractors[key]
+
+    def clear(self) -> None:
+        """Drop all agents, e.g. after changing API credentials."""
+        self._agents.clear()
+        self._extractors.clear()
+
+
+_agent_pools: "weakref.WeakKeyDictionary[TemplateService, CompanySearchAgentPool]" = weakref.WeakKeyDictionary()
+
+
+def get_agent_pool(template_service: TemplateService,
+                   config: Optional[CompanyResearchConfig] = None,
+                   directory: Optional[CompanyDirectory] = None) -> CompanySearchAgentPool:
+    """
+    Get the shared agent pool for a template service.
+
+    Args:
+        template_service: Template service for the system prompt
+        config: Configuration used if the pool does not exist yet
+        directory: Local company directory used if the pool does not exist yet
+
+    Returns:
+        Agent pool, created on first use and kept while the template service exists
+    """
+    pool = _agent_pools.get(template_service)
+    if pool is None:
+        pool = CompanySearchAgentPool(template_service, config, directory)
+        _agent_pools[template_service] = pool
+    return pool
+
+
 async def search_company_info(company_name: str, 
                         template_service: TemplateService, 
-                        model_name="gpt-3.5-turbo") -> Optional[CompanyInfo]:
+                        model_name="gpt-3.5-turbo",
+                        agent_pool: Optional[CompanySearchAgentPool] = None) -> Optional[CompanyInfo]:
     """
     Search for up-to-date information about a company and return structured data.
+
+    The agent comes from agent_pool, by default the pool shared by all searches
+    using the same template service. A company found by name in the pool's
+    local directory is returned without running the agent.
+
+    The agent run is limited by the pool's tool call, token and time budget.
+    When the budget runs out, the fields found so far are returned instead, as
+    a PartialCompanyInfo so that callers do not take them for a complete result.
+
+    Returns None if the agent found nothing. Errors, e.g. rate limit errors, are
+    raised so the caller can decide whether to retry; see CompanyResearcher.
     """
+    agent_pool = agent_pool or get_agent_pool(template_service)
+    if agent_pool.directory is not None:
+        company_info = agent_pool.directory.lookup(company_name)
+        if company_info is not None:
+            logger.info(f"Found {company_name} in the local company directory")
+            return company_info
+
     logger.info(f"Collecting more details on {company_name}")
-    # TODO: Retry on OpenAI rate limit errors
     search_query = template_service.render_prompt(
         "prompts/company_search/search_query.j2",
-        **{"company_name": company_name, "search_result_format": CompanyInfo.model_json_schema()}
+        **{"company_name": company_name, "search_result_format": get_model_schema(CompanyInfo)}
     )
     
+    agent = agent_pool.get(CompanyInfo, model_name)
+    budget = AgentBudget.from_config(agent_pool.config)
+    # Backstop for tool calls the budget check cannot see, e.g. several in one step
+    config = {"callbacks": [budget], "recursion_limit": 2 * budget.max_tool_calls + 3}
+    state: Dict[str, Any] = {}
+    exhausted = None
     try:
-        agent = create_company_search_agent(CompanyInfo, template_service, model_name)
-        response = await agent.ainvoke(
-            {"messages": [{"role": "user", "content": search_query}]}
-        )
-        
-        if "structured_response" in response:
-            result = response["structured_response"]
-            return CompanyInfo.model_validate(result)
-        else:
-            print("No structured response found in agent output")
-            return None
-    except Exception as e:
-        print(f"Error searching for company info: {str(e)}")
+        async with asyncio.timeout(budget.time_budget_seconds):
+            stream = agent.astream({"messages": [{"role": "user", "content": search_query}]},
+                                   config=config, stream_mode="values")
+            async with aclosing(stream):
+                async for state in stream:
+                    last_message = state["messages"][-1] if state.get("messages") else None
+                    pending = len(last_message.tool_calls) if isinstance(last_message, AIMessage) else 0
+                    exhausted = budget.exhausted(pending) if "structured_response" not in state else None
+                    if exhausted:
+                        break
+    except TimeoutError:
+        exhausted = f"{budget.time_budget_seconds}s"
+
+    if "structured_response" in state:
+        return CompanyInfo.model_validate(state["structured_response"])
+    if exhausted:
+        logger.warning(f"Research on {company_name} ran out of its budget of {exhausted}, "
+                       f"returning what was found after {budget.tool_calls} tool calls")
+        return await _extract_partial_result(company_name, state.get("messages", []), template_service, agent_pool,
+                                             model_name)
+    logger.warning(f"No structured response found in agent output for {company_name}")
+    return None
+
+
+async def _extract_partial_result(company_name: str, messages: List[Any], template_service: TemplateService,
+                                  agent_pool: CompanySearchAgentPool, model_name: str) -> Optional[PartialCompanyInfo]:
+    """
+    Extract the company information found by an agent run that was stopped early.
+
+    Only the tool results are used, since the conversation may end in tool
+    calls without results, which the model API rejects.
+    """
+    search_results = [str(message.content) for message in messages if isinstance(message, ToolMessage)]
+    if not search_results:
         return None
 
+    prompt = template_service.render_prompt(
+        "prompts/company_search/partial_result.j2",
+        company_name=company_name,
+        search_result_format=get_model_schema(CompanyInfo),
+        search_results=search_results,
+    )
+    extractor = agent_pool.get_partial_result_extractor(CompanyInfo, model_name)
+    try:
+        result = await asyncio.wait_for(extractor.ainvoke([HumanMessage(content=prompt)]),
+                                        timeout=agent_pool.config.partial_result_timeout_seconds)
+    except TimeoutError:
+        logger.warning(f"Extracting the partial result on {company_name} timed out")
+        return None
+    return PartialCompanyInfo.model_validate(result.model_dump() if isinstance(result, BaseModel) else result)
+
 
 
 
@@ -111,14 +441,15 @@ if __name__ == "__main__":
                      "NVIDIA", "Tesla", "Amazon", "Meta"]
         concurrency_limit = 5
         
-        tasks = [search_company_info(company_name=name, template_service=template_service, 
-                                     model_name="gpt-4.1-mini") for name in companies]
-        results = await asyncio.gather(*tasks)
-        
-        company_info_map = {info.name: info for info in results if info}
+        from functools import partial
+        from src.core.agents.company_research import CompanyResearcher
+        researcher = CompanyResearcher(CompanyResearchConfig(max_concurrency=concurrency_limit))
+        outcomes = await researcher.research(companies, partial(
+            search_company_info, template_service=template_service, model_name="gpt-4.1-mini"
+        ))
 
         for company_name in companies:
-            company_info = company_info_map.get(company_name)
+            company_info = outcomes[company_name].company_info
             if company_info:
                 print("\nCompany Information:")
                 print(f"  Name: {company_info.name}")
@@ -130,6 +461,6 @@ if __name__ == "__main__":
                 print(f"  Founded: {company_info.founded_year or 'Unknown'}")
                 print(f"  Description: {company_info.description}")
             else:
-                print(f"\nCould not retrieve company information for {company_name}.")
+                print(f"\nCould not retrieve company information for {company_name} ({outcomes[company_name].status}).")
 
     asyncio.run(main())
\ No newline at end of file
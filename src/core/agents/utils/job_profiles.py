@@ -0,0 +1,119 @@
+'''
+Building and storing job profiles so the job side of the pipeline runs once per posting.
+'''
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from src.core.agents.experience_analyzer import format_job_details_for_prompt
+from src.core.domain.company_search import CompanyInfo
+from src.core.domain.job_description import JobDescription
+from src.core.domain.job_profile import JobProfile, normalize_skill
+
+logger = logging.getLogger("core.agents.job_profiles")
+
+
+async def build_job_profile(job_description: JobDescription,
+                            company_info: Optional[Dict[str, CompanyInfo]] = None) -> JobProfile:
+    '''
+    Precompute everything derived from a job description.
+
+    :param job_description: Parsed job description
+    :type job_description: JobDescription
+    :param company_info: Research results for the hiring company
+    :type company_info: Optional[Dict[str, CompanyInfo]]
+    :return: Job profile
+    :rtype: JobProfile
+    '''
+    return JobProfile(
+        job_description=job_description,
+        company_info=company_info,
+        prompt_fragments=await format_job_details_for_prompt(job_description),
+        required_skills=frozenset(
+            normalize_skill(tech.tech_type) for tech in job_description.tech_stack if tech.priority == "required"
+        ),
+        nice_to_have_skills=frozenset(
+            normalize_skill(tech.tech_type) for tech in job_description.tech_stack if tech.priority == "nice_to_have"
+        ),
+    )
+
+
+def job_key(content: Union[Path, bytes, str]) -> str:
+    '''
+    Identify a job description by its content, so an edited posting is profiled
+    again while the same posting under another path is not.
+
+    :param content: Path of the job description file, or its raw bytes or text
+    :type content: Union[Path, bytes, str]
+    :return: SHA-256 hex digest of the content
+    :rtype: str
+    '''
+    if isinstance(content, bytes):
+        data = content
+    else:
+        try:
+            is_file = Path(content).is_file()
+        except (OSError, ValueError):
+            # Raw text too long or invalid as a file name
+            is_file = False
+        data = Path(content).read_bytes() if is_file else str(content).encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+class JobProfileStore:
+    '''
+    Stores job profiles by job id, e.g. the content key from :func:`job_key`.
+
+    Profiles are kept in memory and, when a directory is given, also written
+    to disk as JSON so they survive restarts and can be shared between workers.
+
+    :param directory: Directory for persisted profiles
+    :type directory: Optional[Path]
+    '''
+    def __init__(self, directory: Optional[Path] = None):
+        self._directory = directory
+        self._profiles: Dict[str, JobProfile] = {}
+        if directory:
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, job_id: str) -> Optional[JobProfile]:
+        '''
+        Get the profile of a job.
+
+        :param job_id: Job identifier
+        :type job_id: str
+        :return: Stored profile, or None if the job has not been profiled
+        :rtype: Optional[JobProfile]
+        '''
+        profile = self._profiles.get(job_id)
+        if profile is None and self._directory:
+            path = self._path(job_id)
+            if path.exists():
+                try:
+                    profile = JobProfile.model_validate_json(path.read_text())
+                    self._profiles[job_id] = profile
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable job profile {path}: {str(e)}")
+        return profile
+
+    def put(self, job_id: str, profile: JobProfile) -> None:
+        '''
+        Store the profile of a job.
+
+        :param job_id: Job identifier
+        :type job_id: str
+        :param profile: Job profile
+        :type profile: JobProfile
+        '''
+        self._profiles[job_id] = profile
+        if self._directory:
+            path = self._path(job_id)
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(profile.model_dump_json())
+            tmp_path.replace(path)
+
+    def _path(self, job_id: str) -> Path:
+        return self._directory / f"{hashlib.sha256(job_id.encode()).hexdigest()}.json"
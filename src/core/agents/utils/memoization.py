@@ -0,0 +1,219 @@
+'''
+Memoisation of graph nodes keyed on the slice of AgentState they read.
+'''
+
+import copy
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+from pydantic_core import to_json
+
+from src.core.agents.utils.state import AgentState
+from src.core.ports.secondary.template_service import TemplateService
+
+logger = logging.getLogger("core.agents.memoization")
+
+Node = Callable[[AgentState], Awaitable[Dict[str, Any]]]
+
+
+def output_complete(output: Dict[str, Any]) -> bool:
+    '''
+    Default cacheability rule: nodes report failures with None values.
+
+    :param output: Node output
+    :type output: Dict[str, Any]
+    :return: True if the output may be cached
+    :rtype: bool
+    '''
+    return bool(output) and all(value is not None for value in output.values())
+
+
+def research_settled(output: Dict[str, Any]) -> bool:
+    '''
+    Cacheability rule of the company research nodes.
+
+    Research that failed or timed out, e.g. on a rate limit, or that ran out of
+    its budget with partial results, reports an outcome rather than None and
+    has to be retried on the next run.
+
+    :param output: Node output
+    :type output: Dict[str, Any]
+    :return: True if every company was either found or is known not to be findable
+    :rtype: bool
+    '''
+    outcomes = output.get("company_research_outcomes") or {}
+    return output_complete(output) and all(
+        outcome.status in ("found", "not_found") for outcome in outcomes.values()
+    )
+
+
+@dataclass(frozen=True)
+class NodeInputs:
+    '''
+    Declares what a node's output depends on.
+
+    :ivar state_keys: AgentState keys the node reads
+    :ivar templates: Templates the node renders; their fingerprints are part of the key
+    :ivar file_keys: State keys holding file paths; the file's size and modification time are part of the key
+    :ivar cacheable: Decides whether an output may be cached
+    '''
+    state_keys: Sequence[str]
+    templates: Sequence[str] = ()
+    file_keys: Sequence[str] = ()
+    cacheable: Callable[[Dict[str, Any]], bool] = output_complete
+
+
+# Inputs of the nodes in the resume analysis graph
+NODE_INPUTS: Dict[str, NodeInputs] = {
+    "parse_resume": NodeInputs(
+        state_keys=("resume_path",),
+        templates=("prompts/parsing/resume_extractor.j2",),
+        file_keys=("resume_path",),
+    ),
+    "parse_job_description": NodeInputs(
+        state_keys=("job_description_path",),
+        templates=("prompts/parsing/job_description_extractor.j2",),
+        file_keys=("job_description_path",),
+    ),
+    "resume_company_research": NodeInputs(
+        state_keys=("resume",),
+        templates=("prompts/company_search/system_prompt.j2", "prompts/company_search/search_query.j2",
+                   "prompts/company_search/partial_result.j2"),
+        cacheable=research_settled,
+    ),
+    "job_company_research": NodeInputs(
+        state_keys=("job_description",),
+        templates=("prompts/company_search/system_prompt.j2", "prompts/company_search/search_query.j2",
+                   "prompts/company_search/partial_result.j2"),
+        cacheable=research_settled,
+    ),
+    "experience_analyzer": NodeInputs(
+        state_keys=("resume", "job_description", "company_alignment_feedback"),
+        templates=("prompts/agents/experience_analyzer.j2",),
+    ),
+    "company_alignment_analyzer": NodeInputs(
+        state_keys=("resume_company_info", "job_description_company_info"),
+        templates=("prompts/agents/company_alignment_analyzer.j2",),
+    ),
+}
+
+
+class NodeCache:
+    '''
+    In-memory LRU store of node outputs shared across graph runs.
+
+    :param max_entries: Maximum number of cached outputs
+    :type max_entries: int
+    '''
+    def __init__(self, max_entries: int = 256):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        '''
+        Get a copy of a cached output.
+
+        :param key: Cache key
+        :type key: str
+        :return: Cached node output, or None on a miss
+        :rtype: Optional[Dict[str, Any]]
+        '''
+        output = self._entries.get(key)
+        if output is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return copy.deepcopy(output)
+
+    def set(self, key: str, output: Dict[str, Any]) -> None:
+        '''
+        Store a copy of a node output, evicting the least recently used entry if full.
+
+        :param key: Cache key
+        :type key: str
+        :param output: Node output
+        :type output: Dict[str, Any]
+        '''
+        self._entries[key] = copy.deepcopy(output)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        '''Remove all cached outputs.'''
+        self._entries.clear()
+
+
+def node_cache_key(node_name: str, state: AgentState, inputs: NodeInputs,
+                   template_service: Optional[TemplateService] = None) -> str:
+    '''
+    Hash the state slice a node reads together with the fingerprints of its templates.
+
+    :param node_name: Name of the node in the graph
+    :type node_name: str
+    :param state: Current graph state
+    :type state: AgentState
+    :param inputs: Declaration of the node's inputs
+    :type inputs: NodeInputs
+    :param template_service: Template service providing template fingerprints
+    :type template_service: Optional[TemplateService]
+    :return: Hex digest identifying the node's inputs
+    :rtype: str
+    '''
+    digest = hashlib.sha256(node_name.encode())
+    digest.update(to_json({key: state.get(key) for key in inputs.state_keys}, fallback=repr))
+    for key in inputs.file_keys:
+        path = state.get(key)
+        if path and os.path.exists(path):
+            stat = os.stat(path)
+            digest.update(f"{key}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    if template_service:
+        for template_name in inputs.templates:
+            digest.update(template_service.get_template_fingerprint(template_name).encode())
+    return digest.hexdigest()
+
+
+def memoize_node(node: Node, node_name: str, cache: NodeCache,
+                 inputs: Optional[NodeInputs] = None,
+                 template_service: Optional[TemplateService] = None) -> Node:
+    '''
+    Wrap a node so that it returns the cached output when its inputs are unchanged.
+
+    Only outputs accepted by the node's ``cacheable`` rule are cached; by default
+    those without None values, since nodes report failures that way.
+
+    :param node: Node to wrap
+    :type node: Node
+    :param node_name: Name of the node in the graph
+    :type node_name: str
+    :param cache: Store for the node outputs
+    :type cache: NodeCache
+    :param inputs: Declaration of the node's inputs, defaults to the entry in NODE_INPUTS
+    :type inputs: Optional[NodeInputs]
+    :param template_service: Template service providing template fingerprints
+    :type template_service: Optional[TemplateService]
+    :return: Memoised node
+    :rtype: Node
+    '''
+    inputs = inputs or NODE_INPUTS[node_name]
+
+    async def memoized(state: AgentState) -> Dict[str, Any]:
+        key = node_cache_key(node_name, state, inputs, template_service)
+        output = cache.get(key)
+        if output is not None:
+            logger.info(f"Reusing cached output of {node_name}")
+            return output
+
+        output = await node(state)
+        if inputs.cacheable(output):
+            cache.set(key, output)
+        return output
+
+    return memoized
@@ -1,5 +1,5 @@
-import asyncio
-from typing import Dict, Optional, Literal, List
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Optional, Literal, List, Sequence
 from langsmith import traceable
 import logging
 
@@ -7,10 +7,14 @@ from src.core.agents.utils.state import AgentState
 from src.core.domain.resume import Resume
 from src.core.domain.job_description import JobDescription
 from src.core.domain.company_search import CompanyInfo
-from src.infrastructure.components import llm_extractor
+from src.core.domain.company_names import CompanyNameIndex
 from src.core.ports.secondary.llm_extractor import LLMExtractor
 from src.core.ports.secondary.template_service import TemplateService
-from src.core.agents.search_agents import search_company_info
+from src.core.agents.search_agents import CompanySearchAgentPool, search_company_info
+from src.core.agents.company_info_lookup import CachedCompanySearch
+from src.core.agents.company_research import CompanyResearcher
+from src.core.agents.utils.job_profiles import JobProfileStore, build_job_profile, job_key
+from src.core.agents.utils.memoization import research_settled
 
 logger = logging.getLogger("core.agents.nodes")
 
@@ -38,19 +42,116 @@ async def parse_job_description_node(state: AgentState, extractor: LLMExtractor)
 async def search_company_info_node(state: AgentState, 
                                    template_service: TemplateService, 
                                    branch: Literal["resume", "job_desription"] = "job_description",
-                                   model_name="gpt-4.1-mini") -> Dict[str, Optional[CompanyInfo]]:
+                                   model_name="gpt-4.1-mini",
+                                   company_search: Optional[CachedCompanySearch] = None,
+                                   company_researcher: Optional[CompanyResearcher] = None,
+                                   agent_pool: Optional[CompanySearchAgentPool] = None) -> Dict[str, Any]:
     if branch == "resume":
         companies = state["resume"].company_names
     elif branch == "job_description":
         companies = [state["job_description"].company_name]
     else:
         raise ValueError("This branch is not supported.")
+
+    # Research each distinct company once, e.g. for several roles at the same employer
+    name_index = company_search.name_index if company_search else CompanyNameIndex()
+    companies = list(name_index.deduplicate(companies).values())
     
-    tasks = [search_company_info(company_name=company_name, 
-                                 model_name=model_name, 
-                                 template_service=template_service) for company_name in companies]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    results = {result.name: result for result in results if isinstance(result, CompanyInfo)}
+    if company_search:
+        search = partial(company_search.search, agent_pool=agent_pool)
+    else:
+        search = partial(search_company_info, model_name=model_name, template_service=template_service,
+                         agent_pool=agent_pool)
+    outcomes = await (company_researcher or CompanyResearcher()).research(companies, search)
+    results = {outcome.company_info.name: outcome.company_info for outcome in outcomes.values() if outcome.company_info}
+    unresolved = [f"{name} ({outcome.status})" for name, outcome in outcomes.items() if outcome.status != "found"]
     logger.info(f"Retrieved information for branch {branch} with length {len(results)} companies.")
+    if unresolved:
+        logger.warning(f"No information for branch {branch} on: {', '.join(unresolved)}")
+
+    return {f"{branch}_company_info": results, "company_research_outcomes": outcomes}
+
+
+# State keys written by the analysis nodes that run in parallel mode
+ANALYSIS_RESULT_KEYS = ("experience_alignment", "company_alignment")
+
+
+async def merge_analysis_node(state: AgentState,
+                              result_keys: Sequence[str] = ANALYSIS_RESULT_KEYS) -> Dict[str, List[str]]:
+    """
+    Join point for analysis nodes that run in parallel.
+
+    Does no LLM work. Each analyzer writes its own state key, so the only thing
+    left to do is to record which analyses produced no result.
+
+    :param state: The current state of the agent graph
+    :type state: AgentState
+    :param result_keys: State keys the analysis nodes are expected to populate
+    :type result_keys: Sequence[str]
+    :return: Update appending an error message per missing analysis result
+    :rtype: Dict[str, List[str]]
+    """
+    missing = [key for key in result_keys if state.get(key) is None]
+    if not missing:
+        logger.info("All analyses completed.")
+        return {}
+
+    logger.warning(f"Analyses without a result: {', '.join(missing)}")
+    error_messages = list(state.get("error_messages") or [])
+    error_messages.extend(f"No result for {key}" for key in missing)
+    return {"error_messages": error_messages}
+
+
+# State keys of a pair analysis reported back to a multi-job run
+JOB_ANALYSIS_KEYS = ANALYSIS_RESULT_KEYS + ("company_alignment_feedback", "error_messages")
+
+
+async def prepare_job_node(state: AgentState,
+                           parse_node: Callable[[AgentState], Awaitable[Dict[str, Any]]],
+                           research_node: Callable[[AgentState], Awaitable[Dict[str, Any]]],
+                           job_profiles: Optional[JobProfileStore] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the profile of a single job description of a multi-job run.
+
+    Jobs already in the profile store are neither parsed nor researched again.
+    The store is keyed on the content of the job description, and profiles are
+    only stored once the company research has settled, so failed research is
+    retried on the next run.
+
+    :param state: State holding the ``job_description_path`` to prepare
+    :type state: AgentState
+    :param parse_node: Node parsing the job description
+    :param research_node: Node researching the job description's company
+    :param job_profiles: Store of profiles reused across runs
+    :type job_profiles: Optional[JobProfileStore]
+    :return: Update with the job profile keyed by the job description path
+    :rtype: Dict[str, Dict[str, Any]]
+    """
+    path = state["job_description_path"]
+    key = job_key(path) if job_profiles else None
+    profile = job_profiles.get(key) if job_profiles else None
+    outcomes = {}
+    if profile is None:
+        parsed = await parse_node(state)
+        research = await research_node({**state, **parsed})
+        outcomes = research.get("company_research_outcomes") or {}
+        profile = await build_job_profile(parsed["job_description"], research["job_description_company_info"])
+        if job_profiles and research_settled(research):
+            job_profiles.put(key, profile)
+    else:
+        logger.info(f"Reusing job profile for {path}")
+    return {"job_profiles": {path: profile}, "company_research_outcomes": outcomes}
+
+
+async def analyze_job_pair_node(state: AgentState, analysis_app) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Run the analysis nodes for one resume and job description pair.
 
-    return {f"{branch}_company_info": results}
\ No newline at end of file
+    :param state: Fully prepared state for the pair
+    :type state: AgentState
+    :param analysis_app: Compiled graph running the analysis nodes
+    :return: Update with the pair's analysis results keyed by the job description path
+    :rtype: Dict[str, Dict[str, Dict[str, Any]]]
+    """
+    result = await analysis_app.ainvoke(state)
+    return {"job_analyses": {state["job_description_path"]: {key: result.get(key) for key in JOB_ANALYSIS_KEYS}}}
\ No newline at end of file
@@ -0,0 +1,198 @@
+'''
+Compaction of web search results before they are added to the agent's context.
+'''
+
+import logging
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger("core.agents.search_compaction")
+
+# Rough size of a token in English text, used when no tokenizer is given
+CHARS_PER_TOKEN = 4
+
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+(?=[\"'(\[A-Z0-9])")
+_WORD_RE = re.compile(r"\w+")
+_NAVIGATION_SEPARATORS_RE = re.compile(r"\s[|»›>·•/]\s")
+
+# Whole phrases of cookie banners, sign-up prompts and page chrome. Sentences
+# answering a CompanyInfo field are kept even if they contain one of these.
+_BOILERPLATE_RE = re.compile(
+    r"\b(we use cookies|this (web)?site uses cookies|(accept|reject|manage) (all )?cookies|"
+    r"cookie (policy|settings|preferences)|privacy policy|terms of (use|service)|all rights reserved|"
+    r"copyright \d{4}|sign (in|up)( now| today| for free)?|log ?in to|"
+    r"(subscribe|sign up) (to|for) (our|the) newsletter|subscribe now|skip to (main )?content|"
+    r"(enable|turn on) javascript|javascript is (disabled|required)|click here|read more|"
+    r"share (on|this)|follow us|advertisement|back to top|accept all)\b|©",
+    re.IGNORECASE,
+)
+
+# Wording that answers one of the CompanyInfo fields
+FIELD_PATTERNS: Dict[str, re.Pattern] = {
+    "size": re.compile(r"\b(employees?|employ(s|ed|ing)|staff|headcount|workforce)\b", re.IGNORECASE),
+    "revenue": re.compile(r"\b(revenues?|sales|turnover|earnings|valuation|valued|billion|million)\b|[$€£]",
+                          re.IGNORECASE),
+    "industry": re.compile(r"\b(industry|sector|provider|manufacturer|developer|maker|platform|"
+                           r"speciali[sz]\w*|products?|services)\b", re.IGNORECASE),
+    "founded_year": re.compile(r"\b(founded|established|incorporated|started|since)\b", re.IGNORECASE),
+    "location": re.compile(r"\b(headquarter(s|ed)?|hq|based in|located|offices? in)\b", re.IGNORECASE),
+}
+
+# Query words that do not identify the company
+_QUERY_STOP_WORDS = frozenset({
+    "the", "and", "for", "with", "about", "company", "companies", "information", "info", "latest", "current",
+    "number", "annual", "year", "how", "many", "what", "when", "where", "who", "inc", "ltd", "llc", "corp",
+    "employees", "employee", "revenue", "industry", "founded", "headquarters", "location", "size",
+})
+
+
+def estimate_tokens(text: str) -> int:
+    '''
+    Estimate the number of tokens in a text from its length.
+
+    :param text: Text to measure
+    :type text: str
+    :return: Estimated number of tokens
+    :rtype: int
+    '''
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+class SearchResultCompactor:
+    '''
+    Shrinks search results to the sentences the company search agent needs.
+
+    Results pointing at the same page are merged, sentences already seen in an
+    earlier result are dropped, and so is boilerplate such as cookie banners and
+    navigation menus, unless it also answers a CompanyInfo field. Of the
+    remaining sentences only those mentioning the company or answering a
+    CompanyInfo field are kept, the most relevant first, up to a token cap per
+    result. Results left without relevant sentences are dropped.
+
+    :param max_tokens_per_result: Maximum number of tokens of content per result
+    :type max_tokens_per_result: int
+    :param count_tokens: Token counter, defaults to an estimate from the number of characters
+    :type count_tokens: Optional[Callable[[str], int]]
+    '''
+    def __init__(self, max_tokens_per_result: int = 200, count_tokens: Optional[Callable[[str], int]] = None):
+        self._max_tokens = max_tokens_per_result
+        self._count_tokens = count_tokens or estimate_tokens
+
+    def compact(self, results: Iterable[Dict[str, Any]], query: str = "") -> List[Dict[str, Any]]:
+        '''
+        Compact the results of one search.
+
+        :param results: Results with ``url`` and ``content`` keys, e.g. from the Tavily tool
+        :type results: Iterable[Dict[str, Any]]
+        :param query: The search query, whose words identify the company
+        :type query: str
+        :return: Compacted results in their original order
+        :rtype: List[Dict[str, Any]]
+        '''
+        results = list(results)
+        query_terms = {
+            word for word in _WORD_RE.findall(query.casefold())
+            if len(word) > 2 and word not in _QUERY_STOP_WORDS
+        }
+        seen_urls: Set[str] = set()
+        seen_sentences: Set[str] = set()
+        compacted = []
+        for result in results:
+            url = _url_key(result.get("url") or "")
+            if url and url in seen_urls:
+                continue
+            seen_urls.add(url)
+
+            sentences = []
+            for sentence in _sentences(result.get("content") or ""):
+                key = " ".join(_WORD_RE.findall(sentence.casefold()))
+                if key and key not in seen_sentences:
+                    seen_sentences.add(key)
+                    sentences.append(sentence)
+
+            content = self._select(sentences, query_terms)
+            if content:
+                compacted.append({
+                    **{name: value for name, value in result.items() if name != "raw_content"},
+                    "content": content,
+                })
+
+        logger.debug(
+            f"Compacted {len(results)} search results for '{query}' to {len(compacted)}, from "
+            f"{sum(len(str(result.get('content') or '')) for result in results)} to "
+            f"{sum(len(result['content']) for result in compacted)} characters"
+        )
+        return compacted
+
+    def _select(self, sentences: List[str], query_terms: Set[str]) -> str:
+        '''
+        Keep the most relevant sentences that fit the token cap, in their original order.
+        '''
+        scored = [
+            (score, position, sentence)
+            for position, sentence in enumerate(sentences)
+            if (score := _relevance(sentence, query_terms)) > 0
+        ]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+
+        selected: List[Tuple[int, str]] = []
+        budget = self._max_tokens
+        for _, position, sentence in scored:
+            tokens = self._count_tokens(sentence)
+            if tokens > budget:
+                if not selected:
+                    # A single relevant sentence longer than the cap is cut rather than lost
+                    selected.append((position, _truncate(sentence, budget, self._count_tokens)))
+                    break
+                continue
+            selected.append((position, sentence))
+            budget -= tokens
+        return " ".join(sentence for _, sentence in sorted(selected))
+
+
+def _url_key(url: str) -> str:
+    '''Identify a page regardless of scheme, "www.", query string and trailing slash.'''
+    parts = urlsplit(url.strip().casefold())
+    host = parts.netloc[4:] if parts.netloc.startswith("www.") else parts.netloc
+    return f"{host}{parts.path.rstrip('/')}"
+
+
+def _sentences(content: str) -> List[str]:
+    '''Split content into sentences, leaving out boilerplate and navigation lines.'''
+    sentences = []
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or len(_NAVIGATION_SEPARATORS_RE.findall(line)) >= 2:
+            continue
+        for sentence in _SENTENCE_END_RE.split(line):
+            sentence = sentence.strip()
+            words = _WORD_RE.findall(sentence)
+            # Menu entries and headings are short and carry no figures
+            if len(words) < 4 and not any(word.isdigit() for word in words):
+                continue
+            if _BOILERPLATE_RE.search(sentence) and not _answers_field(sentence):
+                continue
+            sentences.append(sentence)
+    return sentences
+
+
+def _answers_field(sentence: str) -> bool:
+    '''Check whether a sentence answers one of the CompanyInfo fields.'''
+    return any(pattern.search(sentence) for pattern in FIELD_PATTERNS.values())
+
+
+def _relevance(sentence: str, query_terms: Set[str]) -> int:
+    '''Score a sentence by the CompanyInfo fields it answers and whether it names the company.'''
+    score = 2 * sum(1 for pattern in FIELD_PATTERNS.values() if pattern.search(sentence))
+    if query_terms and query_terms & set(_WORD_RE.findall(sentence.casefold())):
+        score += 1
+    return score
+
+
+def _truncate(sentence: str, max_tokens: int, count_tokens: Callable[[str], int]) -> str:
+    '''Cut a sentence at a word boundary to fit the token cap.'''
+    words = sentence.split()
+    while words and count_tokens(" ".join(words) + " …") > max_tokens:
+        words.pop()
+    return " ".join(words) + " …" if words else ""
@@ -1,8 +1,9 @@
-from typing import List, Optional, TypedDict, Dict
+from typing import Annotated, Any, List, Optional, TypedDict, Dict
 
-from src.core.domain.company_search import CompanyInfo
+from src.core.domain.company_search import CompanyInfo, CompanyResearchOutcome
 from src.core.domain.resume import Resume
 from src.core.domain.job_description import JobDescription
+from src.core.domain.job_profile import JobProfile
 from src.core.domain.resume_match import (
     SkillMatch, 
     ExperienceAlignment, 
@@ -13,6 +14,13 @@ from src.core.domain.resume_match import (
 )
 
 
+def merge_dicts(left: Optional[Dict], right: Optional[Dict]) -> Dict:
+    '''
+    Reducer combining the dictionaries written by concurrent nodes.
+    '''
+    return {**(left or {}), **(right or {})}
+
+
 class AgentState(TypedDict):
     ''' 
     Represents the shared state that flows through the LangGraph.
@@ -28,6 +36,9 @@ class AgentState(TypedDict):
     # Enriched data
     resume_company_info: Optional[Dict[str, CompanyInfo]]
     job_description_company_info: Optional[Dict[str, CompanyInfo]]
+    # Outcome of researching each company, written by both research nodes
+    company_research_outcomes: Annotated[Dict[str, CompanyResearchOutcome], merge_dicts]
+    job_profile: Optional[JobProfile]
     
     # Analysis results (populated by agents)
     experience_alignment: Optional[ExperienceAlignment]
@@ -56,4 +67,24 @@ class AgentState(TypedDict):
 
     # Potential intermediate data (optional)
     # e.g., raw extracted skills, error messages
-    error_messages: Optional[List[str]] 
\ No newline at end of file
+    error_messages: Optional[List[str]] 
+
+
+class MultiJobState(TypedDict):
+    '''
+    State of a run matching one resume against many job descriptions.
+    Per-job values are keyed by job description path.
+    '''
+    resume_path: str
+    job_description_paths: List[str]
+
+    # Resume side, computed once and shared by every pair
+    resume: Resume
+    resume_company_info: Optional[Dict[str, CompanyInfo]]
+    company_research_outcomes: Annotated[Dict[str, CompanyResearchOutcome], merge_dicts]
+
+    # Job side, written concurrently by one node per job description
+    job_profiles: Annotated[Dict[str, JobProfile], merge_dicts]
+
+    # Analysis results per job description
+    job_analyses: Annotated[Dict[str, Dict[str, Any]], merge_dicts]
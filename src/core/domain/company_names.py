@@ -0,0 +1,156 @@
+import difflib
+import re
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from src.core.domain.company_search import normalize_company_name
+
+# Legal forms that do not distinguish companies, e.g. "Google LLC" and "Google"
+LEGAL_SUFFIXES = frozenset({
+    "inc", "incorporated", "llc", "llp", "lp", "ltd", "limited", "corp", "corporation", "co", "company",
+    "plc", "gmbh", "ag", "sa", "sas", "sarl", "bv", "nv", "pty", "srl", "spa", "oy", "ab", "kk", "pvt",
+})
+
+# Alternative names of the same employer, in normalized form
+DEFAULT_ALIASES: Dict[str, str] = {
+    "alphabet": "google",
+    "google cloud": "google",
+    "facebook": "meta",
+    "meta platforms": "meta",
+    "amazon web services": "amazon",
+    "aws": "amazon",
+    "microsoft research": "microsoft",
+    "international business machines": "ibm",
+}
+
+# Separators between alternative names, e.g. "Alphabet/Google" or "Meta (Facebook)"
+_ALTERNATIVES_RE = re.compile(r"[/|()]")
+
+
+class CompanyNameIndex:
+    """
+    Maps the different spellings of a company name to one canonical key.
+
+    A name is normalized (case, punctuation, ``&``, a leading "the" and trailing
+    legal forms) and resolved through the alias table. Names listing
+    alternatives, such as "Alphabet/Google", resolve to the first alternative
+    with an alias, otherwise to the first alternative. This key depends only on
+    the name, so it is safe to persist, see :meth:`key`.
+
+    Optionally, :meth:`canonical` also merges a name into one seen before that
+    differs from it by a typo in a single word, e.g. "Wayne Enterprizes". Such
+    matches depend on the names seen so far and can be wrong, so they are off
+    by default and only meant for de-duplicating names within a run.
+
+    :param aliases: Mapping of alternative normalized names to canonical names
+    :type aliases: Optional[Mapping[str, str]]
+    :param fuzzy_threshold: Minimum similarity ratio (0-1) of the differing word for a typo match,
+        1 disables typo matching
+    :type fuzzy_threshold: float
+    """
+    def __init__(self, aliases: Optional[Mapping[str, str]] = None, fuzzy_threshold: float = 1.0):
+        self._aliases = {
+            self.normalize(alias): self.normalize(canonical)
+            for alias, canonical in (DEFAULT_ALIASES if aliases is None else aliases).items()
+        }
+        self._fuzzy_threshold = fuzzy_threshold
+        self._known: Dict[str, str] = {}
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """
+        Normalize a company name, e.g. ``"The Wayne Enterprises, Inc."`` to ``"wayne enterprises"``.
+
+        :param name: Company name as written
+        :type name: str
+        :return: Normalized name
+        :rtype: str
+        """
+        tokens = normalize_company_name(name.replace("&", " and ")).split()
+        if len(tokens) > 1 and tokens[0] == "the":
+            tokens = tokens[1:]
+        while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+            tokens = tokens[:-1]
+        return " ".join(tokens)
+
+    def key(self, name: str) -> str:
+        """
+        Get the key of a company name from normalization and aliases only.
+
+        Unlike :meth:`canonical` the key does not depend on the names seen
+        before, so it can be used for persistent storage.
+
+        :param name: Company name as written
+        :type name: str
+        :return: Key of the company, empty for a blank name
+        :rtype: str
+        """
+        alternatives = [self.normalize(part) for part in _ALTERNATIVES_RE.split(name)]
+        alternatives = [alternative for alternative in alternatives if alternative]
+        if len(alternatives) > 1:
+            for alternative in alternatives:
+                if alternative in self._aliases:
+                    return self._aliases[alternative]
+            return alternatives[0]
+        normalized = self.normalize(name)
+        return self._aliases.get(normalized, normalized)
+
+    def canonical(self, name: str) -> str:
+        """
+        Get the canonical key of a company name within this index, registering it if it is new.
+
+        Equal to :meth:`key`, unless typo matching is enabled and the name is a
+        typo of a name seen before.
+
+        :param name: Company name as written
+        :type name: str
+        :return: Canonical key
+        :rtype: str
+        """
+        key = self.key(name)
+        if not key:
+            return key
+        if key not in self._known:
+            self._known[key] = self._match_typo(key) or key
+        return self._known[key]
+
+    def _match_typo(self, key: str) -> Optional[str]:
+        """
+        Find a known key differing from a new key by a typo in a single word.
+
+        :param key: New key
+        :type key: str
+        :return: Canonical key of the match, or None
+        :rtype: Optional[str]
+        """
+        if self._fuzzy_threshold >= 1:
+            return None
+        tokens = key.split()
+        for known, canonical in self._known.items():
+            known_tokens = known.split()
+            if len(known_tokens) != len(tokens):
+                continue
+            differing = [(a, b) for a, b in zip(tokens, known_tokens) if a != b]
+            # Short words such as "bahn" and "bank" are different names, not typos
+            if (len(differing) == 1 and min(len(differing[0][0]), len(differing[0][1])) >= 5
+                    and difflib.SequenceMatcher(None, *differing[0]).ratio() >= self._fuzzy_threshold):
+                return canonical
+        return None
+
+    def deduplicate(self, names: Iterable[str]) -> Dict[str, str]:
+        """
+        Collapse company names referring to the same company.
+
+        :param names: Company names, e.g. one per resume experience
+        :type names: Iterable[str]
+        :return: First spelling seen for each canonical key, keyed by canonical key, in input order
+        :rtype: Dict[str, str]
+        """
+        distinct: Dict[str, str] = {}
+        for name in names:
+            if name and name.strip():
+                distinct.setdefault(self.canonical(name), name.strip())
+        return distinct
+
+    def known_names(self) -> List[str]:
+        """Canonical keys seen so far."""
+        return sorted(set(self._known.values()))
@@ -1,5 +1,8 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Literal, Optional
+import re
+
+_NON_ALPHANUMERIC_RE = re.compile(r"[^\w]+")
 
 class CompanyInfo(BaseModel):
     name: str = Field(description="The name of the company")
@@ -12,6 +15,33 @@ class CompanyInfo(BaseModel):
     founded_year: Optional[int] = Field(None, description="The year the company was founded")
 
 
+class PartialCompanyInfo(CompanyInfo):
+    """Company information extracted from a research run stopped by its budget; may be incomplete."""
+
+
+class CompanyResearchOutcome(BaseModel):
+    """Result of researching a single company, kept for reporting."""
+    company_name: str = Field(description="The company name as researched")
+    status: Literal["found", "partial", "not_found", "failed", "timed_out"] = Field(
+        description="How the research ended")
+    company_info: Optional[CompanyInfo] = Field(None, description="The information found, if any")
+    attempts: int = Field(0, description="Number of searches made, including retries")
+    error: Optional[str] = Field(None, description="The last error, for failed or timed out research")
+    elapsed_seconds: float = Field(0.0, description="Time spent on the company, including backoff")
+
+
+def normalize_company_name(name: str) -> str:
+    """
+    Normalize a company name for lookups, e.g. ``" Wayne  Enterprises, "`` to ``"wayne enterprises"``.
+
+    :param name: Company name as written
+    :type name: str
+    :return: Normalized company name
+    :rtype: str
+    """
+    return _NON_ALPHANUMERIC_RE.sub(" ", name.casefold()).strip()
+
+
 if __name__ == "__main__":
     data_model = CompanyInfo.model_json_schema()
     print(data_model)
\ No newline at end of file
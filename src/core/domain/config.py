@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 from src.core.domain.constants import PROJECT_ROOT
 
 @dataclass
@@ -11,6 +11,9 @@ class TemplateConfig:
     cache_ttl: int = 3600
     default_encoding: str = 'utf-8'
     auto_reload: bool = False
+    bytecode_cache_dir: Optional[Path] = None
+    precompile: bool = False
+    render_cache_size: int = 256
 
     @classmethod
     def default(cls) -> "TemplateConfig":
@@ -23,6 +26,14 @@ class TemplateConfig:
             auto_reload=False
         )
 
+    @classmethod
+    def production(cls, bytecode_cache_dir: Optional[Path] = None) -> "TemplateConfig":
+        """Create production configuration with a persistent bytecode cache"""
+        config = cls.default()
+        config.bytecode_cache_dir = bytecode_cache_dir or PROJECT_ROOT / ".cache/templates"
+        config.precompile = True
+        return config
+
     @classmethod
     def development(cls) -> "TemplateConfig":
         """Create development configuration"""
@@ -41,6 +52,75 @@ class TemplateConfig:
             cache_ttl=0
         )
 
+@dataclass
+class PrivacyConfig:
+    """Configuration for the privacy service.
+
+    ``mode="fast"`` skips NER and relies on compiled patterns only. Documents
+    longer than ``chunk_size`` characters are split into overlapping chunks that
+    are analyzed in parallel worker processes; ``chunk_size=0`` disables chunking.
+    """
+    mode: Literal["full", "fast"] = "full"
+    nlp_model: str = "en_core_web_sm"
+    language: str = "en"
+    batch_size: int = 32
+    n_process: int = 1
+    chunk_size: int = 20_000
+    chunk_overlap: int = 500
+    chunk_workers: Optional[int] = None
+
+@dataclass
+class CheckpointConfig:
+    """Configuration for durable graph checkpoints."""
+    db_path: Path = PROJECT_ROOT / ".cache/checkpoints.sqlite"
+    busy_timeout_ms: int = 5000
+
+@dataclass
+class CompanyCacheConfig:
+    """Configuration for the persistent company information cache.
+
+    Entries older than ``ttl_seconds`` are stale: they are still returned for up to
+    ``max_stale_seconds`` more while being refreshed in the background. Failed
+    lookups are remembered for ``negative_ttl_seconds``.
+    """
+    db_path: Path = PROJECT_ROOT / ".cache/company_info.sqlite"
+    ttl_seconds: float = 30 * 24 * 3600
+    max_stale_seconds: float = 60 * 24 * 3600
+    negative_ttl_seconds: float = 24 * 3600
+
+@dataclass
+class CompanyResearchConfig:
+    """Limits on researching companies with the search agent.
+
+    At most ``max_concurrency`` companies are researched at once. Model and search
+    tool calls are throttled separately to their ``*_requests_per_second``. A
+    company hitting a rate limit is retried up to ``max_retries`` times with
+    exponential backoff, and is given up on after ``deadline_seconds`` in total.
+    With ``web_search`` off the agent only searches the local company directory.
+
+    A single agent run stops after ``max_tool_calls`` searches, ``max_agent_tokens``
+    tokens or ``agent_time_budget_seconds``, whichever comes first, and the fields
+    found so far are then extracted from its search results within
+    ``partial_result_timeout_seconds``.
+
+    Web search results are compacted to the sentences relevant to the company,
+    at most ``max_result_tokens`` per result, unless ``compact_search_results`` is off.
+    """
+    max_concurrency: int = 4
+    llm_requests_per_second: float = 2.0
+    search_requests_per_second: float = 1.0
+    max_retries: int = 3
+    backoff_base_seconds: float = 1.0
+    backoff_max_seconds: float = 30.0
+    deadline_seconds: float = 120.0
+    web_search: bool = True
+    max_tool_calls: int = 6
+    max_agent_tokens: int = 30_000
+    agent_time_budget_seconds: float = 60.0
+    partial_result_timeout_seconds: float = 15.0
+    compact_search_results: bool = True
+    max_result_tokens: int = 200
+
 @dataclass
 class AIProviderConfig:
     """Base configuration for AI providers with common settings."""
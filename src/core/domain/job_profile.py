@@ -0,0 +1,92 @@
+import re
+from typing import Dict, FrozenSet, Iterable, Optional, Set
+
+from pydantic import BaseModel, PrivateAttr
+
+from src.core.domain.company_search import CompanyInfo
+from src.core.domain.job_description import JobDescription
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_skill(skill: str) -> str:
+    """
+    Normalize a skill name for comparison, e.g. ``" Machine  Learning"`` to ``"machine learning"``.
+
+    :param skill: Skill name as written in a job description or resume
+    :type skill: str
+    :return: Normalized skill name
+    :rtype: str
+    """
+    return _WHITESPACE_RE.sub(" ", skill).strip().casefold()
+
+
+class KeywordMatcher:
+    """
+    Finds any of a fixed set of keywords in text in a single pass.
+
+    The keywords are compiled once into a single case-insensitive alternation,
+    longest first, bounded so that e.g. ``java`` does not match inside ``javascript``.
+
+    :param keywords: Keywords to find
+    :type keywords: Iterable[str]
+    """
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = frozenset(normalize_skill(keyword) for keyword in keywords if keyword.strip())
+        alternation = "|".join(
+            re.escape(keyword).replace(r"\ ", r"\s+")
+            for keyword in sorted(self.keywords, key=len, reverse=True)
+        )
+        self._pattern = re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE) if self.keywords else None
+
+    def find(self, text: str) -> Set[str]:
+        """
+        Find the keywords occurring in the text.
+
+        :param text: Text to search
+        :type text: str
+        :return: Normalized keywords found
+        :rtype: Set[str]
+        """
+        if self._pattern is None:
+            return set()
+        return {normalize_skill(match.group(0)) for match in self._pattern.finditer(text)}
+
+
+class JobProfile(BaseModel):
+    """
+    Everything derived from a job description that does not depend on the candidate.
+
+    Built once per job description and reused for every candidate evaluated against it.
+
+    :ivar job_description: Parsed job description
+    :ivar company_info: Research results for the hiring company, keyed by company name
+    :ivar prompt_fragments: Job details formatted for the analysis prompts
+    :ivar required_skills: Normalized names of the required technologies
+    :ivar nice_to_have_skills: Normalized names of the nice-to-have technologies
+    """
+    job_description: JobDescription
+    company_info: Optional[Dict[str, CompanyInfo]] = None
+    prompt_fragments: Dict[str, str]
+    required_skills: FrozenSet[str]
+    nice_to_have_skills: FrozenSet[str]
+
+    _keyword_matcher: Optional[KeywordMatcher] = PrivateAttr(default=None)
+
+    @property
+    def keyword_matcher(self) -> KeywordMatcher:
+        """Matcher for all skills of the job, compiled on first use."""
+        if self._keyword_matcher is None:
+            self._keyword_matcher = KeywordMatcher(self.required_skills | self.nice_to_have_skills)
+        return self._keyword_matcher
+
+    def find_skills(self, text: str) -> Set[str]:
+        """
+        Find the job's skills mentioned in a text, e.g. a resume.
+
+        :param text: Text to search
+        :type text: str
+        :return: Normalized skills found
+        :rtype: Set[str]
+        """
+        return self.keyword_matcher.find(text)
@@ -0,0 +1,20 @@
+from functools import lru_cache
+import json
+from typing import Type
+from pydantic import BaseModel
+
+
+@lru_cache(maxsize=None)
+def get_model_schema(model: Type[BaseModel]) -> str:
+    """
+    Get the JSON schema of a Pydantic model as a string.
+
+    Schemas are generated once per model class and reused afterwards, since
+    building them walks the whole model definition on every call.
+
+    :param model: The Pydantic model class
+    :type model: Type[BaseModel]
+    :return: JSON schema of the model
+    :rtype: str
+    """
+    return json.dumps(model.model_json_schema(), indent=2)
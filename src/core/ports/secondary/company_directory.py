@@ -0,0 +1,34 @@
+from typing import Any, Dict, List, Optional, Protocol
+
+from src.core.domain.company_search import CompanyInfo
+
+
+class CompanyDirectory(Protocol):
+    """
+    Interface for a local directory of known companies, searched before the web.
+    """
+
+    def lookup(self, company_name: str) -> Optional[CompanyInfo]:
+        """
+        Get a company by its name or one of its aliases.
+
+        :param company_name: Company name as written
+        :type company_name: str
+        :return: Company information, or None if the company is not in the directory
+        :rtype: Optional[CompanyInfo]
+        """
+        raise NotImplementedError
+
+    def search(self, query: str, max_results: int = 3) -> List[Dict[str, Any]]:
+        """
+        Full-text search of the directory.
+
+        :param query: Free-text query, e.g. as written by the search agent
+        :type query: str
+        :param max_results: Maximum number of results
+        :type max_results: int
+        :return: Results in the format of the Tavily search tool, with ``title``,
+            ``url``, ``content`` and ``score`` keys, best first
+        :rtype: List[Dict[str, Any]]
+        """
+        raise NotImplementedError
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import Optional, Protocol
+
+from src.core.domain.company_search import CompanyInfo
+
+
+@dataclass
+class CachedCompanyInfo:
+    """A cached company lookup; ``company_info`` is None for a lookup that failed."""
+    company_info: Optional[CompanyInfo]
+    fetched_at: float
+
+
+class CompanyInfoCache(Protocol):
+    """
+    Interface for persistent storage of company lookups.
+    """
+
+    def get(self, key: str) -> Optional[CachedCompanyInfo]:
+        """
+        Get a cached lookup.
+
+        :param key: Normalized company name
+        :type key: str
+        :return: Cached lookup, or None if the company was never looked up
+        :rtype: Optional[CachedCompanyInfo]
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, company_info: Optional[CompanyInfo]) -> None:
+        """
+        Store the result of a lookup.
+
+        :param key: Normalized company name
+        :type key: str
+        :param company_info: Company information, or None if the lookup failed
+        :type company_info: Optional[CompanyInfo]
+        """
+        raise NotImplementedError
@@ -43,4 +43,17 @@ class TemplateService(Protocol):
         :return: True if template is valid, False otherwise
         :rtype: bool
         """
-        pass 
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_template_fingerprint(self, template_name: str) -> str:
+        """
+        Get a content fingerprint of a template and everything it includes or extends.
+        
+        :param template_name: Name of the template to fingerprint
+        :type template_name: str
+        :return: Identifier that changes whenever the template content changes
+        :rtype: str
+        :raises TemplateNotFoundError: If template doesn't exist
+        """
+        pass
@@ -0,0 +1,83 @@
+"""
+SQLite-backed persistent cache of company lookups.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from src.core.domain.company_search import CompanyInfo
+from src.core.ports.secondary.company_info_cache import CachedCompanyInfo, CompanyInfoCache
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCompanyInfoCache(CompanyInfoCache):
+    """
+    Stores company lookups in a single SQLite table.
+
+    The database runs in WAL mode so several processes can share it. Lookups
+    and writes are single-row primary key operations that take microseconds,
+    so they run inline.
+
+    :param db_path: Path of the SQLite database file
+    :type db_path: Path
+    """
+    def __init__(self, db_path: Path):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS company_info ("
+            "key TEXT PRIMARY KEY, payload TEXT, fetched_at REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> Optional[CachedCompanyInfo]:
+        """
+        Get a cached lookup.
+
+        :param key: Normalized company name
+        :type key: str
+        :return: Cached lookup, or None if the company was never looked up
+        :rtype: Optional[CachedCompanyInfo]
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, fetched_at FROM company_info WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        payload, fetched_at = row
+        try:
+            company_info = CompanyInfo.model_validate_json(payload) if payload else None
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable cache entry for {key}: {str(e)}")
+            return None
+        return CachedCompanyInfo(company_info=company_info, fetched_at=fetched_at)
+
+    def set(self, key: str, company_info: Optional[CompanyInfo]) -> None:
+        """
+        Store the result of a lookup.
+
+        :param key: Normalized company name
+        :type key: str
+        :param company_info: Company information, or None if the lookup failed
+        :type company_info: Optional[CompanyInfo]
+        """
+        payload = company_info.model_dump_json() if company_info else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO company_info (key, payload, fetched_at) VALUES (?, ?, ?)",
+                (key, payload, time.time()),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
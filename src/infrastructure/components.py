@@ -1,4 +1,6 @@
 import os
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from src.core.ports.secondary.ai_provider import AIProvider
 from src.core.ports.secondary.template_service import TemplateService
 from src.infrastructure.ai_providers.openai_provider import OpenAIProvider
@@ -7,6 +9,9 @@ from src.infrastructure.template.jinja_template_service import JinjaTemplateServ
 from src.core.domain.config import AIProviderConfig, OpenAIConfig, TemplateConfig
 from src.infrastructure.extractors.llm_extractor import LLMStructuredExtractor
 
+if TYPE_CHECKING:
+    from src.infrastructure.privacy.anonymization_stage import AnonymizationStage
+
 def create_ai_provider() -> AIProvider:
     """
     Create the appropriate AI provider based on environment.
@@ -25,17 +30,24 @@ def create_ai_provider() -> AIProvider:
 
 def create_template_service() -> TemplateService:
     """
-    Create the template service.
+    Create the template service based on environment.
     
     :return: An implementation of TemplateService
     :rtype: TemplateService
     """
-    config = TemplateConfig.development()
+    # Reload templates on change for testing environment
+    if os.getenv("TESTING", "false").lower() == "true":
+        config = TemplateConfig.development()
+        return JinjaTemplateService(config=config)
+    
+    # Use precompiled, cached templates for production
+    config = TemplateConfig.production()
     return JinjaTemplateService(config=config)
 
 def create_llm_extractor(
     ai_provider: AIProvider = None,
-    template_service: TemplateService = None
+    template_service: TemplateService = None,
+    anonymization_stage: "AnonymizationStage" = None
 ) -> LLMStructuredExtractor:
     """
     Create the LLM extractor with appropriate dependencies.
@@ -44,7 +56,10 @@ def create_llm_extractor(
     :type ai_provider: AIProvider, optional
     :param template_service: Optional template service, created if not provided
     :type template_service: TemplateService, optional
-    :return: An instance of LLMStructuredExtractor
+    :param anonymization_stage: Optional stage anonymizing documents before the LLM call
+    :type anonymization_stage: AnonymizationStage, optional
+    :return: An instance of LLMStructuredExtractor; close it, or use it with ``async with``,
+        to shut down the anonymization stage's worker processes
     :rtype: LLMStructuredExtractor
     """
     ai_provider = ai_provider or create_ai_provider()
@@ -52,13 +67,51 @@ def create_llm_extractor(
     
     return LLMStructuredExtractor(
         ai_provider=ai_provider,
-        template_service=template_service
+        template_service=template_service,
+        anonymization_stage=anonymization_stage
     )
 
-# Initialize components for easy access
-ai_provider: AIProvider = create_ai_provider()
-template_service: TemplateService = create_template_service()
-llm_extractor: LLMStructuredExtractor = create_llm_extractor(
-    ai_provider=ai_provider,
-    template_service=template_service
-)
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_ai_provider() -> AIProvider:
+    """
+    Get the shared AI provider, creating it on first use.
+    
+    :return: Shared AI provider
+    :rtype: AIProvider
+    """
+    return create_ai_provider()
+
+@lru_cache(maxsize=None)
+def get_template_service() -> TemplateService:
+    """
+    Get the shared template service, creating it on first use.
+    
+    Deferred so that importing this module does not precompile the templates
+    or create the bytecode cache directory.
+    
+    :return: Shared template service
+    :rtype: TemplateService
+    """
+    return create_template_service()
+
+@lru_cache(maxsize=None)
+def get_llm_extractor() -> LLMStructuredExtractor:
+    """
+    Get the shared LLM extractor, creating it on first use.
+    
+    :return: Shared LLM extractor using the shared AI provider and template service
+    :rtype: LLMStructuredExtractor
+    """
+    return create_llm_extractor(ai_provider=get_ai_provider(), template_service=get_template_service())
+
+# Shared components for easy access, e.g. ``components.template_service``, created on first access
+_SHARED_COMPONENTS = {
+    "ai_provider": get_ai_provider,
+    "template_service": get_template_service,
+    "llm_extractor": get_llm_extractor,
+}
+
+def __getattr__(name: str):
+    if name in _SHARED_COMPONENTS:
+        return _SHARED_COMPONENTS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,5 +1,6 @@
+import asyncio
 from pathlib import Path
-from typing import Union, List, TypeVar, Type, Generic, Optional
+from typing import TYPE_CHECKING, Union, List, TypeVar, Type, Generic, Optional
 from pydantic import BaseModel
 import json
 from typing import Dict, Any
@@ -8,9 +9,20 @@ from src.core.ports.secondary.ai_provider import AIProvider, AIOptions
 from src.core.ports.secondary.template_service import TemplateService
 from src.infrastructure.parsers.base_parser import BaseDocumentParser
 from src.infrastructure.parsers.pdf_parser import PDFParser
+from src.infrastructure.parsers.docx_parser import DocxParser
+
+if TYPE_CHECKING:
+    # Imported lazily since it loads presidio and spaCy
+    from src.infrastructure.privacy.anonymization_stage import AnonymizationStage
 
 T = TypeVar('T', bound=BaseModel)
 
+# Leading bytes used to recognise document formats passed in as raw bytes
+_MAGIC_NUMBERS = {
+    b"%PDF": ".pdf",
+    b"PK\x03\x04": ".docx",
+}
+
 class LLMStructuredExtractor:
     """
     Generic extractor that uses LLMs to parse text into structured Pydantic models.
@@ -23,16 +35,22 @@ class LLMStructuredExtractor:
     :type output_model: Type[T]
     :param template_path: Path to the template file for extraction
     :type template_path: str
+    :param anonymization_stage: Optional stage that removes PII before the LLM call
+        and restores it in the parsed model; its worker processes are shut down by :meth:`close`
+        or on leaving ``async with``
+    :type anonymization_stage: Optional[AnonymizationStage]
     """
     def __init__(
         self, 
         ai_provider: AIProvider, 
         template_service: TemplateService,
-        document_parsers: Optional[dict[str, BaseDocumentParser]] = None
+        document_parsers: Optional[dict[str, BaseDocumentParser]] = None,
+        anonymization_stage: Optional["AnonymizationStage"] = None
     ):
         self._ai_provider = ai_provider
         self._template_service = template_service
-        self._parsers = document_parsers or {".pdf": PDFParser()}
+        self._parsers = document_parsers or {".pdf": PDFParser(), ".docx": DocxParser()}
+        self._anonymization_stage = anonymization_stage
 
         self._supported_formats = list(self._parsers.keys()) if self._parsers else []
 
@@ -46,12 +64,30 @@ class LLMStructuredExtractor:
         """
         return self._supported_formats
 
+    def close(self) -> None:
+        """
+        Shut down the anonymization stage's worker processes, if any were started.
+        """
+        if self._anonymization_stage:
+            self._anonymization_stage.shutdown()
+
+    async def __aenter__(self) -> "LLMStructuredExtractor":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        # Shutting down waits for the workers to exit, so keep it off the event loop
+        await asyncio.to_thread(self.close)
+
     async def parse_document(self, content: Union[Path, bytes, str],
                            output_model: Type[T],
                            template_path: str) -> T:
         """
         Parse a document into a structured Pydantic object using LLM.
 
+        When an anonymization stage is configured, the extracted text is
+        anonymized before it is sent to the LLM and the original values are
+        restored in the parsed model, so PII never leaves the host.
+
         :param content: Either a Path to the file, raw bytes, or string content
         :type content: Union[Path, bytes, str]
         :param output_model: The Pydantic model class to parse into
@@ -65,6 +101,11 @@ class LLMStructuredExtractor:
         # Convert content to text
         text = await self._get_text_content(content)
 
+        # Replace PII with placeholders before the text leaves the host
+        replacement_map = {}
+        if self._anonymization_stage:
+            text, replacement_map = await self._anonymization_stage.anonymize(text)
+
         # Create prompt using template service
         prompt = self._template_service.render_prompt(
             template_path,
@@ -75,7 +116,10 @@ class LLMStructuredExtractor:
         options = AIOptions(temperature=0.0)
         response = await self._ai_provider.complete(prompt, options)
         
-        return self._parse_response(response, output_model)
+        result = self._parse_response(response, output_model)
+        if self._anonymization_stage:
+            result = self._anonymization_stage.restore_model(result, replacement_map)
+        return result
 
     async def generate_structured_output(self,
                                         template_path: str,
@@ -131,15 +175,31 @@ class LLMStructuredExtractor:
             else:
                 raise ValueError(f"Unsupported file format: {content.suffix}")
         elif isinstance(content, bytes):
-            # For PDF content in bytes, use the PDF parser
-            if '.pdf' in self._supported_formats:
-                parser = self._parsers['.pdf']
+            # Pick the parser from the file signature, e.g. PDF or DOCX
+            file_extension = self._detect_format(content)
+            if file_extension in self._supported_formats:
+                parser = self._parsers[file_extension]
                 return await parser.extract_text(content)
             # For other types, try UTF-8 decode
             return content.decode('utf-8')
         else:
             raise ValueError(f"Unsupported content type: {type(content)}")
 
+    @staticmethod
+    def _detect_format(content: bytes) -> Optional[str]:
+        """
+        Detect the document format of raw bytes from its leading magic number.
+
+        :param content: Raw document content
+        :type content: bytes
+        :return: File extension of the detected format, or None if unknown
+        :rtype: Optional[str]
+        """
+        for magic_number, file_extension in _MAGIC_NUMBERS.items():
+            if content.startswith(magic_number):
+                return file_extension
+        return None
+
     def _parse_response(self, response: str, output_model: Type[T]) -> T:
         """
         Parse LLM response into the target Pydantic model.
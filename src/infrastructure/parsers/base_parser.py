@@ -1,6 +1,16 @@
+import asyncio
+import io
+import mmap
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Union
+from typing import BinaryIO, Union
+
+# Documents above this size are rejected before any parsing work is done
+DEFAULT_MAX_FILE_SIZE = 20 * 1024 * 1024
+# Files at least this large are memory-mapped instead of copied into bytes
+DEFAULT_MMAP_THRESHOLD = 1024 * 1024
+
+DocumentBuffer = Union[bytes, mmap.mmap]
 
 
 class BaseDocumentParser(ABC):
@@ -13,11 +23,18 @@ class BaseDocumentParser(ABC):
     
     :ivar supported_formats: List of file extensions this parser supports
     :type supported_formats: list[str]
+    :param max_file_size: Maximum accepted document size in bytes
+    :type max_file_size: int
+    :param mmap_threshold: File size in bytes from which files are memory-mapped
+    :type mmap_threshold: int
     """
 
-    def __init__(self):
+    def __init__(self, max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+                 mmap_threshold: int = DEFAULT_MMAP_THRESHOLD):
         """Initialize the document parser."""
         self._supported_formats = []
+        self._max_file_size = max_file_size
+        self._mmap_threshold = mmap_threshold
 
     @property
     def supported_formats(self) -> list[str]:
@@ -54,18 +71,76 @@ class BaseDocumentParser(ABC):
         """
         return file_extension.lower() in [fmt.lower() for fmt in self.supported_formats]
 
-    async def _read_file(self, path: Path) -> bytes:
+    async def _read_file(self, path: Path) -> DocumentBuffer:
         """
-        Read file content into bytes.
-        
+        Read file content without blocking the event loop.
+
+        Small files are read into bytes in a worker thread. Files at or above the
+        mmap threshold are memory-mapped read-only, so their pages are loaded lazily
+        by the parser instead of being copied into Python bytes up front. Callers
+        owning an mmap result should release it with :meth:`_release_buffer`.
+
         :param path: Path to the file to read
         :type path: Path
-        :return: File content as bytes
-        :rtype: bytes
+        :return: File content as bytes or a read-only memory map
+        :rtype: DocumentBuffer
         :raises FileNotFoundError: If the file doesn't exist
+        :raises ValueError: If the file exceeds the configured size cap
         :raises IOError: If the file cannot be read
         """
+        return await asyncio.to_thread(self._read_file_sync, path)
+
+    def _read_file_sync(self, path: Path) -> DocumentBuffer:
+        """
+        Synchronous implementation of :meth:`_read_file`.
+
+        :param path: Path to the file to read
+        :type path: Path
+        :return: File content as bytes or a read-only memory map
+        :rtype: DocumentBuffer
+        """
+        if not path.is_file():
+            raise FileNotFoundError(f"File not found: {path}")
+
+        size = path.stat().st_size
+        if size > self._max_file_size:
+            raise ValueError(
+                f"File {path} is {size} bytes, exceeding the limit of {self._max_file_size} bytes"
+            )
+
         try:
-            return await path.read_bytes()
+            if size >= self._mmap_threshold and size > 0:
+                with open(path, "rb") as file:
+                    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            return path.read_bytes()
         except Exception as e:
-            raise IOError(f"Failed to read file {path}: {str(e)}") from e 
\ No newline at end of file
+            raise IOError(f"Failed to read file {path}: {str(e)}") from e
+
+    @staticmethod
+    def _as_stream(data: Union[DocumentBuffer, bytes]) -> BinaryIO:
+        """
+        Wrap document content in a seekable binary stream.
+
+        Memory maps already implement the file protocol and are returned as-is so
+        no copy of the document is made.
+
+        :param data: Document content as bytes or a memory map
+        :type data: DocumentBuffer
+        :return: Seekable binary stream positioned at the start
+        :rtype: BinaryIO
+        """
+        if isinstance(data, mmap.mmap):
+            data.seek(0)
+            return data
+        return io.BytesIO(data)
+
+    @staticmethod
+    def _release_buffer(data: Union[DocumentBuffer, Path, bytes]) -> None:
+        """
+        Release a buffer returned by :meth:`_read_file`.
+
+        :param data: Buffer to release; non-mmap values are ignored
+        :type data: Union[DocumentBuffer, Path, bytes]
+        """
+        if isinstance(data, mmap.mmap):
+            data.close()
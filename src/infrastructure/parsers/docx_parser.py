@@ -0,0 +1,95 @@
+import asyncio
+from pathlib import Path
+from typing import Union
+import docx
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+from src.infrastructure.parsers.base_parser import BaseDocumentParser, DocumentBuffer
+
+class DocxParser(BaseDocumentParser):
+    """DOCX document parser implementation.
+
+    Reads paragraphs and tables straight from the Word document body using
+    python-docx, without any layout analysis. Like the PDF parser, the
+    CPU-bound work runs off the event loop.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._supported_formats = [".docx"]
+
+    async def extract_text(self, content: Union[Path, bytes]) -> str:
+        """Asynchronously extract text from DOCX content.
+
+        :param content: Either a Path to the DOCX file or raw bytes content
+        :type content: Union[Path, bytes]
+        :return: Extracted text content
+        :rtype: str
+        :raises ValueError: If the DOCX cannot be parsed
+        """
+        data = None
+        try:
+            data = await self._read_file(content) if isinstance(content, Path) else content
+            return await asyncio.to_thread(self._extract_text_sync, data)
+        except Exception as e:
+            raise ValueError(f"Failed to extract text from DOCX: {str(e)}") from e
+        finally:
+            self._release_buffer(data)
+
+    def _extract_text_sync(self, content: DocumentBuffer) -> str:
+        """Synchronous implementation of DOCX text extraction.
+
+        Paragraphs and tables are emitted in document order. Table rows are
+        rendered as cell texts joined by `` | ``, with horizontally merged
+        cells reported once.
+
+        :param content: DOCX content as bytes or a memory-mapped file
+        :type content: DocumentBuffer
+        :return: Extracted text content
+        :rtype: str
+        :raises Exception: If DOCX parsing fails
+        """
+        document = docx.Document(self._as_stream(content))
+
+        text_content = []
+        for block in document.iter_inner_content():
+            if isinstance(block, Paragraph):
+                if paragraph_text := block.text.strip():
+                    text_content.append(paragraph_text)
+            elif isinstance(block, Table):
+                text_content.extend(self._extract_table_rows(block))
+        return "\n".join(text_content)
+
+    def _extract_table_rows(self, table: Table) -> list[str]:
+        """Render each non-empty table row as a single line of text.
+
+        :param table: Table from the document body
+        :type table: Table
+        :return: One string per non-empty row
+        :rtype: list[str]
+        """
+        rows = []
+        for row in table.rows:
+            cells = []
+            seen = set()
+            for cell in row.cells:
+                # Merged cells are returned once per grid column they span
+                if id(cell._tc) in seen:
+                    continue
+                seen.add(id(cell._tc))
+                if cell_text := cell.text.strip():
+                    cells.append(cell_text)
+            if cells:
+                rows.append(" | ".join(cells))
+        return rows
+
+if __name__ == "__main__":
+    import sys
+
+    async def main():
+        parser = DocxParser()
+        text = await parser.extract_text(Path(sys.argv[1]))
+        print(text)
+
+    asyncio.run(main())
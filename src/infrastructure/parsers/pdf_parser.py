@@ -1,10 +1,9 @@
 import asyncio
 from pathlib import Path
 from typing import Union
-import io
 import pdfplumber
 
-from src.infrastructure.parsers.base_parser import BaseDocumentParser
+from src.infrastructure.parsers.base_parser import BaseDocumentParser, DocumentBuffer
 
 class PDFParser(BaseDocumentParser):
     """PDF document parser implementation.
@@ -13,7 +12,8 @@ class PDFParser(BaseDocumentParser):
     with proper async/sync separation for CPU-bound operations.
     """
 
-    def __init__(self):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         self._supported_formats = [".pdf"]
     
     async def extract_text(self, content: Union[Path, bytes]) -> str:
@@ -25,24 +25,25 @@ class PDFParser(BaseDocumentParser):
         :rtype: str
         :raises ValueError: If the PDF cannot be parsed
         """
+        data = None
         try:
-            return await asyncio.to_thread(self._extract_text_sync, content)
+            data = await self._read_file(content) if isinstance(content, Path) else content
+            return await asyncio.to_thread(self._extract_text_sync, data)
         except Exception as e:
             raise ValueError(f"Failed to extract text from PDF: {str(e)}") from e
+        finally:
+            self._release_buffer(data)
 
-    def _extract_text_sync(self, content: Union[Path, bytes]) -> str:
+    def _extract_text_sync(self, content: DocumentBuffer) -> str:
         """Synchronous implementation of PDF text extraction.
 
-        :param content: Either a Path to the PDF file or raw bytes content
-        :type content: Union[Path, bytes]
+        :param content: PDF content as bytes or a memory-mapped file
+        :type content: DocumentBuffer
         :return: Extracted text content
         :rtype: str
         :raises Exception: If PDF parsing fails
         """
-        # Convert bytes to BytesIO if needed
-        pdf_content = io.BytesIO(content) if isinstance(content, bytes) else content
-        
-        with pdfplumber.open(pdf_content) as pdf:
+        with pdfplumber.open(self._as_stream(content)) as pdf:
             text_content = []
             for page in pdf.pages:
                 if page_text := page.extract_text():
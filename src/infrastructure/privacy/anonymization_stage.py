@@ -0,0 +1,119 @@
+"""
+Reversible anonymization as a pipeline stage that keeps NER off the event loop.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+from src.infrastructure.privacy import nlp_engine_registry
+from src.infrastructure.privacy.presidio_privacy_service import PrivacyService
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T', bound=BaseModel)
+
+
+class AnonymizationStage:
+    """
+    Anonymizes documents before they are sent to an LLM and restores the response.
+
+    NER is CPU-bound and holds the GIL, so in ``full`` mode it runs in a process
+    pool whose workers load the NLP engine once at start-up. In ``fast`` mode the
+    pattern-based anonymization takes microseconds and runs inline. Restoring
+    placeholders is a single regex pass and always runs inline.
+
+    :param privacy_service: Privacy service performing the anonymization
+    :type privacy_service: PrivacyService
+    :param executor: Executor to run anonymization in, defaults to a process pool created on first use
+    :type executor: Optional[Executor]
+    :param max_workers: Number of worker processes when the default pool is used
+    :type max_workers: Optional[int]
+    """
+    def __init__(self, privacy_service: Optional[PrivacyService] = None,
+                 executor: Optional[Executor] = None,
+                 max_workers: Optional[int] = None):
+        self._privacy_service = privacy_service or PrivacyService()
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_workers = max_workers
+
+    @property
+    def privacy_service(self) -> PrivacyService:
+        """Privacy service performing the anonymization."""
+        return self._privacy_service
+
+    async def anonymize(self, text: str) -> Tuple[str, Dict[str, str]]:
+        """
+        Reversibly anonymize text without blocking the event loop.
+
+        :param text: Text to anonymize
+        :type text: str
+        :return: Tuple of (anonymized text, mapping of placeholders to original values)
+        :rtype: tuple[str, dict[str, str]]
+        """
+        if self._privacy_service.config.mode == "fast":
+            return self._privacy_service.anonymize_text(text)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self._privacy_service.anonymize_text, text)
+
+    def restore_model(self, model: T, replacement_map: Dict[str, str]) -> T:
+        """
+        Restore placeholders in every string field of a parsed model.
+
+        :param model: Model parsed from the LLM response
+        :type model: T
+        :param replacement_map: Mapping of placeholders to original values
+        :type replacement_map: dict[str, str]
+        :return: New model instance with original values restored
+        :rtype: T
+        """
+        if not replacement_map:
+            return model
+        restored = self._restore_value(model.model_dump(), replacement_map)
+        return type(model).model_validate(restored)
+
+    def _restore_value(self, value: Any, replacement_map: Dict[str, str]) -> Any:
+        """
+        Recursively restore placeholders in strings nested in lists and dicts.
+
+        :param value: Dumped model value
+        :type value: Any
+        :param replacement_map: Mapping of placeholders to original values
+        :type replacement_map: dict[str, str]
+        :return: Value with placeholders restored
+        :rtype: Any
+        """
+        if isinstance(value, str):
+            return self._privacy_service.restore_text(value, replacement_map)
+        if isinstance(value, list):
+            return [self._restore_value(item, replacement_map) for item in value]
+        if isinstance(value, dict):
+            return {key: self._restore_value(item, replacement_map) for key, item in value.items()}
+        return value
+
+    def _get_executor(self) -> Executor:
+        """
+        Get the executor, starting the default process pool on first use.
+
+        :return: Executor running the anonymization
+        :rtype: Executor
+        """
+        if self._executor is None:
+            logger.info("Starting anonymization process pool")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                initializer=nlp_engine_registry.init_worker,
+                initargs=(self._privacy_service.config,),
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Shut down the default process pool, if it was started."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
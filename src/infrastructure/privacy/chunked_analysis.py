@@ -0,0 +1,160 @@
+"""
+Chunked NER for long documents.
+
+spaCy's cost grows with document length and a single call runs on one core. Long
+documents are therefore split on paragraph or sentence boundaries into
+overlapping chunks, the chunks are analyzed in parallel, and the entity spans are
+shifted back to document offsets and de-duplicated at the chunk seams.
+"""
+
+from concurrent.futures import Executor
+from dataclasses import dataclass
+import re
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from presidio_analyzer import RecognizerResult
+
+from src.core.domain.config import PrivacyConfig
+from src.infrastructure.privacy import nlp_engine_registry
+
+# Preferred chunk boundaries, strongest first
+_BOUNDARY_SEPARATORS = ("\n\n", "\n", ". ", "? ", "! ", " ")
+_WHITESPACE_RE = re.compile(r"\s")
+
+
+@dataclass(frozen=True)
+class TextChunk:
+    """A slice of a document and its offset in the document."""
+    offset: int
+    text: str
+
+
+def split_text(text: str, chunk_size: int, overlap: int = 0) -> List[TextChunk]:
+    """
+    Split text into overlapping chunks that end on paragraph or sentence boundaries.
+
+    Each chunk ends at the last paragraph break, line break, sentence end or
+    space in the second half of its window, and the next chunk starts on a
+    word boundary ``overlap`` characters earlier, so entities shorter than the
+    overlap are seen whole by at least one chunk.
+
+    :param text: Text to split
+    :type text: str
+    :param chunk_size: Maximum number of characters per chunk
+    :type chunk_size: int
+    :param overlap: Number of characters shared by consecutive chunks, less than half the chunk size
+    :type overlap: int
+    :return: Chunks in document order
+    :rtype: list[TextChunk]
+    :raises ValueError: If the overlap is not smaller than half the chunk size
+    """
+    if chunk_size <= 0 or overlap < 0 or overlap >= chunk_size // 2:
+        raise ValueError(f"Invalid chunking: chunk_size={chunk_size}, overlap={overlap}")
+
+    chunks = []
+    start = 0
+    while True:
+        end = start + chunk_size
+        if end >= len(text):
+            chunks.append(TextChunk(start, text[start:]))
+            return chunks
+
+        end = _find_boundary(text, start + chunk_size // 2, end)
+        chunks.append(TextChunk(start, text[start:end]))
+
+        # Start the next chunk at a word boundary inside the overlap
+        whitespace = _WHITESPACE_RE.search(text, end - overlap, end)
+        start = whitespace.end() if whitespace else end
+
+
+def _find_boundary(text: str, floor: int, end: int) -> int:
+    """
+    Find the strongest boundary between floor and end.
+
+    :param text: Text being split
+    :type text: str
+    :param floor: Earliest acceptable boundary
+    :type floor: int
+    :param end: Latest acceptable boundary
+    :type end: int
+    :return: Offset just after the boundary, or end if there is none
+    :rtype: int
+    """
+    for separator in _BOUNDARY_SEPARATORS:
+        index = text.rfind(separator, floor, end)
+        if index != -1:
+            return index + len(separator)
+    return end
+
+
+def analyze_chunk(config: PrivacyConfig, chunk: TextChunk, entities: Sequence[str]) -> List[RecognizerResult]:
+    """
+    Run NER on a single chunk and shift the results to document offsets.
+
+    Runs in a worker process, using that process's shared analyzer.
+
+    :param config: Privacy configuration selecting the model and language
+    :type config: PrivacyConfig
+    :param chunk: Chunk to analyze
+    :type chunk: TextChunk
+    :param entities: Presidio entity types to detect
+    :type entities: Sequence[str]
+    :return: Detected entities with document offsets
+    :rtype: list[RecognizerResult]
+    """
+    results = nlp_engine_registry.get_analyzer(config).analyze(
+        text=chunk.text,
+        language=config.language,
+        entities=list(entities),
+    )
+    return [
+        RecognizerResult(result.entity_type, result.start + chunk.offset, result.end + chunk.offset, result.score)
+        for result in results
+    ]
+
+
+def merge_results(results: Iterable[RecognizerResult]) -> List[RecognizerResult]:
+    """
+    Merge entity spans from overlapping chunks.
+
+    Spans found by two chunks are reported once, and a span contained in a
+    longer span of the same type, e.g. a name cut off at a chunk edge, is dropped.
+
+    :param results: Entities from all chunks, with document offsets
+    :type results: Iterable[RecognizerResult]
+    :return: Merged entities sorted by position
+    :rtype: list[RecognizerResult]
+    """
+    merged: List[RecognizerResult] = []
+    # Sorted by start, so a span is contained in an earlier one of its type iff it ends no later
+    furthest_end: Dict[str, int] = {}
+    for result in sorted(results, key=lambda r: (r.start, -r.end, -r.score)):
+        if result.end <= furthest_end.get(result.entity_type, -1):
+            continue
+        furthest_end[result.entity_type] = result.end
+        merged.append(result)
+    return merged
+
+
+def analyze_chunked(text: str, config: PrivacyConfig, entities: Sequence[str],
+                    executor: Optional[Executor]) -> List[RecognizerResult]:
+    """
+    Analyze a long document in parallel chunks.
+
+    :param text: Document text
+    :type text: str
+    :param config: Privacy configuration with the chunking settings
+    :type config: PrivacyConfig
+    :param entities: Presidio entity types to detect
+    :type entities: Sequence[str]
+    :param executor: Executor running the chunks, typically a process pool;
+        None analyzes them one after another in this process
+    :type executor: Optional[Executor]
+    :return: Detected entities with document offsets, sorted by position
+    :rtype: list[RecognizerResult]
+    """
+    chunks = split_text(text, config.chunk_size, config.chunk_overlap)
+    if executor is None:
+        return merge_results(result for chunk in chunks for result in analyze_chunk(config, chunk, tuple(entities)))
+    futures = [executor.submit(analyze_chunk, config, chunk, tuple(entities)) for chunk in chunks]
+    return merge_results(result for future in futures for result in future.result())
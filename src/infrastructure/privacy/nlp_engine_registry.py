@@ -0,0 +1,117 @@
+"""
+Process-wide registry of Presidio engines.
+
+Building an ``AnalyzerEngine`` loads a full spaCy model, which takes seconds and
+hundreds of MB of memory. Engines are therefore created lazily, once per model
+and language, and shared by every ``PrivacyService`` in the process. The same
+applies to the worker pools used for chunked analysis of long documents.
+"""
+
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from presidio_analyzer import AnalyzerEngine
+from presidio_analyzer.nlp_engine import NlpEngineProvider
+
+from src.core.domain.config import PrivacyConfig
+
+logger = logging.getLogger(__name__)
+
+_analyzers: Dict[Tuple[str, str], AnalyzerEngine] = {}
+_worker_pools: Dict[Tuple[str, str, Optional[int]], ProcessPoolExecutor] = {}
+_lock = threading.Lock()
+# Set in processes started by a pool of this module, which must not start pools of their own
+_in_worker = False
+
+
+def get_analyzer(config: PrivacyConfig) -> AnalyzerEngine:
+    """
+    Get the shared analyzer engine for the configured spaCy model, loading it on first use.
+
+    :param config: Privacy configuration selecting the model and language
+    :type config: PrivacyConfig
+    :return: Shared analyzer engine
+    :rtype: AnalyzerEngine
+    """
+    key = (config.nlp_model, config.language)
+    analyzer = _analyzers.get(key)
+    if analyzer is not None:
+        return analyzer
+
+    with _lock:
+        # Another thread may have loaded the engine while we waited for the lock
+        if key not in _analyzers:
+            logger.info(f"Loading NLP engine with model {config.nlp_model}")
+            nlp_engine = NlpEngineProvider(nlp_configuration={
+                "nlp_engine_name": "spacy",
+                "models": [{"lang_code": config.language, "model_name": config.nlp_model}],
+            }).create_engine()
+            _analyzers[key] = AnalyzerEngine(
+                nlp_engine=nlp_engine,
+                supported_languages=[config.language],
+            )
+        return _analyzers[key]
+
+
+def warm_up(config: Optional[PrivacyConfig] = None) -> None:
+    """
+    Load the engines and run one analysis so the first real request is not slowed down.
+
+    Intended to be called at worker start, including as a process pool initializer.
+
+    :param config: Privacy configuration, defaults to PrivacyConfig()
+    :type config: Optional[PrivacyConfig]
+    """
+    config = config or PrivacyConfig()
+    get_analyzer(config).analyze(text="Warm up", language=config.language)
+
+
+def init_worker(config: Optional[PrivacyConfig] = None) -> None:
+    """
+    Process pool initializer: mark the process as a worker and warm up its engines.
+
+    :param config: Privacy configuration, defaults to PrivacyConfig()
+    :type config: Optional[PrivacyConfig]
+    """
+    global _in_worker
+    _in_worker = True
+    warm_up(config)
+
+
+def get_worker_pool(config: PrivacyConfig) -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared process pool for chunked analysis, starting it on first use.
+
+    Each worker loads the analyzer once at start-up. Inside a pool worker there
+    is no pool, since nested pools multiply the processes, each loading spaCy,
+    and are never shut down.
+
+    :param config: Privacy configuration selecting the model, language and number of workers
+    :type config: PrivacyConfig
+    :return: Shared process pool, or None inside a pool worker
+    :rtype: Optional[ProcessPoolExecutor]
+    """
+    if _in_worker:
+        return None
+    key = (config.nlp_model, config.language, config.chunk_workers)
+    with _lock:
+        if key not in _worker_pools:
+            logger.info(f"Starting NER worker pool for model {config.nlp_model}")
+            _worker_pools[key] = ProcessPoolExecutor(
+                max_workers=config.chunk_workers,
+                initializer=init_worker,
+                initargs=(config,),
+            )
+        return _worker_pools[key]
+
+
+def reset() -> None:
+    """Drop all loaded engines and shut down worker pools, e.g. to free memory or in tests."""
+    with _lock:
+        _analyzers.clear()
+        pools = list(_worker_pools.values())
+        _worker_pools.clear()
+    for pool in pools:
+        pool.shutdown()
@@ -0,0 +1,224 @@
+"""
+Compiled pattern recognisers for CV text: a single-pass scanner for emails and
+professional profile URLs, plus phone number and contact name heuristics.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+import itertools
+import re
+from typing import Iterable, Iterator, List, Literal, Optional, Tuple
+
+DEFAULT_PROFESSIONAL_DOMAINS = (
+    "linkedin",
+    "github",
+    "gitlab",
+    "stackoverflow",
+    "behance",
+    "dribbble",
+    "medium",
+    "kaggle",
+)
+
+EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9.-]+\s*\.[A-Z|a-z]{2,}\b'
+# Same matches as EMAIL_PATTERN, without backtracking through the local part
+_SCAN_EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]++\s*+@\s*+[A-Za-z0-9.-]+\s*\.[A-Z|a-z]{2,}\b'
+URL_PATTERN = r"https?://(?:www\.)?(?P<host>[a-zA-Z0-9-]+(?:\.[a-zA-Z0-9-]+)+)(?:/[^\s]*)?"
+
+MatchKind = Literal["email", "professional_url", "url", "phone", "person"]
+
+# Every email contains "@" and every URL or domain reference contains "/"
+_ANCHOR_RE = re.compile(r"[@/]")
+
+# Optional country code, then three digit groups, e.g. (555) 123-4567 or +44 20 7946 0958
+_PHONE_RE = re.compile(
+    r"(?<![\w+])(?:\+\d{1,3}[\s.-]?)?(?:\(\d{2,4}\)|\d{2,4})[\s.-]?\d{3,4}[\s.-]?\d{3,4}(?!\w)"
+)
+PHONE_MIN_DIGITS = 9
+PHONE_MAX_DIGITS = 15
+
+# Header lines that are document titles rather than the candidate's name
+_HEADER_TITLE_WORDS = frozenset({"resume", "résumé", "cv", "curriculum", "vitae", "profile", "contact"})
+_NAME_TOKEN_RE = re.compile(r"[A-ZÀ-Þ][A-Za-zÀ-ÿ'.-]*")
+CONTACT_HEADER_LINES = 5
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    """A span of text found by the scanner."""
+    kind: MatchKind
+    start: int
+    end: int
+    text: str
+
+
+class PatternScanner:
+    """
+    Finds emails, URLs and professional profile references in one regex pass.
+
+    All patterns are combined into a single compiled alternation, which is only
+    run over the lines around an ``@`` or ``/`` (plus one line either side, since
+    emails may wrap). Most CV lines contain neither and are skipped without
+    evaluating the alternation. Whether a URL points to a professional site is
+    decided by looking up its host labels in a set, so the cost does not grow
+    with the number of professional domains.
+
+    :param professional_domains: Site names whose profile links should be preserved
+    :type professional_domains: Iterable[str]
+    """
+    def __init__(self, professional_domains: Iterable[str] = DEFAULT_PROFESSIONAL_DOMAINS):
+        self.professional_domains = frozenset(domain.lower() for domain in professional_domains)
+        domain_alternation = "|".join(
+            re.escape(domain) for domain in sorted(self.professional_domains, key=len, reverse=True)
+        )
+        # Domain references such as github/username or linkedin.com/in/username
+        domain_ref_pattern = rf"(?:(?<=\s)|^)(?:{domain_alternation})(?:\.com)?/\S+"
+        self._pattern = re.compile(
+            rf"(?P<email>{_SCAN_EMAIL_PATTERN})|(?P<url>{URL_PATTERN})|(?P<ref>{domain_ref_pattern})",
+            re.IGNORECASE | re.MULTILINE,
+        )
+
+    def scan(self, text: str) -> List[PatternMatch]:
+        """
+        Find all email, URL and professional reference spans in the text.
+
+        :param text: Text to scan
+        :type text: str
+        :return: Non-overlapping matches in order of appearance
+        :rtype: list[PatternMatch]
+        """
+        matches = []
+        for start, end in self._candidate_regions(text):
+            for match in self._pattern.finditer(text, start, end):
+                if match.lastgroup == "email":
+                    kind = "email"
+                elif match.lastgroup == "ref" or self._is_professional_host(match.group("host")):
+                    kind = "professional_url"
+                else:
+                    kind = "url"
+                matches.append(PatternMatch(kind, match.start(), match.end(), match.group(0)))
+        return matches
+
+    @staticmethod
+    def _candidate_regions(text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Yield non-overlapping line ranges that may contain a match.
+
+        Each region spans the line containing an anchor character plus the
+        preceding and following line.
+
+        :param text: Text to scan
+        :type text: str
+        :return: Iterator of (start, end) offsets in ascending order
+        :rtype: Iterator[tuple[int, int]]
+        """
+        region_end = 0
+        for anchor in _ANCHOR_RE.finditer(text):
+            position = anchor.start()
+            if position < region_end:
+                continue
+
+            line_start = text.rfind("\n", 0, position)
+            region_start = text.rfind("\n", 0, line_start) + 1 if line_start > 0 else 0
+
+            line_end = text.find("\n", position)
+            next_line_end = text.find("\n", line_end + 1) if line_end != -1 else -1
+            new_region_end = len(text) if next_line_end == -1 else next_line_end
+
+            yield max(region_start, region_end), new_region_end
+            region_end = new_region_end
+
+    def _is_professional_host(self, host: str) -> bool:
+        """
+        Check whether any label of the host is a professional domain.
+
+        :param host: Host name of a URL, e.g. ``www.linkedin.com``
+        :type host: str
+        :return: True if the host belongs to a professional site
+        :rtype: bool
+        """
+        return not self.professional_domains.isdisjoint(host.lower().split("."))
+
+
+def find_phone_numbers(text: str) -> List[PatternMatch]:
+    """
+    Find phone numbers with a compiled pattern instead of NER.
+
+    Candidates with fewer than 9 or more than 15 digits are discarded, which
+    rules out years, date ranges and most identifiers.
+
+    :param text: Text to scan
+    :type text: str
+    :return: Phone number matches in order of appearance
+    :rtype: list[PatternMatch]
+    """
+    matches = []
+    for match in _PHONE_RE.finditer(text):
+        digits = sum(char.isdigit() for char in match.group(0))
+        if PHONE_MIN_DIGITS <= digits <= PHONE_MAX_DIGITS:
+            matches.append(PatternMatch("phone", match.start(), match.end(), match.group(0)))
+    return matches
+
+
+def find_contact_name(text: str, header_lines: int = CONTACT_HEADER_LINES) -> Optional[str]:
+    """
+    Guess the candidate's name from the document header.
+
+    CVs almost always open with the candidate's name on a line of its own. The
+    first of the leading non-empty lines made of two to four capitalised words,
+    without digits or contact details, is taken as the name.
+
+    :param text: CV text
+    :type text: str
+    :param header_lines: Number of leading non-empty lines to inspect
+    :type header_lines: int
+    :return: The name line, or None if no line looks like a name
+    :rtype: Optional[str]
+    """
+    lines = (line.strip() for line in text.splitlines())
+    for line in itertools.islice((line for line in lines if line), header_lines):
+        tokens = line.split()
+        if not 2 <= len(tokens) <= 4:
+            continue
+        if any(token.lower().strip(".,:") in _HEADER_TITLE_WORDS for token in tokens):
+            continue
+        if all(_NAME_TOKEN_RE.fullmatch(token) for token in tokens):
+            return line
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_scanner(professional_domains: tuple = DEFAULT_PROFESSIONAL_DOMAINS) -> PatternScanner:
+    """
+    Get a shared scanner for the given professional domains.
+
+    :param professional_domains: Site names whose profile links should be preserved
+    :type professional_domains: tuple
+    :return: Compiled scanner
+    :rtype: PatternScanner
+    """
+    return PatternScanner(professional_domains)
+
+
+if __name__ == "__main__":
+    import timeit
+    from tests.fixtures.resumes import create_bruce_wayne_resume
+
+    resume = create_bruce_wayne_resume()
+    cv_text = "\n".join([
+        resume.contact_info.name,
+        resume.contact_info.email,
+        resume.contact_info.phone,
+        "https://www.linkedin.com/in/brucewayne github/not-batman https://wayne.example.com/about",
+        resume.summary,
+        *(line for exp in resume.experiences for line in exp.description + exp.achievements),
+        *resume.publications,
+    ])
+
+    scanner = get_scanner()
+    for repeat in (1, 10, 100):
+        text = "\n".join([cv_text] * repeat)
+        runs = 200 // repeat or 1
+        seconds = timeit.timeit(lambda: scanner.scan(text), number=runs) / runs
+        print(f"{len(text):>8} chars: {seconds * 1000:8.3f} ms/doc, "
+              f"{len(text) / seconds / 1e6:6.1f} M chars/s, {len(scanner.scan(text))} matches")
@@ -1,146 +1,320 @@
 from src.core.ports.secondary.privacy_filter import BasePrivacyFilter
-from presidio_analyzer import AnalyzerEngine
-from presidio_anonymizer import AnonymizerEngine
-from presidio_anonymizer.entities import OperatorConfig
+from src.core.domain.config import PrivacyConfig
+from src.infrastructure.privacy import nlp_engine_registry
+from src.infrastructure.privacy.chunked_analysis import analyze_chunked
+from src.infrastructure.privacy.pattern_scanner import (
+    DEFAULT_PROFESSIONAL_DOMAINS,
+    PatternMatch,
+    PatternScanner,
+    find_contact_name,
+    find_phone_numbers,
+    get_scanner,
+)
+from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine, RecognizerResult
+from bisect import bisect_right
+from functools import lru_cache
 import re
-from typing import Dict, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Presidio entity types detected by NER, and the span kinds they map to
+PII_ENTITIES = {"PERSON": "person", "PHONE_NUMBER": "phone"}
+PLACEHOLDER_LABELS = {"person": "PERSON", "phone": "PHONE", "email": "EMAIL"}
 
 
 class PrivacyService(BasePrivacyFilter):
-    def __init__(self):
-        self.analyzer = AnalyzerEngine()
-        self.anonymizer = AnonymizerEngine()
-        self.email_pattern = r'\b[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9.-]+\s*\.[A-Z|a-z]{2,}\b'
-
-        self.professional_domains = [
-            "linkedin",
-            "github",
-            "gitlab",
-            "stackoverflow",
-            "behance",
-            "dribbble",
-            "medium",
-            "kaggle",
-        ]
+    """
+    Presidio implementation of CV anonymization.
+
+    The NLP engines are shared across instances and only loaded on first use.
+    In ``fast`` mode NER is skipped entirely and names and phone numbers are
+    found with compiled patterns, trading recall outside the contact block for
+    microsecond latency. Documents longer than ``config.chunk_size`` are
+    analyzed in overlapping chunks on a shared pool of worker processes.
+
+    :param config: Configuration selecting the spaCy model and language
+    :type config: Optional[PrivacyConfig]
+    """
+    def __init__(self, config: Optional[PrivacyConfig] = None):
+        self.config = config or PrivacyConfig()
+        self.professional_domains = list(DEFAULT_PROFESSIONAL_DOMAINS)
+
+    @property
+    def analyzer(self) -> AnalyzerEngine:
+        """Shared analyzer engine for the configured model."""
+        return nlp_engine_registry.get_analyzer(self.config)
+
+    @property
+    def scanner(self) -> PatternScanner:
+        """Shared compiled scanner for the current professional domains."""
+        return get_scanner(tuple(self.professional_domains))
+
+    def warm_up(self) -> None:
+        """Load the NLP engines ahead of the first request."""
+        if self.config.mode == "fast":
+            return
+        nlp_engine_registry.warm_up(self.config)
 
-    def _clean_and_normalize_email(self, email: str) -> str:
-        """Clean and normalize email addresses for consistent processing.
+    def anonymize_cv(self, text: str) -> str:
+        """Anonymize CV text while preserving professional URLs.
         
-        :param email: Raw email string that might contain whitespace or irregular formatting
-        :type email: str
-        :return: Cleaned and normalized email string
+        :param text: Original CV text
+        :type text: str
+        :return: Anonymized CV text with preserved professional URLs
         :rtype: str
         """
-        email = re.sub(r'\s+', '', email)  # Remove all whitespace
-        email = email.lower()
-        email = re.sub(r'(\+[^@]*)@', '@', email)  # Remove any characters after '+' in local part
-        return email
+        return self._apply(text, self._detect(text), self._masking_replacer())
+
+    def anonymize_many(self, texts: Iterable[str],
+                       batch_size: Optional[int] = None,
+                       n_process: Optional[int] = None) -> List[str]:
+        """Anonymize many CV texts with a single batched NLP pass.
+        
+        Runs NER over all documents through spaCy's ``nlp.pipe`` (via Presidio's
+        batch analyzer) instead of one document at a time, then applies the same
+        email and URL handling as :meth:`anonymize_cv` per document.
+        
+        :param texts: Original CV texts
+        :type texts: Iterable[str]
+        :param batch_size: Number of documents per spaCy batch, defaults to the configured value
+        :type batch_size: Optional[int]
+        :param n_process: Number of spaCy worker processes, defaults to the configured value
+        :type n_process: Optional[int]
+        :return: Anonymized CV texts in input order
+        :rtype: list[str]
+        """
+        texts = list(texts)
+        if self.config.mode == "fast" or not texts:
+            return [self.anonymize_cv(text) for text in texts]
+
+        batch_results = BatchAnalyzerEngine(analyzer_engine=self.analyzer).analyze_iterator(
+            texts=texts,
+            language=self.config.language,
+            batch_size=batch_size or self.config.batch_size,
+            n_process=n_process or self.config.n_process,
+            entities=list(PII_ENTITIES),
+        )
 
-    def _process_emails(self, text: str) -> Tuple[str, Dict[str, str]]:
-        """Extract and process emails, returning the masked text and email mapping.
+        return [
+            self._apply(text, self._select_spans(self.scanner.scan(text), self._to_spans(text, results)),
+                        self._masking_replacer())
+            for text, results in zip(texts, batch_results)
+        ]
+
+    def anonymize_text(self, text: str) -> Tuple[str, Dict[str, str]]:
+        """Reversibly anonymize text, e.g. before sending it to an LLM.
+        
+        Every distinct name, phone number and email is replaced by its own
+        placeholder such as ``<PERSON_0>``; repeated occurrences of exactly the
+        same text share a placeholder, while other spellings of a value get
+        their own, so ``restore_text`` reproduces the input exactly.
+        Placeholders never collide with text that is already present in the input.
         
-        :param text: Input text containing email addresses
+        :param text: Text to anonymize
         :type text: str
-        :return: Tuple containing (masked text, dictionary of email mappings)
+        :return: Tuple of (anonymized text, mapping of placeholders to original values)
         :rtype: tuple[str, dict[str, str]]
         """
-        email_mapping = {}
-        
-        def replace_email(match):
-            potential_email = match.group(0)
-            cleaned_email = self._clean_and_normalize_email(potential_email)
-            placeholder = f"<EMAIL_{len(email_mapping)}>"
-            email_mapping[placeholder] = cleaned_email
-            return placeholder
+        replacement_map: Dict[str, str] = {}
+        placeholders: Dict[Tuple[str, str], str] = {}
+        counters = dict.fromkeys(PLACEHOLDER_LABELS, 0)
 
-        masked_text = re.sub(self.email_pattern, replace_email, text)
-        return masked_text, email_mapping
+        def replace(span: PatternMatch) -> Optional[str]:
+            if span.kind not in PLACEHOLDER_LABELS:
+                return None
+            # Keyed on the exact text, so that every spelling is restored as written
+            key = (span.kind, span.text)
+            if key not in placeholders:
+                placeholder = self._next_placeholder(span.kind, counters, text)
+                placeholders[key] = placeholder
+                replacement_map[placeholder] = span.text
+            return placeholders[key]
 
-    def anonymize_cv(self, text: str) -> str:
-        """Anonymize CV text while preserving professional URLs.
+        return self._apply(text, self._detect(text), replace), replacement_map
+
+    def restore_text(self, text: str, replacement_map: Dict[str, str]) -> str:
+        """Restore anonymized text using the replacement mapping.
         
-        :param text: Original CV text
+        All placeholders are replaced in a single pass with one compiled
+        alternation, so the cost is linear in the text length regardless of the
+        number of placeholders.
+        
+        :param text: Anonymized text
         :type text: str
-        :return: Anonymized CV text with preserved professional URLs
+        :param replacement_map: Mapping of placeholders to original values
+        :type replacement_map: dict[str, str]
+        :return: Restored text
         :rtype: str
         """
-        # Step 1: Extract and save professional URLs
-        professional_urls = self._extract_professional_urls(text)
+        if not replacement_map or not text:
+            return text
+        pattern = _compile_placeholder_pattern(tuple(replacement_map))
+        return pattern.sub(lambda match: replacement_map[match.group(0)], text)
 
-        # Step 2: Process emails with custom handling
-        text, email_mapping = self._process_emails(text)
-
-        # Step 3: Detect remaining PII entities
-        results = self.analyzer.analyze(
-            text=text,
-            language="en",
-            entities=["PERSON", "PHONE_NUMBER"],
-        )
+    def _detect(self, text: str) -> List[PatternMatch]:
+        """Find the spans to anonymize or protect in a single document.
+        
+        :param text: Original text
+        :type text: str
+        :return: Non-overlapping spans sorted by position
+        :rtype: list[PatternMatch]
+        """
+        protected = self.scanner.scan(text)
+        if self.config.mode == "fast":
+            candidates = find_phone_numbers(text)
+            if name := find_contact_name(text):
+                pattern = re.compile(rf"(?<!\w){re.escape(name)}(?!\w)", re.IGNORECASE)
+                candidates.extend(
+                    PatternMatch("person", match.start(), match.end(), match.group(0))
+                    for match in pattern.finditer(text)
+                )
+        else:
+            candidates = self._to_spans(text, self._analyze(text))
+        return self._select_spans(protected, candidates)
 
-        # Step 4: Anonymize the CV text
-        anonymized_result = self.anonymizer.anonymize(
+    def _analyze(self, text: str) -> List[RecognizerResult]:
+        """Run NER, splitting documents longer than the chunk size across worker processes.
+        
+        Inside a worker process, e.g. of the anonymization stage, the chunks
+        are analyzed inline rather than in a nested pool.
+        
+        :param text: Original text
+        :type text: str
+        :return: Detected entities
+        :rtype: list[RecognizerResult]
+        """
+        if self.config.chunk_size and len(text) > self.config.chunk_size:
+            return analyze_chunked(text, self.config, list(PII_ENTITIES),
+                                   nlp_engine_registry.get_worker_pool(self.config))
+        return self.analyzer.analyze(
             text=text,
-            analyzer_results=results,
-            operators={
-                "PERSON": OperatorConfig("replace", {"new_value": "<PERSON>"}),
-                "PHONE_NUMBER": OperatorConfig("replace", {"new_value": "<PHONE>"}),
-            },
+            language=self.config.language,
+            entities=list(PII_ENTITIES),
         )
 
-        # Step 5: Restore professional URLs
-        final_text = self._restore_professional_urls(
-            anonymized_result.text, professional_urls
-        )
+    @staticmethod
+    def _to_spans(text: str, results: List[RecognizerResult]) -> List[PatternMatch]:
+        """Convert analyzer results into spans.
+        
+        :param text: Analyzed text
+        :type text: str
+        :param results: Entities detected by the analyzer
+        :type results: list[RecognizerResult]
+        :return: Spans for the detected entities
+        :rtype: list[PatternMatch]
+        """
+        return [
+            PatternMatch(PII_ENTITIES[result.entity_type], result.start, result.end,
+                         text[result.start:result.end])
+            for result in results
+            if result.entity_type in PII_ENTITIES
+        ]
 
-        return final_text
+    @staticmethod
+    def _select_spans(protected: List[PatternMatch],
+                      candidates: List[PatternMatch]) -> List[PatternMatch]:
+        """Merge protected spans with candidate PII spans, dropping overlaps.
+        
+        Protected spans (emails and URLs) always win. Among overlapping
+        candidates the earliest, then longest, is kept.
+        
+        :param protected: Non-overlapping spans from the pattern scanner, sorted by position
+        :type protected: list[PatternMatch]
+        :param candidates: Spans found by NER or pattern recognisers
+        :type candidates: list[PatternMatch]
+        :return: Non-overlapping spans sorted by position
+        :rtype: list[PatternMatch]
+        """
+        starts = [span.start for span in protected]
+        selected = list(protected)
+        last_end = -1
+        for span in sorted(candidates, key=lambda span: (span.start, -span.end)):
+            if span.start < last_end:
+                continue
+            index = bisect_right(starts, span.start)
+            if index and protected[index - 1].end > span.start:
+                continue
+            if index < len(protected) and protected[index].start < span.end:
+                continue
+            selected.append(span)
+            last_end = span.end
+        return sorted(selected, key=lambda span: span.start)
 
-    def _extract_professional_urls(self, text: str) -> Dict[str, str]:
-        """Extract professional URLs and domain references to preserve them.
+    @staticmethod
+    def _apply(text: str, spans: List[PatternMatch],
+               replace: Callable[[PatternMatch], Optional[str]]) -> str:
+        """Build the output text in a single pass over sorted, non-overlapping spans.
         
-        :param text: Input text containing URLs and domain references
+        :param text: Original text
         :type text: str
-        :return: Dictionary mapping placeholders to original URLs/references
-        :rtype: dict[str, str]
+        :param spans: Spans sorted by position
+        :type spans: list[PatternMatch]
+        :param replace: Returns the replacement for a span, or None to keep it unchanged
+        :type replace: Callable[[PatternMatch], Optional[str]]
+        :return: Text with replacements applied
+        :rtype: str
         """
-        urls = {}
-        # Pattern for full URLs
-        url_pattern = (
-            r"https?://(?:www\.)?([a-zA-Z0-9-]+(?:\.[a-zA-Z0-9-]+)+)(?:/[^\s]*)?"
-        )
-        # Pattern for domain references (e.g., github/username or linkedin/in/username)
-        domain_ref_pattern = (
-            r"(?:(?:^|\s)(?:"
-            + "|".join(self.professional_domains)
-            + r")\/\S+|(?:^|\s)(?:"
-            + "|".join(self.professional_domains)
-            + r")\.com\/\S+)"
-        )
-        # Extract full URLs
-        for match in re.finditer(url_pattern, text):
-            url = match.group(0)
-            if any(domain in url.lower() for domain in self.professional_domains):
-                placeholder = f"<PROF_URL_{len(urls)}>"
-                urls[placeholder] = url
+        parts = []
+        last_end = 0
+        for span in spans:
+            replacement = replace(span)
+            if replacement is None:
+                continue
+            parts.append(text[last_end:span.start])
+            parts.append(replacement)
+            last_end = span.end
+        parts.append(text[last_end:])
+        return "".join(parts)
 
-        # Extract domain references
-        for match in re.finditer(domain_ref_pattern, text, re.IGNORECASE):
-            ref = match.group(0).strip()
-            placeholder = f"<PROF_URL_{len(urls)}>"
-            urls[placeholder] = ref
+    @staticmethod
+    def _masking_replacer() -> Callable[[PatternMatch], Optional[str]]:
+        """Create the replacer used by :meth:`anonymize_cv`.
+        
+        Emails are numbered in order of appearance; names and phone numbers are
+        replaced by a fixed tag; URLs are kept.
+        
+        :return: Replacement function for a single document
+        :rtype: Callable[[PatternMatch], Optional[str]]
+        """
+        email_count = 0
 
-        return urls
+        def replace(span: PatternMatch) -> Optional[str]:
+            nonlocal email_count
+            if span.kind == "email":
+                email_count += 1
+                return f"<EMAIL_{email_count - 1}>"
+            if span.kind in PLACEHOLDER_LABELS:
+                return f"<{PLACEHOLDER_LABELS[span.kind]}>"
+            return None
 
-    def _restore_professional_urls(self, text: str, urls: Dict[str, str]) -> str:
-        """Restore professional URLs after anonymization.
+        return replace
+
+    @staticmethod
+    def _next_placeholder(kind: str, counters: Dict[str, int], text: str) -> str:
+        """Allocate the next placeholder for a kind that does not occur in the text.
         
-        :param text: Anonymized text with URL placeholders
+        :param kind: Span kind, e.g. ``person``
+        :type kind: str
+        :param counters: Next index per kind, updated in place
+        :type counters: dict[str, int]
+        :param text: Original text the placeholder must not collide with
         :type text: str
-        :param urls: Dictionary mapping placeholders to original URLs
-        :type urls: dict[str, str]
-        :return: Text with restored professional URLs
+        :return: Unique placeholder
         :rtype: str
         """
-        restored_text = text
-        for placeholder, url in urls.items():
-            restored_text = restored_text.replace("<URL>", url, 1)
-        return restored_text
+        while True:
+            placeholder = f"<{PLACEHOLDER_LABELS[kind]}_{counters[kind]}>"
+            counters[kind] += 1
+            if placeholder not in text:
+                return placeholder
+
+
+@lru_cache(maxsize=128)
+def _compile_placeholder_pattern(placeholders: Tuple[str, ...]) -> re.Pattern:
+    """Compile one alternation matching any of the placeholders.
+    
+    :param placeholders: Placeholders to match
+    :type placeholders: tuple[str, ...]
+    :return: Compiled pattern, longest placeholders first
+    :rtype: re.Pattern
+    """
+    return re.compile("|".join(re.escape(p) for p in sorted(placeholders, key=len, reverse=True)))
@@ -0,0 +1,215 @@
+"""
+SQLite FTS5 directory of known companies, usable offline instead of web search.
+"""
+
+import csv
+import json
+import logging
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from src.core.domain.company_names import CompanyNameIndex
+from src.core.domain.company_search import CompanyInfo
+from src.core.ports.secondary.company_directory import CompanyDirectory
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Record fields indexed for full-text search, besides the names
+_TEXT_FIELDS = ("description", "industry", "location")
+
+
+class SQLiteCompanyDirectory(CompanyDirectory):
+    """
+    Stores company records in SQLite with an FTS5 index over their text.
+
+    Exact lookups go through a table of normalized names and aliases, so
+    "Google LLC" finds the record of "Google". Free-text searches are ranked
+    with BM25. Records are bulk loaded from CSV or JSONL files with the
+    CompanyInfo fields as columns, plus an optional ``aliases`` column
+    (a list in JSONL, separated by ``;`` in CSV).
+
+    :param db_path: Path of the SQLite database file, ``:memory:`` for a temporary directory
+    :type db_path: Path
+    """
+    def __init__(self, db_path: Path):
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS companies (id INTEGER PRIMARY KEY, key TEXT UNIQUE NOT NULL, payload TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS company_names (name TEXT PRIMARY KEY, company_id INTEGER NOT NULL);"
+            "CREATE VIRTUAL TABLE IF NOT EXISTS company_text USING fts5(name, aliases, description, industry, location);"
+        )
+
+    def add_records(self, records: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Insert or replace company records in a single transaction.
+
+        :param records: Records with the CompanyInfo fields and optional ``aliases``
+        :type records: Iterable[Mapping[str, Any]]
+        :return: Number of records stored
+        :rtype: int
+        """
+        count = 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for record in records:
+                    if self._add_record(record):
+                        count += 1
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        logger.info(f"Loaded {count} companies into the local directory")
+        return count
+
+    def _add_record(self, record: Mapping[str, Any]) -> bool:
+        aliases = record.get("aliases") or []
+        if isinstance(aliases, str):
+            aliases = aliases.split(";")
+        aliases = [alias.strip() for alias in aliases if alias and alias.strip()]
+        try:
+            # Empty CSV cells mean unknown
+            company_info = CompanyInfo.model_validate(
+                {field: value for field, value in record.items() if field != "aliases" and value != ""}
+            )
+        except ValueError as e:
+            logger.warning(f"Skipping invalid company record {dict(record)}: {str(e)}")
+            return False
+
+        key = CompanyNameIndex.normalize(company_info.name)
+        row = self._conn.execute("SELECT id FROM companies WHERE key = ?", (key,)).fetchone()
+        if row:
+            company_id = row[0]
+            self._conn.execute("UPDATE companies SET payload = ? WHERE id = ?", (company_info.model_dump_json(), company_id))
+            self._conn.execute("DELETE FROM company_text WHERE rowid = ?", (company_id,))
+        else:
+            company_id = self._conn.execute(
+                "INSERT INTO companies (key, payload) VALUES (?, ?)", (key, company_info.model_dump_json())
+            ).lastrowid
+
+        self._conn.execute(
+            "INSERT INTO company_text (rowid, name, aliases, description, industry, location) VALUES (?, ?, ?, ?, ?, ?)",
+            (company_id, company_info.name, " ".join(aliases),
+             *(getattr(company_info, field) or "" for field in _TEXT_FIELDS)),
+        )
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO company_names (name, company_id) VALUES (?, ?)",
+            [(name, company_id) for name in {key, *(CompanyNameIndex.normalize(alias) for alias in aliases)} if name],
+        )
+        return True
+
+    def load_csv(self, path: Path) -> int:
+        """
+        Bulk load company records from a CSV file with a header row.
+
+        :param path: Path of the CSV file
+        :type path: Path
+        :return: Number of records stored
+        :rtype: int
+        """
+        with open(path, newline="", encoding="utf-8") as file:
+            return self.add_records(csv.DictReader(file))
+
+    def load_jsonl(self, path: Path) -> int:
+        """
+        Bulk load company records from a file with one JSON object per line.
+
+        :param path: Path of the JSONL file
+        :type path: Path
+        :return: Number of records stored
+        :rtype: int
+        """
+        with open(path, encoding="utf-8") as file:
+            return self.add_records(json.loads(line) for line in file if line.strip())
+
+    def load(self, path: Path) -> int:
+        """
+        Bulk load company records from a ``.csv`` or ``.jsonl`` file.
+
+        :param path: Path of the file
+        :type path: Path
+        :return: Number of records stored
+        :rtype: int
+        """
+        suffix = Path(path).suffix.lower()
+        if suffix == ".csv":
+            return self.load_csv(path)
+        if suffix in (".jsonl", ".ndjson"):
+            return self.load_jsonl(path)
+        raise ValueError(f"Unsupported company records file: {path}")
+
+    def lookup(self, company_name: str) -> Optional[CompanyInfo]:
+        """
+        Get a company by its name or one of its aliases.
+
+        :param company_name: Company name as written
+        :type company_name: str
+        :return: Company information, or None if the company is not in the directory
+        :rtype: Optional[CompanyInfo]
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM companies JOIN company_names ON companies.id = company_names.company_id "
+                "WHERE company_names.name = ?",
+                (CompanyNameIndex.normalize(company_name),),
+            ).fetchone()
+        return CompanyInfo.model_validate_json(row[0]) if row else None
+
+    def search(self, query: str, max_results: int = 3) -> List[Dict[str, Any]]:
+        """
+        Full-text search of the directory, ranked with BM25.
+
+        :param query: Free-text query; any of its words may match
+        :type query: str
+        :param max_results: Maximum number of results
+        :type max_results: int
+        :return: Results in the format of the Tavily search tool, best first
+        :rtype: List[Dict[str, Any]]
+        """
+        tokens = _TOKEN_RE.findall(query)
+        if not tokens:
+            return []
+        # Quoted so that words like AND or NEAR are not read as FTS5 operators
+        match = " OR ".join(f'"{token}"' for token in dict.fromkeys(tokens))
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT companies.payload, -bm25(company_text, 10.0, 10.0) AS relevance FROM company_text "
+                "JOIN companies ON companies.id = company_text.rowid "
+                "WHERE company_text MATCH ? ORDER BY relevance DESC LIMIT ?",
+                (match, max_results),
+            ).fetchall()
+
+        results = []
+        for payload, relevance in rows:
+            company_info = CompanyInfo.model_validate_json(payload)
+            results.append({
+                "title": company_info.name,
+                "url": company_info.website or f"local://companies/{CompanyNameIndex.normalize(company_info.name)}",
+                "content": _describe(company_info),
+                "score": round(relevance / (1 + relevance), 4),
+            })
+        return results
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _describe(company_info: CompanyInfo) -> str:
+    """Render a company record as the text snippet of a search result."""
+    return " ".join(
+        f"{field.replace('_', ' ').capitalize()}: {value}."
+        for field, value in company_info.model_dump().items()
+        if value is not None
+    )
@@ -1,6 +1,10 @@
-from typing import Any
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Dict, Hashable, Optional, Tuple
+import hashlib
 import logging
-from jinja2 import Environment, FileSystemLoader
+import time
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, meta
 import jinja2
 
 from src.core.ports.secondary.template_service import TemplateService
@@ -9,6 +13,12 @@ from src.infrastructure.template.exceptions import TemplateNotFoundError, Templa
 
 logger = logging.getLogger(__name__)
 
+# Context values of these types render deterministically and can key the render cache
+_CACHEABLE_TYPES = (str, int, float, bool, type(None), Enum)
+
+class _Uncacheable(Exception):
+    """Raised when a render context contains values that cannot key the render cache"""
+
 class JinjaTemplateService(TemplateService):
     """
     Jinja implementation of the template service.
@@ -32,8 +42,56 @@ class JinjaTemplateService(TemplateService):
                 encoding=config.default_encoding
             ),
             enable_async=False,
-            auto_reload=config.auto_reload
+            auto_reload=config.auto_reload,
+            bytecode_cache=self._create_bytecode_cache(config)
         )
+        self._render_cache_enabled = config.cache_enabled
+        self._render_cache_ttl = config.cache_ttl
+        self._render_cache_size = config.render_cache_size
+        self._render_cache: OrderedDict[Hashable, Tuple[float, str]] = OrderedDict()
+        self._auto_reload = config.auto_reload
+        self._fingerprints: Dict[str, str] = {}
+
+        if config.precompile:
+            self.precompile_templates()
+
+    @staticmethod
+    def _create_bytecode_cache(config: TemplateConfig) -> Optional[FileSystemBytecodeCache]:
+        """
+        Create the persistent bytecode cache if caching is enabled.
+        
+        Compiled templates are stored on disk so that new worker processes load
+        them instead of recompiling every template on first use.
+        
+        :param config: Template service configuration
+        :type config: TemplateConfig
+        :return: Bytecode cache, or None if no cache directory is configured
+        :rtype: Optional[FileSystemBytecodeCache]
+        """
+        if not config.cache_enabled or config.bytecode_cache_dir is None:
+            return None
+        config.bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+        return FileSystemBytecodeCache(directory=str(config.bytecode_cache_dir))
+
+    def precompile_templates(self) -> int:
+        """
+        Eagerly load and compile all available templates.
+        
+        Templates that fail to compile are logged and skipped so that a single
+        broken template does not prevent startup.
+        
+        :return: Number of templates compiled successfully
+        :rtype: int
+        """
+        compiled = 0
+        for template_name in self.get_template_names():
+            try:
+                self._env.get_template(template_name)
+                compiled += 1
+            except Exception as e:
+                logger.warning(f"Failed to precompile template {template_name}: {str(e)}")
+        logger.info(f"Precompiled {compiled} templates")
+        return compiled
 
     def render_prompt(self, template_name: str, **kwargs: Any) -> str:
         """
@@ -42,6 +100,11 @@ class JinjaTemplateService(TemplateService):
         Supports templates in subfolders using path notation, e.g.:
         'prompts/parsing/resume_parsing.j2'
         
+        When caching is enabled and every context value is a plain scalar (or a
+        tuple of scalars), the rendered output is memoised for ``cache_ttl``
+        seconds, so static prompts and prompts with repeated inputs are only
+        rendered once.
+        
         :param template_name: Template path relative to templates_dir
         :type template_name: str
         :param kwargs: Template context variables
@@ -51,15 +114,85 @@ class JinjaTemplateService(TemplateService):
         :raises TemplateNotFoundError: If template doesn't exist
         :raises TemplateRenderError: If rendering fails
         """
+        cache_key = self._render_cache_key(template_name, kwargs)
+        if cache_key is not None:
+            cached = self._render_cache.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._render_cache.move_to_end(cache_key)
+                return cached[1]
+
         try:
             template = self._env.get_template(template_name)
-            return template.render(**kwargs)
+            rendered = template.render(**kwargs)
         except jinja2.exceptions.TemplateNotFound as e:
             search_paths = [str(path) for path in self._env.loader.searchpath]
             raise TemplateNotFoundError(template_name, search_paths) from e
         except Exception as e:
             raise TemplateRenderError(template_name, str(e), kwargs) from e
 
+        if cache_key is not None:
+            self._store_rendered(cache_key, rendered)
+        return rendered
+
+    def clear_render_cache(self) -> None:
+        """Remove all memoised render results."""
+        self._render_cache.clear()
+
+    def _render_cache_key(self, template_name: str, context: dict) -> Optional[Hashable]:
+        """
+        Build the render cache key for a template and its context.
+        
+        :param template_name: Template path relative to templates_dir
+        :type template_name: str
+        :param context: Template context variables
+        :type context: dict
+        :return: Cache key, or None if caching is disabled or the context is not cacheable
+        :rtype: Optional[Hashable]
+        """
+        if not self._render_cache_enabled:
+            return None
+        try:
+            frozen_context = tuple(
+                (name, self._freeze_value(value)) for name, value in sorted(context.items())
+            )
+        except _Uncacheable:
+            return None
+        return template_name, frozen_context
+
+    @classmethod
+    def _freeze_value(cls, value: Any) -> Hashable:
+        """
+        Convert a context value into a hashable key component.
+        
+        The value type is part of the key because equal values of different types
+        (e.g. ``1`` and ``True``) render differently.
+        
+        :param value: Template context value
+        :type value: Any
+        :return: Hashable representation of the value
+        :rtype: Hashable
+        :raises _Uncacheable: If the value is not a scalar or tuple of scalars
+        """
+        if isinstance(value, _CACHEABLE_TYPES):
+            return type(value), value
+        if isinstance(value, tuple):
+            return tuple, tuple(cls._freeze_value(item) for item in value)
+        raise _Uncacheable()
+
+    def _store_rendered(self, cache_key: Hashable, rendered: str) -> None:
+        """
+        Store a rendered template, evicting the least recently used entry when full.
+        
+        :param cache_key: Render cache key
+        :type cache_key: Hashable
+        :param rendered: Rendered template string
+        :type rendered: str
+        """
+        self._render_cache[cache_key] = (time.monotonic() + self._render_cache_ttl, rendered)
+        self._render_cache.move_to_end(cache_key)
+        while len(self._render_cache) > self._render_cache_size:
+            self._render_cache.popitem(last=False)
+
     def get_template_names(self) -> list[str]:
         """Get list of all available templates, including those in subfolders.
         
@@ -83,6 +216,70 @@ class JinjaTemplateService(TemplateService):
             logger.warning(f"Template {template_name} is not valid")
             return False
 
+    def get_template_fingerprint(self, template_name: str) -> str:
+        """
+        Get a content fingerprint of a template and all templates it depends on.
+        
+        The fingerprint is a SHA-256 over the sources of the template and every
+        template it includes, imports or extends, so it changes whenever any part
+        of the rendered prompt's static text changes. It can be used to key caches
+        of LLM outputs on the prompt version.
+        
+        :param template_name: Template path relative to templates_dir
+        :type template_name: str
+        :return: Hex digest identifying the template version
+        :rtype: str
+        :raises TemplateNotFoundError: If the template or one of its dependencies doesn't exist
+        """
+        if not self._auto_reload and template_name in self._fingerprints:
+            return self._fingerprints[template_name]
+
+        sources = self.get_template_sources(template_name)
+        digest = hashlib.sha256()
+        for name in sorted(sources):
+            digest.update(name.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(sources[name].encode("utf-8"))
+            digest.update(b"\0")
+        fingerprint = digest.hexdigest()
+
+        if not self._auto_reload:
+            self._fingerprints[template_name] = fingerprint
+        return fingerprint
+
+    def get_template_sources(self, template_name: str) -> Dict[str, str]:
+        """
+        Collect the sources of a template and its static dependencies.
+        
+        Dependencies referenced through variables cannot be resolved statically
+        and are skipped with a warning.
+        
+        :param template_name: Template path relative to templates_dir
+        :type template_name: str
+        :return: Mapping of template names to their sources
+        :rtype: Dict[str, str]
+        :raises TemplateNotFoundError: If a template doesn't exist
+        """
+        sources: Dict[str, str] = {}
+        pending = [template_name]
+        while pending:
+            name = pending.pop()
+            if name in sources:
+                continue
+            try:
+                source, _, _ = self._env.loader.get_source(self._env, name)
+            except jinja2.exceptions.TemplateNotFound as e:
+                search_paths = [str(path) for path in self._env.loader.searchpath]
+                raise TemplateNotFoundError(name, search_paths) from e
+            sources[name] = source
+
+            for reference in meta.find_referenced_templates(self._env.parse(source)):
+                if reference is None:
+                    logger.warning(f"Template {name} has a dynamic dependency that is not fingerprinted")
+                else:
+                    pending.append(reference)
+        return sources
+
     def add_filter(self, name: str, filter_func: callable) -> None:
         """
         Add a custom filter to the template environment.
@@ -91,7 +288,9 @@ class JinjaTemplateService(TemplateService):
         :param filter_func: Filter function
         """
         self._env.filters[name] = filter_func
+        # Filters change rendered output, so memoised renders are stale
+        self.clear_render_cache()
 
 if __name__ == "__main__":
-    jinja_template_service = JinjaTemplateService(config=TemplateConfig.default())
+    jinja_template_service = JinjaTemplateService(config=TemplateConfig.production())
     print(jinja_template_service.get_template_names())
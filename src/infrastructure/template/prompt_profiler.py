@@ -0,0 +1,251 @@
+'''
+Profiles the size of rendered prompts to show which templates drive LLM latency and cost.
+'''
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+from jinja2 import Environment, nodes
+
+from src.infrastructure.template.jinja_template_service import JinjaTemplateService
+
+logger = logging.getLogger(__name__)
+
+# Fallback ratio when no tokenizer is available, typical for English prose
+CHARS_PER_TOKEN = 4
+
+# Only used to parse template sources into an AST
+_PARSER_ENV = Environment()
+
+
+@dataclass
+class ModelCostProfile:
+    """Rough input-side cost and latency characteristics of a model."""
+    model_name: str
+    input_cost_per_million_tokens: float
+    prefill_tokens_per_second: float
+    base_latency_seconds: float = 0.3
+
+    def estimate_latency(self, tokens: int) -> float:
+        """
+        Estimate the time to first token for a prompt of the given size.
+
+        :param tokens: Number of prompt tokens
+        :type tokens: int
+        :return: Estimated latency in seconds
+        :rtype: float
+        """
+        return self.base_latency_seconds + tokens / self.prefill_tokens_per_second
+
+    def estimate_cost(self, tokens: int) -> float:
+        """
+        Estimate the input cost of a prompt of the given size.
+
+        :param tokens: Number of prompt tokens
+        :type tokens: int
+        :return: Estimated cost in USD
+        :rtype: float
+        """
+        return tokens * self.input_cost_per_million_tokens / 1_000_000
+
+
+DEFAULT_COST_PROFILES = {
+    "gpt-4o": ModelCostProfile("gpt-4o", input_cost_per_million_tokens=2.50, prefill_tokens_per_second=4000),
+    "gpt-4.1-mini": ModelCostProfile("gpt-4.1-mini", input_cost_per_million_tokens=0.40, prefill_tokens_per_second=8000),
+}
+
+
+@dataclass
+class PromptProfile:
+    """Size and estimated cost of one rendered template."""
+    template_name: str
+    rendered_chars: int
+    tokens: int
+    static_chars: int
+    variable_chars: int
+    estimated_latency_seconds: float
+    estimated_cost_usd: float
+
+    @property
+    def static_share(self) -> float:
+        """Share of the rendered prompt contributed by the template's own text."""
+        if not self.rendered_chars:
+            return 0.0
+        return min(self.static_chars / self.rendered_chars, 1.0)
+
+
+class PromptProfiler:
+    """
+    Renders templates against sample contexts and measures the resulting prompts.
+
+    :param template_service: Template service used to render and inspect templates
+    :type template_service: JinjaTemplateService
+    :param cost_profile: Model characteristics used for latency and cost estimates
+    :type cost_profile: ModelCostProfile
+    """
+    def __init__(self, template_service: JinjaTemplateService,
+                 cost_profile: ModelCostProfile = DEFAULT_COST_PROFILES["gpt-4o"]):
+        self._template_service = template_service
+        self._cost_profile = cost_profile
+        self._count_tokens = self._create_token_counter(cost_profile.model_name)
+
+    @staticmethod
+    def _create_token_counter(model_name: str) -> Callable[[str], int]:
+        """
+        Create a token counter for the model, falling back to a character estimate.
+
+        :param model_name: Name of the model whose tokenizer should be used
+        :type model_name: str
+        :return: Function returning the number of tokens in a text
+        :rtype: Callable[[str], int]
+        """
+        try:
+            import tiktoken
+            try:
+                encoding = tiktoken.encoding_for_model(model_name)
+            except KeyError:
+                encoding = tiktoken.get_encoding("o200k_base")
+            return lambda text: len(encoding.encode(text))
+        except Exception as e:
+            logger.warning(f"Tokenizer unavailable, estimating tokens from characters: {str(e)}")
+            return lambda text: -(-len(text) // CHARS_PER_TOKEN)
+
+    def static_chars(self, template_name: str) -> int:
+        """
+        Count the literal text of a template and the templates it depends on.
+
+        :param template_name: Template path relative to templates_dir
+        :type template_name: str
+        :return: Number of static characters
+        :rtype: int
+        """
+        sources = self._template_service.get_template_sources(template_name)
+        return sum(
+            len(node.data)
+            for source in sources.values()
+            for node in _PARSER_ENV.parse(source).find_all(nodes.TemplateData)
+        )
+
+    def profile(self, template_name: str, context: Dict[str, Any]) -> PromptProfile:
+        """
+        Render a single template and measure the resulting prompt.
+
+        :param template_name: Template path relative to templates_dir
+        :type template_name: str
+        :param context: Template context variables
+        :type context: Dict[str, Any]
+        :return: Size and cost profile of the rendered prompt
+        :rtype: PromptProfile
+        """
+        rendered = self._template_service.render_prompt(template_name, **context)
+        tokens = self._count_tokens(rendered)
+        static_chars = self.static_chars(template_name)
+        return PromptProfile(
+            template_name=template_name,
+            rendered_chars=len(rendered),
+            tokens=tokens,
+            static_chars=static_chars,
+            variable_chars=max(len(rendered) - static_chars, 0),
+            estimated_latency_seconds=self._cost_profile.estimate_latency(tokens),
+            estimated_cost_usd=self._cost_profile.estimate_cost(tokens),
+        )
+
+    def profile_all(self, contexts: Dict[str, Dict[str, Any]]) -> List[PromptProfile]:
+        """
+        Profile every available template, largest prompt first.
+
+        Templates without a sample context are rendered with an empty context.
+        Templates that fail to render are logged and skipped.
+
+        :param contexts: Sample context variables keyed by template name
+        :type contexts: Dict[str, Dict[str, Any]]
+        :return: Profiles sorted by token count in descending order
+        :rtype: List[PromptProfile]
+        """
+        profiles = []
+        for template_name in self._template_service.get_template_names():
+            try:
+                profiles.append(self.profile(template_name, contexts.get(template_name, {})))
+            except Exception as e:
+                logger.warning(f"Failed to profile template {template_name}: {str(e)}")
+        return sorted(profiles, key=lambda p: p.tokens, reverse=True)
+
+
+def format_report(profiles: List[PromptProfile], cost_profile: Optional[ModelCostProfile] = None) -> str:
+    """
+    Format prompt profiles as a plain-text table.
+
+    :param profiles: Profiles to report
+    :type profiles: List[PromptProfile]
+    :param cost_profile: Model the estimates were computed for, shown in the header
+    :type cost_profile: Optional[ModelCostProfile]
+    :return: Report table
+    :rtype: str
+    """
+    header = f"{'template':<50} {'chars':>7} {'tokens':>7} {'static':>7} {'latency':>8} {'cost $':>9}"
+    lines = []
+    if cost_profile:
+        lines.append(f"Estimates for {cost_profile.model_name}")
+    lines.extend([header, "-" * len(header)])
+    for p in profiles:
+        lines.append(
+            f"{p.template_name:<50} {p.rendered_chars:>7} {p.tokens:>7} {p.static_share:>7.0%} "
+            f"{p.estimated_latency_seconds:>7.2f}s {p.estimated_cost_usd:>9.5f}"
+        )
+    lines.append("-" * len(header))
+    lines.append(
+        f"{'total':<50} {sum(p.rendered_chars for p in profiles):>7} {sum(p.tokens for p in profiles):>7} "
+        f"{'':>7} {sum(p.estimated_latency_seconds for p in profiles):>7.2f}s "
+        f"{sum(p.estimated_cost_usd for p in profiles):>9.5f}"
+    )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import asyncio
+    import sys
+    from pathlib import Path
+    from src.core.agents.experience_analyzer import (
+        calculate_years_experience, format_experiences_for_prompt, format_job_details_for_prompt
+    )
+    from src.core.domain.company_search import CompanyInfo
+    from src.core.domain.config import TemplateConfig
+    from src.core.domain.constants import TEST_RESUME_FILE_PATH, TEST_JOB_DESCRIPTION_FILE_PATH
+    from src.core.domain.schemas import get_model_schema
+    from src.infrastructure.parsers.pdf_parser import PDFParser
+    from tests.fixtures.resumes import create_bruce_wayne_resume
+    from tests.fixtures.job_description import create_sample_software_engineer_job
+
+    async def build_fixture_contexts() -> Dict[str, Dict[str, Any]]:
+        resume = create_bruce_wayne_resume()
+        job = create_sample_software_engineer_job()
+        resume_companies = {name: CompanyInfo(name=name) for name in resume.company_names}
+        return {
+            "prompts/parsing/resume_extractor.j2": {
+                "input_text": await PDFParser().extract_text(Path(TEST_RESUME_FILE_PATH)),
+            },
+            "prompts/parsing/job_description_extractor.j2": {
+                "input_text": Path(TEST_JOB_DESCRIPTION_FILE_PATH).read_text(),
+            },
+            "prompts/agents/experience_analyzer.j2": {
+                "resume_experiences": await format_experiences_for_prompt(resume.experiences),
+                "job_description": await format_job_details_for_prompt(job),
+                "total_years_experience": await calculate_years_experience(resume.experiences),
+                "hr_feedback": None,
+            },
+            "prompts/agents/company_alignment_analyzer.j2": {
+                "resume_company_info": resume_companies,
+                "job_description_company_info": {job.company_name: CompanyInfo(name=job.company_name)},
+            },
+            "prompts/company_search/search_query.j2": {
+                "company_name": resume.company_names[0],
+                "search_result_format": get_model_schema(CompanyInfo),
+            },
+        }
+
+    model_name = sys.argv[1] if len(sys.argv) > 1 else "gpt-4o"
+    cost_profile = DEFAULT_COST_PROFILES[model_name]
+    profiler = PromptProfiler(JinjaTemplateService(config=TemplateConfig.default()), cost_profile)
+    profiles = profiler.profile_all(asyncio.run(build_fixture_contexts()))
+    print(format_report(profiles, cost_profile))
@@ -117,7 +117,7 @@ def _render_debug_view() -> None:
 def _render_resume_upload() -> None:
     """Render the resume upload section."""
     st.subheader("📄 Upload Resume")
-    resume_file = st.file_uploader("Upload your resume", type=["pdf"])
+    resume_file = st.file_uploader("Upload your resume", type=["pdf", "docx"])
     
     if resume_file:
         _handle_resume_upload(resume_file)
@@ -184,7 +184,7 @@ def _render_job_description_input() -> None:
 
 def _handle_job_description_file() -> None:
     """Handle job description file upload."""
-    job_file = st.file_uploader("Upload job description", type=["pdf", "txt"])
+    job_file = st.file_uploader("Upload job description", type=["pdf", "docx", "txt"])
     
     if job_file:
         try:
@@ -206,8 +206,8 @@ def _handle_job_description_file() -> None:
             status_container = st.empty()
             with status_container:
                 with st.spinner("Parsing job description..."):
-                    if file_type == 'pdf':
-                        # For PDF files, pass bytes directly
+                    if file_type in ('pdf', 'docx'):
+                        # For PDF and DOCX files, pass bytes directly
                         job_obj = asyncio.run(_parse_content(file_content, 'job_parser'))
                     else:
                         # For text files, decode to string
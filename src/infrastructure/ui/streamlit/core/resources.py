@@ -14,6 +14,7 @@ from src.infrastructure.ai_providers.openai_provider import OpenAIProvider
 from src.infrastructure.template.jinja_template_service import JinjaTemplateService
 from src.infrastructure.extractors.llm_extractor import LLMStructuredExtractor
 from src.infrastructure.parsers.pdf_parser import PDFParser
+from src.infrastructure.parsers.docx_parser import DocxParser
 from src.core.domain.resume import Resume
 from src.core.domain.job_description import JobDescription
 
@@ -63,7 +64,7 @@ class TemplateServiceResource(ResourceProvider[JinjaTemplateService]):
         :raises ResourceInitializationError: If initialization fails
         """
         try:
-            config = TemplateConfig.development()
+            config = TemplateConfig.production()
             self._service = JinjaTemplateService(config=config)
             logger.info("Template service initialized successfully")
         except Exception as e:
@@ -95,14 +96,14 @@ class ResumeParserResource(ResourceProvider[LLMStructuredExtractor]):
         """
         try:
             ai_config = AIProviderConfig()
-            template_config = TemplateConfig.development()
+            template_config = TemplateConfig.production()
             
             self._parser = LLMStructuredExtractor(
                 ai_provider=OpenAIProvider(config=ai_config),
                 template_service=JinjaTemplateService(config=template_config),
                 output_model=Resume,
                 template_path="prompts/parsing/resume_extractor.j2",
-                document_parsers={".pdf": PDFParser()}
+                document_parsers={".pdf": PDFParser(), ".docx": DocxParser()}
             )
             logger.info("Resume parser initialized successfully")
         except Exception as e:
@@ -134,14 +135,14 @@ class JobParserResource(ResourceProvider[LLMStructuredExtractor]):
         """
         try:
             ai_config = AIProviderConfig()
-            template_config = TemplateConfig.development()
+            template_config = TemplateConfig.production()
             
             self._parser = LLMStructuredExtractor(
                 ai_provider=OpenAIProvider(config=ai_config),
                 template_service=JinjaTemplateService(config=template_config),
                 output_model=JobDescription,
                 template_path="prompts/parsing/job_description_extractor.j2",
-                document_parsers={".pdf": PDFParser()}
+                document_parsers={".pdf": PDFParser(), ".docx": DocxParser()}
             )
             logger.info("Job description parser initialized successfully")
         except Exception as e:
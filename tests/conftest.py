@@ -1,8 +1,12 @@
 import pytest
 from pathlib import Path
 from reportlab.pdfgen import canvas
+import docx
+import spacy
 import os
 
+from src.core.domain.config import PrivacyConfig
+
 @pytest.fixture(scope="session")
 def sample_resume_pdf(tmp_path_factory):
     """
@@ -35,6 +39,59 @@ def sample_resume_pdf(tmp_path_factory):
     
     return pdf_path
 
+@pytest.fixture(scope="session")
+def sample_resume_docx(tmp_path_factory):
+    """
+    Create a sample DOCX file for testing.
+    
+    :param tmp_path_factory: Pytest fixture for creating temporary directories
+    :returns: Path to the sample DOCX file
+    :rtype: Path
+    """
+    tmp_dir = tmp_path_factory.mktemp("test_files")
+    docx_path = tmp_dir / "sample_resume.docx"
+    
+    document = docx.Document()
+    document.add_paragraph("John Doe")
+    document.add_paragraph("john.doe@example.com")
+    document.add_paragraph("Experience")
+    
+    # Add a table with a merged header cell
+    table = document.add_table(rows=2, cols=2)
+    header = table.cell(0, 0).merge(table.cell(0, 1))
+    header.text = "Senior Developer at Tech Corp"
+    table.cell(1, 0).text = "2020 - Present"
+    table.cell(1, 1).text = "Python, AWS"
+    
+    document.add_paragraph("Skills")
+    document.save(str(docx_path))
+    
+    return docx_path
+
+@pytest.fixture(scope="session")
+def privacy_config(tmp_path_factory):
+    """
+    Create a privacy configuration backed by a tiny rule-based spaCy pipeline.
+    
+    The pipeline tags a fixed set of names as PERSON, so privacy tests run
+    without downloading a trained spaCy model.
+    
+    :param tmp_path_factory: Pytest fixture for creating temporary directories
+    :returns: Privacy configuration pointing at the saved pipeline
+    :rtype: PrivacyConfig
+    """
+    model_dir = tmp_path_factory.mktemp("spacy_model") / "tiny_en"
+    
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([
+        {"label": "PERSON", "pattern": "John Doe"},
+        {"label": "PERSON", "pattern": "Bruce Wayne"},
+    ])
+    nlp.to_disk(model_dir)
+    
+    return PrivacyConfig(nlp_model=str(model_dir))
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
     """Set up the test environment with necessary environment variables."""
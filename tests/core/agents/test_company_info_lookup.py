@@ -0,0 +1,142 @@
+'''
+Tests for the cached company lookup.
+'''
+import asyncio
+import pytest
+import time
+from unittest.mock import MagicMock
+
+from src.core.agents.company_info_lookup import CachedCompanySearch
+from src.core.domain.company_search import CompanyInfo, PartialCompanyInfo
+from src.core.domain.config import CompanyCacheConfig
+from src.core.ports.secondary.company_info_cache import CachedCompanyInfo
+
+
+class InMemoryCompanyInfoCache:
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def set(self, key, company_info):
+        self.entries[key] = CachedCompanyInfo(company_info=company_info, fetched_at=time.time())
+
+
+@pytest.fixture
+def searches():
+    calls = []
+
+    async def search(company_name):
+        calls.append(company_name)
+        await asyncio.sleep(0.01)
+        return None if company_name == "Nowhere Inc" else CompanyInfo(name=company_name)
+
+    search.calls = calls
+    return search
+
+
+def create_lookup(cache, search, **config):
+    return CachedCompanySearch(cache, MagicMock(), CompanyCacheConfig(**config), search=search)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_and_repeated_lookups_search_once(searches):
+    '''Test that variants of a name share one search, and later lookups hit the cache.'''
+    lookup = create_lookup(InMemoryCompanyInfoCache(), searches)
+
+    results = await asyncio.gather(lookup.search("Google"), lookup.search(" google "))
+    again = await lookup.search("GOOGLE")
+
+    assert results[0] == results[1] == again == CompanyInfo(name="Google")
+    assert searches.calls == ["Google"]
+
+
+@pytest.mark.asyncio
+async def test_failed_lookups_are_cached_until_negative_ttl(searches):
+    '''Test that a failed lookup is not retried until the negative TTL expires.'''
+    cache = InMemoryCompanyInfoCache()
+    lookup = create_lookup(cache, searches, negative_ttl_seconds=60)
+
+    assert await lookup.search("Nowhere Inc") is None
+    assert await lookup.search("Nowhere Inc") is None
+    assert len(searches.calls) == 1
+
+    cache.entries["nowhere"].fetched_at -= 120
+    await lookup.search("Nowhere Inc")
+    assert len(searches.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_are_served_while_refreshing(searches):
+    '''Test that a stale entry is returned immediately and refreshed in the background.'''
+    cache = InMemoryCompanyInfoCache()
+    cache.entries["google"] = CachedCompanyInfo(CompanyInfo(name="Old Google"), time.time() - 120)
+    lookup = create_lookup(cache, searches, ttl_seconds=60, max_stale_seconds=600)
+
+    assert await lookup.search("Google") == CompanyInfo(name="Old Google")
+    await lookup.wait_for_refreshes()
+
+    assert cache.entries["google"].company_info == CompanyInfo(name="Google")
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_stale_entry():
+    '''Test that a refresh failure does not replace information found earlier.'''
+    async def failing_search(company_name):
+        raise RuntimeError("Search backend down")
+
+    cache = InMemoryCompanyInfoCache()
+    cache.entries["google"] = CachedCompanyInfo(CompanyInfo(name="Google"), time.time() - 120)
+    lookup = create_lookup(cache, failing_search, ttl_seconds=60, max_stale_seconds=600)
+
+    await lookup.search("Google")
+    await lookup.wait_for_refreshes()
+
+    assert cache.entries["google"].company_info == CompanyInfo(name="Google")
+
+
+@pytest.mark.asyncio
+async def test_spelling_variants_share_a_cache_entry(searches):
+    '''Test that variants of a company name are researched once.'''
+    cache = InMemoryCompanyInfoCache()
+    lookup = create_lookup(cache, searches)
+
+    await lookup.search("Google LLC")
+    await lookup.search("Alphabet/Google")
+
+    assert searches.calls == ["Google LLC"]
+    assert list(cache.entries) == ["google"]
+
+
+@pytest.mark.asyncio
+async def test_search_errors_are_raised_and_not_cached():
+    '''Test that a search error reaches the caller, so it can retry, instead of being cached.'''
+    async def throttled_search(company_name):
+        raise RuntimeError("Too many requests")
+
+    cache = InMemoryCompanyInfoCache()
+    lookup = create_lookup(cache, throttled_search)
+
+    with pytest.raises(RuntimeError):
+        await lookup.search("Google")
+    assert cache.entries == {}
+
+
+@pytest.mark.asyncio
+async def test_partial_results_are_not_cached():
+    '''Test that a partial result is returned but the company is researched again next time.'''
+    calls = []
+
+    async def budgeted_search(company_name):
+        calls.append(company_name)
+        return PartialCompanyInfo(name=company_name)
+
+    cache = InMemoryCompanyInfoCache()
+    lookup = create_lookup(cache, budgeted_search)
+
+    assert await lookup.search("Obscure Ltd") == PartialCompanyInfo(name="Obscure Ltd")
+    await lookup.search("Obscure Ltd")
+
+    assert len(calls) == 2
+    assert cache.entries == {}
@@ -0,0 +1,97 @@
+'''
+Tests for the bounded company research fan-out.
+'''
+import asyncio
+import pytest
+
+from src.core.agents.company_research import CompanyResearcher, is_rate_limit_error
+from src.core.domain.company_search import CompanyInfo, PartialCompanyInfo
+from src.core.domain.config import CompanyResearchConfig
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+def create_researcher(**config):
+    return CompanyResearcher(CompanyResearchConfig(backoff_base_seconds=0.01, **config))
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    '''Test that no more than max_concurrency companies are researched at once.'''
+    running, peak = 0, 0
+
+    async def search(company_name):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return CompanyInfo(name=company_name)
+
+    outcomes = await create_researcher(max_concurrency=2).research([f"Company {i}" for i in range(6)], search)
+
+    assert peak == 2
+    assert [outcome.status for outcome in outcomes.values()] == ["found"] * 6
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_searches_are_retried():
+    '''Test that rate limit errors are retried with backoff, and other errors are not.'''
+    attempts = {"Acme": 0, "Broken": 0}
+
+    async def search(company_name):
+        attempts[company_name] += 1
+        if company_name == "Broken":
+            raise ValueError("Malformed response")
+        if attempts[company_name] < 3:
+            raise RateLimitError("Too many requests")
+        return CompanyInfo(name=company_name)
+
+    outcomes = await create_researcher(max_retries=3).research(["Acme", "Broken"], search)
+
+    assert outcomes["Acme"].status == "found" and outcomes["Acme"].attempts == 3
+    assert outcomes["Broken"].status == "failed" and outcomes["Broken"].attempts == 1
+    assert outcomes["Broken"].error == "ValueError: Malformed response"
+
+
+@pytest.mark.asyncio
+async def test_slow_companies_time_out_without_holding_others():
+    '''Test that a company exceeding its deadline is reported while the others complete.'''
+    async def search(company_name):
+        if company_name == "Slow":
+            await asyncio.sleep(10)
+        return None if company_name == "Unknown" else CompanyInfo(name=company_name)
+
+    outcomes = await create_researcher(deadline_seconds=0.05).research(["Slow", "Fast", "Unknown"], search)
+
+    assert {name: outcome.status for name, outcome in outcomes.items()} == {
+        "Slow": "timed_out", "Fast": "found", "Unknown": "not_found",
+    }
+    assert outcomes["Slow"].elapsed_seconds < 1
+
+
+@pytest.mark.asyncio
+async def test_partial_results_are_reported_as_partial():
+    '''Test that information from a search stopped by its budget is kept but not reported as found.'''
+    async def search(company_name):
+        return PartialCompanyInfo(name=company_name, location="Leeds")
+
+    outcome = await create_researcher().research_company("Obscure Ltd", search)
+
+    assert outcome.status == "partial"
+    assert outcome.company_info.location == "Leeds"
+
+
+def test_is_rate_limit_error():
+    '''Test that 429 responses are recognised however the client reports them.'''
+    class Response:
+        status_code = 429
+
+    class HTTPError(Exception):
+        response = Response()
+
+    assert is_rate_limit_error(RateLimitError())
+    assert is_rate_limit_error(HTTPError())
+    assert not is_rate_limit_error(ValueError())
@@ -0,0 +1,309 @@
+'''
+Tests for the resume analysis graph wiring.
+'''
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+
+@pytest.fixture
+def graph_builder(monkeypatch):
+    '''Graph builder module with every node replaced by a cheap stub.'''
+    # Imported lazily: the shared components are created on import and need the test environment
+    from src.core.agents import graph_builder
+
+    experience_started = asyncio.Event()
+
+    async def parse_resume_node(state, extractor):
+        return {"resume": "resume"}
+
+    async def parse_job_description_node(state, extractor):
+        return {"job_description": "job_description"}
+
+    async def search_company_info_node(state, template_service, branch, model_name, company_search=None,
+                                       company_researcher=None, agent_pool=None):
+        if branch == "resume":
+            # Only completes if the experience analyzer does not wait for company research
+            await experience_started.wait()
+        return {f"{branch}_company_info": {}}
+
+    async def company_alignment_analyzer(state, ai_provider, template_service):
+        return {"company_alignment": "aligned"}
+
+    async def analyze_experience_node(state, extractor):
+        experience_started.set()
+        return {"experience_alignment": "aligned"}
+
+    for name, node in [("parse_resume_node", parse_resume_node),
+                       ("parse_job_description_node", parse_job_description_node),
+                       ("search_company_info_node", search_company_info_node),
+                       ("company_alignment_analyzer", company_alignment_analyzer),
+                       ("analyze_experience_node", analyze_experience_node)]:
+        monkeypatch.setattr(graph_builder, name, node)
+    return graph_builder
+
+
+def build(graph_builder, parallel):
+    return graph_builder.build_resume_analysis_graph(
+        parallel=parallel, llm_extractor=MagicMock(), ai_provider=MagicMock(), template_service=MagicMock()
+    )
+
+
+@pytest.mark.asyncio
+async def test_parallel_graph_runs_analyzers_concurrently(graph_builder):
+    '''Test that the experience analyzer does not wait for company research in parallel mode.'''
+    app = build(graph_builder, parallel=True)
+
+    state = await asyncio.wait_for(app.ainvoke({"resume_path": "r", "job_description_path": "j"}), timeout=5)
+
+    assert state["experience_alignment"] == "aligned"
+    assert state["company_alignment"] == "aligned"
+    assert not state.get("error_messages")
+
+
+@pytest.mark.asyncio
+async def test_sequential_graph_runs_experience_after_company_alignment(graph_builder):
+    '''Test that the default graph keeps the experience analyzer behind company alignment.'''
+    app = build(graph_builder, parallel=False)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(app.ainvoke({"resume_path": "r", "job_description_path": "j"}), timeout=0.5)
+
+
+@pytest.mark.asyncio
+async def test_research_nodes_search_with_the_researcher_config(graph_builder, monkeypatch):
+    '''Test that the company researcher's configuration reaches the search agents.'''
+    from src.core.agents.company_research import CompanyResearcher
+    from src.core.domain.config import CompanyResearchConfig
+
+    pools = []
+
+    async def search_company_info_node(state, template_service, branch, model_name, company_search=None,
+                                       company_researcher=None, agent_pool=None):
+        pools.append(agent_pool)
+        return {f"{branch}_company_info": {}}
+
+    monkeypatch.setattr(graph_builder, "search_company_info_node", search_company_info_node)
+    config = CompanyResearchConfig(web_search=False, max_tool_calls=2)
+    app = graph_builder.build_resume_analysis_graph(
+        llm_extractor=MagicMock(), ai_provider=MagicMock(), template_service=MagicMock(),
+        company_researcher=CompanyResearcher(config),
+    )
+
+    await app.ainvoke({"resume_path": "r", "job_description_path": "j"})
+
+    assert len(pools) == 2
+    assert pools[0] is pools[1]
+    assert pools[0].config is config
+    assert pools[0].web_search is False
+
+
+@pytest.mark.asyncio
+async def test_cached_company_search_uses_the_researcher_config(graph_builder, monkeypatch):
+    '''Test that cache misses of a cached company search are researched with the researcher's configuration.'''
+    from src.core.agents import company_info_lookup
+    from src.core.agents.company_info_lookup import CachedCompanySearch
+    from src.core.agents.company_research import CompanyResearcher
+    from src.core.agents.utils import nodes
+    from src.core.domain.company_search import CompanyInfo
+    from src.core.domain.config import CompanyResearchConfig
+
+    pools = []
+
+    async def search_company_info(company_name, template_service, model_name, agent_pool=None):
+        pools.append(agent_pool)
+        return CompanyInfo(name=company_name)
+
+    async def parse_resume_node(state, extractor):
+        return {"resume": MagicMock(company_names=["Acme"])}
+
+    async def parse_job_description_node(state, extractor):
+        return {"job_description": MagicMock(company_name="Wayne Enterprises")}
+
+    monkeypatch.setattr(company_info_lookup, "search_company_info", search_company_info)
+    monkeypatch.setattr(graph_builder, "search_company_info_node", nodes.search_company_info_node)
+    monkeypatch.setattr(graph_builder, "parse_resume_node", parse_resume_node)
+    monkeypatch.setattr(graph_builder, "parse_job_description_node", parse_job_description_node)
+    cache = MagicMock()
+    cache.get.return_value = None
+    config = CompanyResearchConfig(web_search=False, max_tool_calls=2)
+    app = graph_builder.build_resume_analysis_graph(
+        llm_extractor=MagicMock(), ai_provider=MagicMock(), template_service=MagicMock(),
+        company_search=CachedCompanySearch(cache, MagicMock()), company_researcher=CompanyResearcher(config),
+    )
+
+    await app.ainvoke({"resume_path": "r", "job_description_path": "j"})
+
+    assert len(pools) == 2
+    assert pools[0] is pools[1]
+    assert pools[0].config is config
+    assert cache.set.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_merge_analysis_node_reports_missing_results(graph_builder):
+    '''Test that the merge node records analyses that produced no result.'''
+    merge_analysis_node = graph_builder.merge_analysis_node
+    update = await merge_analysis_node({"experience_alignment": "aligned", "error_messages": ["earlier"]})
+
+    assert update == {"error_messages": ["earlier", "No result for company_alignment"]}
+    assert await merge_analysis_node({"experience_alignment": "a", "company_alignment": "b"}) == {}
+
+
+@pytest.mark.asyncio
+async def test_interrupted_run_resumes_from_last_finished_node(graph_builder, monkeypatch, tmp_path):
+    '''Test that a failed run resumes without re-running completed nodes.'''
+    from src.core.domain.config import CheckpointConfig
+    from src.infrastructure.checkpointing.sqlite_checkpointer import sqlite_checkpointer
+
+    calls = {"parse_resume": 0, "experience_analyzer": 0}
+
+    async def parse_resume_node(state, extractor):
+        calls["parse_resume"] += 1
+        return {"resume": "resume"}
+
+    async def analyze_experience_node(state, extractor):
+        calls["experience_analyzer"] += 1
+        if calls["experience_analyzer"] == 1:
+            raise RuntimeError("Provider outage")
+        return {"experience_alignment": "aligned"}
+
+    async def search_company_info_node(state, template_service, branch, model_name, company_search=None,
+                                       company_researcher=None, agent_pool=None):
+        return {f"{branch}_company_info": {}}
+
+    monkeypatch.setattr(graph_builder, "parse_resume_node", parse_resume_node)
+    monkeypatch.setattr(graph_builder, "analyze_experience_node", analyze_experience_node)
+    monkeypatch.setattr(graph_builder, "search_company_info_node", search_company_info_node)
+    state = {"resume_path": "r", "job_description_path": "j"}
+
+    async with sqlite_checkpointer(CheckpointConfig(db_path=tmp_path / "checkpoints.sqlite")) as checkpointer:
+        app = graph_builder.build_resume_analysis_graph(
+            parallel=True, llm_extractor=MagicMock(), ai_provider=MagicMock(),
+            template_service=MagicMock(), checkpointer=checkpointer,
+        )
+        with pytest.raises(RuntimeError):
+            await graph_builder.run_resumable(app, state, thread_id="run-1")
+
+        result = await graph_builder.run_resumable(app, state, thread_id="run-1")
+
+    assert result["experience_alignment"] == "aligned"
+    assert result["company_alignment"] == "aligned"
+    assert calls == {"parse_resume": 1, "experience_analyzer": 2}
+
+
+@pytest.fixture
+def multi_job_calls(graph_builder, monkeypatch):
+    '''Stub the parsing and research nodes of the multi-job graph and count their calls.'''
+    from src.core.domain.company_search import CompanyInfo
+    from tests.fixtures.job_description import create_sample_software_engineer_job
+
+    calls = {"parse_resume": 0, "parse_job_description": 0, "resume": 0, "job_description": 0}
+
+    async def parse_resume_node(state, extractor):
+        calls["parse_resume"] += 1
+        return {"resume": "resume"}
+
+    async def parse_job_description_node(state, extractor):
+        calls["parse_job_description"] += 1
+        job = create_sample_software_engineer_job()
+        return {"job_description": job.model_copy(update={"title": state["job_description_path"]})}
+
+    async def search_company_info_node(state, template_service, branch, model_name, company_search=None,
+                                       company_researcher=None, agent_pool=None):
+        calls[branch] += 1
+        return {f"{branch}_company_info": {"Acme": CompanyInfo(name="Acme")}}
+
+    async def analyze_experience_node(state, extractor):
+        return {"experience_alignment": f"{state['resume']} vs {state['job_profile'].prompt_fragments['job_title']}"}
+
+    monkeypatch.setattr(graph_builder, "parse_resume_node", parse_resume_node)
+    monkeypatch.setattr(graph_builder, "parse_job_description_node", parse_job_description_node)
+    monkeypatch.setattr(graph_builder, "search_company_info_node", search_company_info_node)
+    monkeypatch.setattr(graph_builder, "analyze_experience_node", analyze_experience_node)
+    return calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("parallel", [True, False])
+async def test_multi_job_graph_prepares_resume_once(graph_builder, multi_job_calls, parallel):
+    '''Test that one resume is parsed and researched once and analyzed against every job.'''
+    app = graph_builder.build_multi_job_analysis_graph(
+        parallel=parallel, llm_extractor=MagicMock(), ai_provider=MagicMock(), template_service=MagicMock()
+    )
+
+    state = await app.ainvoke({"resume_path": "r", "job_description_paths": ["a", "b", "c"]})
+
+    assert multi_job_calls == {"parse_resume": 1, "parse_job_description": 3, "resume": 1, "job_description": 3}
+    assert set(state["job_analyses"]) == {"a", "b", "c"}
+    assert state["job_analyses"]["b"]["experience_alignment"] == "resume vs b"
+    assert state["job_analyses"]["b"]["company_alignment"] == "aligned"
+
+
+@pytest.mark.asyncio
+async def test_multi_job_graph_reuses_stored_job_profiles(graph_builder, multi_job_calls, tmp_path):
+    '''Test that a job seen in an earlier run is neither parsed nor researched again.'''
+    from src.core.agents.utils.job_profiles import JobProfileStore
+
+    def build():
+        return graph_builder.build_multi_job_analysis_graph(
+            llm_extractor=MagicMock(), ai_provider=MagicMock(), template_service=MagicMock(),
+            job_profiles=JobProfileStore(tmp_path),
+        )
+
+    await build().ainvoke({"resume_path": "r1", "job_description_paths": ["a"]})
+    state = await build().ainvoke({"resume_path": "r2", "job_description_paths": ["a", "b"]})
+
+    assert multi_job_calls["parse_job_description"] == 2
+    assert multi_job_calls["job_description"] == 2
+    assert state["job_profiles"]["a"].company_info["Acme"].name == "Acme"
+    assert set(state["job_analyses"]) == {"a", "b"}
+
+
+@pytest.mark.asyncio
+async def test_multi_job_graph_keys_job_profiles_on_content(graph_builder, multi_job_calls, tmp_path):
+    '''Test that a copied posting is reused while an edited one is profiled again.'''
+    from src.core.agents.utils.job_profiles import JobProfileStore
+
+    store = JobProfileStore(tmp_path / "profiles")
+    original, copy = tmp_path / "original.txt", tmp_path / "copy.txt"
+    original.write_text("Senior engineer at Acme")
+    copy.write_text("Senior engineer at Acme")
+
+    def run(path):
+        app = graph_builder.build_multi_job_analysis_graph(
+            llm_extractor=MagicMock(), ai_provider=MagicMock(), template_service=MagicMock(), job_profiles=store,
+        )
+        return app.ainvoke({"resume_path": "r", "job_description_paths": [str(path)]})
+
+    await run(original)
+    await run(copy)
+    assert multi_job_calls["parse_job_description"] == 1
+
+    original.write_text("Staff engineer at Acme")
+    await run(original)
+    assert multi_job_calls["parse_job_description"] == 2
+
+
+@pytest.mark.asyncio
+async def test_multi_job_graph_does_not_store_unsettled_research(graph_builder, multi_job_calls, monkeypatch, tmp_path):
+    '''Test that a job whose company research timed out is researched again on the next run.'''
+    from src.core.agents.utils.job_profiles import JobProfileStore
+    from src.core.domain.company_search import CompanyResearchOutcome
+
+    async def search_company_info_node(state, template_service, branch, model_name, company_search=None,
+                                       company_researcher=None, agent_pool=None):
+        multi_job_calls[branch] += 1
+        outcome = CompanyResearchOutcome(company_name="Acme", status="timed_out")
+        return {f"{branch}_company_info": {}, "company_research_outcomes": {"Acme": outcome}}
+
+    monkeypatch.setattr(graph_builder, "search_company_info_node", search_company_info_node)
+    for _ in range(2):
+        app = graph_builder.build_multi_job_analysis_graph(
+            llm_extractor=MagicMock(), ai_provider=MagicMock(), template_service=MagicMock(),
+            job_profiles=JobProfileStore(tmp_path),
+        )
+        await app.ainvoke({"resume_path": "r", "job_description_paths": ["a"]})
+
+    assert multi_job_calls["job_description"] == 2
+    assert not list(tmp_path.iterdir())
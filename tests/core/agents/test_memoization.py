@@ -0,0 +1,109 @@
+'''
+Tests for node memoisation.
+'''
+import pytest
+from unittest.mock import MagicMock
+
+from src.core.agents.utils.memoization import NODE_INPUTS, NodeCache, NodeInputs, memoize_node
+from src.core.domain.company_search import CompanyResearchOutcome
+
+INPUTS = NodeInputs(state_keys=("resume",), templates=("prompts/agents/experience_analyzer.j2",))
+
+
+@pytest.fixture
+def template_service():
+    service = MagicMock()
+    service.get_template_fingerprint.return_value = "v1"
+    return service
+
+
+@pytest.fixture
+def counting_node():
+    calls = []
+
+    async def node(state):
+        calls.append(state)
+        return {"resume_company_info": {"company": len(calls)}}
+
+    node.calls = calls
+    return node
+
+
+@pytest.mark.asyncio
+async def test_memoized_node_only_depends_on_its_state_slice(counting_node, template_service):
+    '''Test that changing keys the node does not read still hits the cache.'''
+    node = memoize_node(counting_node, "resume_company_research", NodeCache(), INPUTS, template_service)
+
+    first = await node({"resume": "resume", "job_description": "job A"})
+    second = await node({"resume": "resume", "job_description": "job B"})
+    third = await node({"resume": "other resume", "job_description": "job B"})
+
+    assert first == second == {"resume_company_info": {"company": 1}}
+    assert third == {"resume_company_info": {"company": 2}}
+    assert len(counting_node.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_template_change_invalidates_cache(counting_node, template_service):
+    '''Test that a new template fingerprint forces the node to run again.'''
+    node = memoize_node(counting_node, "resume_company_research", NodeCache(), INPUTS, template_service)
+
+    await node({"resume": "resume"})
+    template_service.get_template_fingerprint.return_value = "v2"
+    await node({"resume": "resume"})
+
+    assert len(counting_node.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_outputs_are_copies_and_failures_are_not_cached(template_service):
+    '''Test that callers cannot mutate cached outputs and None results are recomputed.'''
+    results = [{"experience_alignment": None}, {"experience_alignment": {"score": 1}}]
+
+    async def node(state):
+        return results.pop(0)
+
+    cache = NodeCache()
+    memoized = memoize_node(node, "experience_analyzer", cache, INPUTS, template_service)
+
+    assert await memoized({"resume": "resume"}) == {"experience_alignment": None}
+    output = await memoized({"resume": "resume"})
+    output["experience_alignment"]["score"] = 0
+
+    assert await memoized({"resume": "resume"}) == {"experience_alignment": {"score": 1}}
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_unsettled_company_research_is_not_cached(template_service):
+    '''Test that research which failed or timed out is retried on the next run.'''
+    statuses = ["timed_out", "not_found"]
+
+    async def node(state):
+        outcome = CompanyResearchOutcome(company_name="Acme", status=statuses.pop(0))
+        return {"resume_company_info": {}, "company_research_outcomes": {"Acme": outcome}}
+
+    cache = NodeCache()
+    memoized = memoize_node(node, "resume_company_research", cache,
+                            NODE_INPUTS["resume_company_research"], template_service)
+
+    first = await memoized({"resume": "resume"})
+    second = await memoized({"resume": "resume"})
+    third = await memoized({"resume": "resume"})
+
+    assert first["company_research_outcomes"]["Acme"].status == "timed_out"
+    assert second["company_research_outcomes"]["Acme"].status == "not_found"
+    assert third == second
+    assert cache.hits == 1
+
+
+def test_node_cache_evicts_least_recently_used():
+    '''Test that the cache keeps at most max_entries outputs.'''
+    cache = NodeCache(max_entries=2)
+    cache.set("a", {"x": 1})
+    cache.set("b", {"x": 2})
+    cache.get("a")
+    cache.set("c", {"x": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"x": 1}
@@ -0,0 +1,160 @@
+'''
+Tests for the company search agent pool.
+'''
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from langchain_core.messages import AIMessage, ToolMessage
+
+from src.core.agents import search_agents
+from src.core.agents.search_agents import AgentBudget, CompanySearchAgentPool, search_company_info
+from src.core.domain.company_search import CompanyInfo, PartialCompanyInfo
+from src.core.domain.config import CompanyResearchConfig
+
+
+class FakeAgent:
+    async def astream(self, inputs, config, stream_mode):
+        await asyncio.sleep(0.01)
+        yield {"messages": [], "structured_response": CompanyInfo(name="Wayne Enterprises")}
+
+
+class LoopingAgent:
+    """Agent that keeps searching, as seen for obscure companies."""
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    async def astream(self, inputs, config, stream_mode):
+        budget = config["callbacks"][0]
+        messages = []
+        for call in range(100):
+            messages = messages + [AIMessage(content="", tool_calls=[
+                {"name": "search", "args": {"query": "Obscure Ltd"}, "id": str(call)}
+            ])]
+            yield {"messages": messages}
+            await budget.on_tool_start({}, "Obscure Ltd")
+            await asyncio.sleep(self.delay)
+            messages = messages + [ToolMessage(content=f"Result {call}: Obscure Ltd is in Leeds", tool_call_id=str(call))]
+            yield {"messages": messages}
+
+
+class BuiltAgents(list):
+    rate_limiters = None
+
+
+@pytest.fixture
+def built_agents(monkeypatch):
+    built = BuiltAgents()
+
+    def create_agent(response_format, template_service, model_name, llm_rate_limiter, search_rate_limiter, **tools):
+        built.append((response_format, model_name))
+        built.rate_limiters = (llm_rate_limiter, search_rate_limiter)
+        return FakeAgent()
+
+    monkeypatch.setattr(search_agents, "create_company_search_agent", create_agent)
+    return built
+
+
+@pytest.fixture
+def template_service():
+    service = MagicMock()
+    service.get_template_fingerprint.return_value = "v1"
+    return service
+
+
+@pytest.mark.asyncio
+async def test_concurrent_searches_share_one_agent(built_agents, template_service):
+    '''Test that an agent is built once per model and reused by concurrent searches.'''
+    pool = CompanySearchAgentPool(template_service)
+
+    results = await asyncio.gather(*[
+        search_company_info("Wayne Enterprises", template_service, "gpt-4.1-mini", agent_pool=pool)
+        for _ in range(5)
+    ])
+
+    assert all(result == CompanyInfo(name="Wayne Enterprises") for result in results)
+    assert built_agents == [(CompanyInfo, "gpt-4.1-mini")]
+
+    pool.get(CompanyInfo, "gpt-4.1")
+    assert len(built_agents) == 2
+    assert built_agents.rate_limiters == (pool.llm_rate_limiter, pool.search_rate_limiter)
+
+
+def test_agent_is_rebuilt_when_the_prompt_changes(built_agents, template_service):
+    '''Test that a changed system prompt template invalidates the pooled agent.'''
+    pool = CompanySearchAgentPool(template_service)
+    agent = pool.get()
+
+    assert pool.get() is agent
+    template_service.get_template_fingerprint.return_value = "v2"
+    assert pool.get() is not agent
+    assert len(built_agents) == 2
+
+
+def test_default_pool_is_shared_per_template_service(template_service):
+    '''Test that searches without an explicit pool share one per template service.'''
+    assert search_agents.get_agent_pool(template_service) is search_agents.get_agent_pool(template_service)
+    assert search_agents.get_agent_pool(template_service) is not search_agents.get_agent_pool(MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_companies_in_the_local_directory_skip_the_agent(built_agents, template_service):
+    '''Test that a company found in the local directory is returned without running the agent.'''
+    directory = MagicMock()
+    directory.lookup.side_effect = lambda name: CompanyInfo(name="Acme") if name == "Acme" else None
+    pool = CompanySearchAgentPool(template_service, directory=directory)
+
+    assert await search_company_info("Acme", template_service, agent_pool=pool) == CompanyInfo(name="Acme")
+    assert built_agents == []
+
+    assert await search_company_info("Wayne Enterprises", template_service, agent_pool=pool) == CompanyInfo(
+        name="Wayne Enterprises"
+    )
+    assert len(built_agents) == 1
+
+
+@pytest.fixture
+def partial_extractor(monkeypatch):
+    extractor = MagicMock()
+    extractor.ainvoke = AsyncMock(return_value=CompanyInfo(name="Obscure Ltd", location="Leeds"))
+    monkeypatch.setattr(search_agents, "create_partial_result_extractor", lambda *args, **kwargs: extractor)
+    return extractor
+
+
+@pytest.mark.parametrize("limits", [
+    {"max_tool_calls": 3},
+    {"agent_time_budget_seconds": 0.05},
+])
+@pytest.mark.asyncio
+async def test_runaway_agent_returns_partial_result(monkeypatch, template_service, partial_extractor, limits):
+    '''Test that an agent looping on searches is stopped and what it found so far is returned.'''
+    agent = LoopingAgent(delay=0.01)
+    monkeypatch.setattr(search_agents, "create_company_search_agent", lambda *args, **kwargs: agent)
+    template_service.render_prompt.side_effect = lambda template, **context: "\n".join(context.get("search_results", []))
+    pool = CompanySearchAgentPool(template_service, CompanyResearchConfig(**limits))
+
+    result = await search_company_info("Obscure Ltd", template_service, agent_pool=pool)
+
+    assert result == PartialCompanyInfo(name="Obscure Ltd", location="Leeds")
+    prompt = partial_extractor.ainvoke.call_args.args[0][0].content
+    assert "Result 0: Obscure Ltd is in Leeds" in prompt
+    if "max_tool_calls" in limits:
+        assert prompt.count("Result") == 3
+
+
+@pytest.mark.asyncio
+async def test_token_budget():
+    '''Test that the budget counts tokens reported by the model and requested tool calls.'''
+    budget = AgentBudget(max_tool_calls=2, max_tokens=100, time_budget_seconds=60)
+    response = MagicMock()
+    response.generations = [[MagicMock(message=AIMessage(content="", usage_metadata={
+        "input_tokens": 50, "output_tokens": 10, "total_tokens": 60,
+    }))]]
+
+    await budget.on_tool_start({}, "query")
+    await budget.on_llm_end(response)
+    assert budget.exhausted() is None
+    assert budget.exhausted(pending_tool_calls=2) == "2 tool calls"
+
+    await budget.on_llm_end(response)
+    assert budget.exhausted() == "100 tokens"
@@ -0,0 +1,91 @@
+'''
+Tests for the compaction of search results.
+'''
+import pytest
+
+from src.core.agents.search_agents import RateLimitedTavilySearchResults
+from src.core.agents.utils.search_compaction import SearchResultCompactor
+
+PAGE = """Home | Products | Careers | Contact
+We use cookies to improve your experience. Accept all
+Wayne Enterprises is a defense contractor and conglomerate headquartered in Gotham City.
+The weather in Gotham was rainy last week. Our team enjoyed the annual picnic.
+Founded in 1850 by Judge Solomon Wayne, the company employs about 170,000 people.
+Its revenue was $31.3 billion in 2023.
+Subscribe to our newsletter"""
+
+
+def test_keeps_only_relevant_sentences():
+    '''Test that boilerplate, navigation and off-topic text are removed.'''
+    results = SearchResultCompactor().compact(
+        [{"title": "About", "url": "https://wayne.example/about", "content": PAGE, "score": 0.9}],
+        query="Wayne Enterprises employees revenue",
+    )
+
+    assert results == [{
+        "title": "About",
+        "url": "https://wayne.example/about",
+        "content": "Wayne Enterprises is a defense contractor and conglomerate headquartered in Gotham City. "
+                   "Founded in 1850 by Judge Solomon Wayne, the company employs about 170,000 people. "
+                   "Its revenue was $31.3 billion in 2023.",
+        "score": 0.9,
+    }]
+
+
+@pytest.mark.parametrize("sentence", [
+    "Netflix had 260 million paid subscribers and revenue of $33.7 billion.",
+    "Vercel is a cloud platform for JavaScript developers founded in 2015.",
+    "Substack, the newsletter platform, has 1,200 employees.",
+    "Crumbl is a cookie maker that employs about 9,000 people.",
+])
+def test_relevant_sentences_mentioning_boilerplate_words_are_kept(sentence):
+    '''Test that words such as "subscribe" or "cookie" do not drop sentences answering a field.'''
+    content = f"{sentence}\nSubscribe to our newsletter for updates today.\nWe use cookies to improve your experience."
+
+    results = SearchResultCompactor().compact([{"url": "https://example.com", "content": content}])
+
+    assert results[0]["content"] == sentence
+
+
+def test_deduplicates_pages_and_sentences():
+    '''Test that repeated pages and sentences repeated across results are dropped.'''
+    sentence = "Wayne Enterprises is headquartered in Gotham City."
+    results = SearchResultCompactor().compact([
+        {"url": "https://www.wayne.example/about/", "content": sentence},
+        {"url": "http://wayne.example/about?ref=search", "content": "Wayne Enterprises employs 170,000 people."},
+        {"url": "https://news.example/wayne", "content": sentence.upper()},
+        {"url": "https://blog.example/gotham", "content": "Nothing here is about the company at all today."},
+    ], query="Wayne Enterprises")
+
+    assert [result["url"] for result in results] == ["https://www.wayne.example/about/"]
+
+
+def test_caps_tokens_per_result_by_relevance():
+    '''Test that the most relevant sentences are kept within the cap, in their original order.'''
+    content = ("Wayne Enterprises makes things for many customers around the world. "
+               "Wayne Enterprises was founded in 1850 and is headquartered in Gotham City. "
+               "It has 170,000 employees.")
+    count_words = lambda text: len(text.split())
+
+    compacted = SearchResultCompactor(max_tokens_per_result=16, count_tokens=count_words).compact(
+        [{"url": "https://wayne.example", "content": content}], query="Wayne Enterprises"
+    )[0]["content"]
+    assert compacted == ("Wayne Enterprises was founded in 1850 and is headquartered in Gotham City. "
+                         "It has 170,000 employees.")
+
+    truncated = SearchResultCompactor(max_tokens_per_result=5, count_tokens=count_words).compact(
+        [{"url": "https://wayne.example", "content": content}], query="Wayne Enterprises"
+    )[0]["content"]
+    assert truncated == "Wayne Enterprises was founded …"
+
+
+def test_search_tool_compacts_results_but_keeps_raw_artifact():
+    '''Test that the Tavily tool hands compacted results to the model and errors through unchanged.'''
+    tool = RateLimitedTavilySearchResults(tavily_api_key="test", compactor=SearchResultCompactor())
+    raw = {"results": [{"url": "https://wayne.example/about", "content": PAGE}]}
+
+    results, artifact = tool._compact("Wayne Enterprises", raw["results"], raw)
+
+    assert "cookies" not in results[0]["content"] and "170,000" in results[0]["content"]
+    assert artifact is raw
+    assert tool._compact("Wayne Enterprises", "HTTPError('429')", {}) == ("HTTPError('429')", {})
@@ -0,0 +1,55 @@
+from src.core.domain.company_names import CompanyNameIndex
+
+
+def test_normalize_strips_legal_forms_and_articles():
+    """Test that punctuation, articles and legal suffixes do not distinguish companies."""
+    assert CompanyNameIndex.normalize("The Wayne Enterprises, Inc.") == "wayne enterprises"
+    assert CompanyNameIndex.normalize("Google LLC") == "google"
+    assert CompanyNameIndex.normalize("Procter & Gamble Co.") == "procter and gamble"
+    assert CompanyNameIndex.normalize("Company") == "company"
+
+
+def test_deduplicate_collapses_variants_aliases_and_typos():
+    """Test that spelling variants, aliases and, when enabled, misspellings map to one company."""
+    index = CompanyNameIndex(fuzzy_threshold=0.9)
+
+    distinct = index.deduplicate([
+        "Google LLC", "Google", "Alphabet/Google", "Alphabet Inc.",
+        "Wayne Enterprises", "Wayne Enterprizes", "Stark Industries", "",
+    ])
+
+    assert distinct == {
+        "google": "Google LLC",
+        "wayne enterprises": "Wayne Enterprises",
+        "stark industries": "Stark Industries",
+    }
+
+
+def test_fuzzy_matching_is_off_by_default():
+    """Test that the default index only merges exact normalized matches and aliases."""
+    index = CompanyNameIndex()
+
+    assert index.canonical("Wayne Enterprises") != index.canonical("Wayne Enterprizes")
+    assert index.canonical("Alphabet") == "google"
+    assert CompanyNameIndex(aliases={}).canonical("Alphabet") == "alphabet"
+
+
+def test_typo_matching_keeps_similar_companies_apart():
+    """Test that names differing by a short word or by several words are not merged."""
+    index = CompanyNameIndex(fuzzy_threshold=0.9)
+    index.canonical("Deutsche Bank")
+    index.canonical("General Motors")
+
+    assert index.canonical("Deutsche Bahn") == "deutsche bahn"
+    assert index.canonical("General Mills") == "general mills"
+
+
+def test_key_does_not_depend_on_names_seen_before():
+    """Test that the persistent key only uses normalization and aliases."""
+    index = CompanyNameIndex(fuzzy_threshold=0.9)
+    index.canonical("Wayne Enterprises")
+
+    assert index.canonical("Wayne Enterprizes") == "wayne enterprises"
+    assert index.key("Wayne Enterprizes") == "wayne enterprizes"
+    assert index.key("Alphabet/Google") == index.key("Google LLC") == "google"
+    assert index.key("Meta (Facebook)") == "meta"
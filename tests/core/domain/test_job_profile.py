@@ -0,0 +1,29 @@
+import pytest
+
+from src.core.agents.utils.job_profiles import build_job_profile
+from src.core.domain.job_profile import KeywordMatcher, normalize_skill
+from tests.fixtures.job_description import create_sample_software_engineer_job
+
+
+def test_keyword_matcher_respects_word_boundaries():
+    """Test that keywords match case-insensitively and only as whole words."""
+    matcher = KeywordMatcher(["Java", "Machine Learning", "C++", " "])
+
+    found = matcher.find("JavaScript and java, plus machine\nlearning in C++.")
+
+    assert found == {"java", "machine learning", "c++"}
+    assert KeywordMatcher([]).find("anything") == set()
+
+
+@pytest.mark.asyncio
+async def test_build_job_profile_splits_skills_by_priority():
+    """Test that the profile holds prompt fragments and normalized skill sets."""
+    job = create_sample_software_engineer_job()
+
+    profile = await build_job_profile(job)
+
+    assert profile.prompt_fragments["job_title"] == job.title
+    assert profile.required_skills == {
+        normalize_skill(tech.tech_type) for tech in job.tech_stack if tech.priority == "required"
+    }
+    assert profile.required_skills <= profile.find_skills(" ".join(t.tech_type for t in job.tech_stack))
@@ -0,0 +1,12 @@
+import json
+
+from src.core.domain.company_search import CompanyInfo
+from src.core.domain.schemas import get_model_schema
+
+
+def test_get_model_schema_is_generated_once():
+    """Test that the schema string is valid JSON and reused across calls."""
+    schema = get_model_schema(CompanyInfo)
+
+    assert json.loads(schema) == CompanyInfo.model_json_schema()
+    assert get_model_schema(CompanyInfo) is schema
@@ -0,0 +1,19 @@
+from src.core.domain.company_search import CompanyInfo
+from src.infrastructure.cache.sqlite_company_cache import SQLiteCompanyInfoCache
+
+
+def test_cache_persists_positive_and_negative_entries(tmp_path):
+    """Test that lookups, including failed ones, survive reopening the database."""
+    db_path = tmp_path / "company_info.sqlite"
+    cache = SQLiteCompanyInfoCache(db_path)
+    cache.set("wayne enterprises", CompanyInfo(name="Wayne Enterprises", size=5000))
+    cache.set("unknown corp", None)
+    cache.close()
+
+    cache = SQLiteCompanyInfoCache(db_path)
+    found = cache.get("wayne enterprises")
+    failed = cache.get("unknown corp")
+
+    assert found.company_info == CompanyInfo(name="Wayne Enterprises", size=5000)
+    assert failed is not None and failed.company_info is None
+    assert cache.get("never looked up") is None
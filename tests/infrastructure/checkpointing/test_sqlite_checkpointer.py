@@ -0,0 +1,19 @@
+import sqlite3
+import pytest
+
+from src.core.domain.config import CheckpointConfig
+from src.infrastructure.checkpointing.sqlite_checkpointer import sqlite_checkpointer
+
+
+@pytest.mark.asyncio
+async def test_checkpointer_uses_wal_and_creates_tables(tmp_path):
+    """Test that the checkpoint database is created in WAL mode with the checkpoint tables."""
+    db_path = tmp_path / "nested" / "checkpoints.sqlite"
+
+    async with sqlite_checkpointer(CheckpointConfig(db_path=db_path)):
+        pass
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    assert {"checkpoints", "writes"} <= tables
@@ -143,4 +143,18 @@ async def test_llm_extractor_resume_parse(mock_openai_setup):
     # Assert that the resume was parsed correctly
     assert resume is not None
     assert isinstance(resume, Resume)
-    assert resume.contact_info is not None
\ No newline at end of file
+    assert resume.contact_info is not None
+
+@pytest.mark.asyncio
+async def test_llm_extractor_shuts_down_anonymization_stage():
+    """
+    Test that leaving the extractor's context shuts down the anonymization stage's workers.
+    """
+    stage = MagicMock()
+
+    async with LLMStructuredExtractor(ai_provider=MagicMock(), template_service=MagicMock(),
+                                      anonymization_stage=stage):
+        stage.shutdown.assert_not_called()
+
+    stage.shutdown.assert_called_once_with()
+    LLMStructuredExtractor(ai_provider=MagicMock(), template_service=MagicMock()).close()
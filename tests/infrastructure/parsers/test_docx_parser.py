@@ -0,0 +1,45 @@
+import pytest
+from pathlib import Path
+
+from src.infrastructure.parsers.docx_parser import DocxParser
+from src.infrastructure.extractors.llm_extractor import LLMStructuredExtractor
+
+
+@pytest.mark.asyncio
+async def test_extract_text_from_path(sample_resume_docx):
+    """Test that paragraphs and tables are extracted in document order."""
+    parser = DocxParser()
+    text = await parser.extract_text(Path(sample_resume_docx))
+
+    assert text.splitlines() == [
+        "John Doe",
+        "john.doe@example.com",
+        "Experience",
+        "Senior Developer at Tech Corp",
+        "2020 - Present | Python, AWS",
+        "Skills",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_extract_text_from_bytes(sample_resume_docx):
+    """Test DOCX extraction from raw bytes content."""
+    parser = DocxParser()
+    text = await parser.extract_text(Path(sample_resume_docx).read_bytes())
+
+    assert "John Doe" in text
+
+
+@pytest.mark.asyncio
+async def test_extract_text_invalid_content():
+    """Test that non-DOCX content raises ValueError."""
+    parser = DocxParser()
+    with pytest.raises(ValueError):
+        await parser.extract_text(b"not a docx file")
+
+
+def test_extractor_detects_format_from_bytes(sample_resume_pdf, sample_resume_docx):
+    """Test that raw bytes are routed to the parser matching their signature."""
+    assert LLMStructuredExtractor._detect_format(Path(sample_resume_pdf).read_bytes()) == ".pdf"
+    assert LLMStructuredExtractor._detect_format(Path(sample_resume_docx).read_bytes()) == ".docx"
+    assert LLMStructuredExtractor._detect_format(b"plain text") is None
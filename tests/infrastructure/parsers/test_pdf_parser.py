@@ -0,0 +1,72 @@
+import mmap
+import pytest
+from pathlib import Path
+
+from src.infrastructure.parsers.pdf_parser import PDFParser
+
+
+@pytest.mark.asyncio
+async def test_read_file_small_returns_bytes(tmp_path):
+    """Test that files below the mmap threshold are read into bytes."""
+    file_path = tmp_path / "small.bin"
+    file_path.write_bytes(b"small content")
+
+    parser = PDFParser()
+    data = await parser._read_file(file_path)
+
+    assert data == b"small content"
+
+
+@pytest.mark.asyncio
+async def test_read_file_large_is_memory_mapped(tmp_path):
+    """Test that files at or above the mmap threshold are memory-mapped."""
+    file_path = tmp_path / "large.bin"
+    file_path.write_bytes(b"x" * 4096)
+
+    parser = PDFParser(mmap_threshold=1024)
+    data = await parser._read_file(file_path)
+
+    try:
+        assert isinstance(data, mmap.mmap)
+        assert len(data) == 4096
+    finally:
+        parser._release_buffer(data)
+
+
+@pytest.mark.asyncio
+async def test_read_file_rejects_files_over_size_cap(tmp_path):
+    """Test that files larger than max_file_size are rejected."""
+    file_path = tmp_path / "too_big.bin"
+    file_path.write_bytes(b"x" * 2048)
+
+    parser = PDFParser(max_file_size=1024)
+    with pytest.raises(ValueError):
+        await parser._read_file(file_path)
+
+
+@pytest.mark.asyncio
+async def test_read_file_missing_file(tmp_path):
+    """Test that a missing file raises FileNotFoundError."""
+    parser = PDFParser()
+    with pytest.raises(FileNotFoundError):
+        await parser._read_file(tmp_path / "missing.pdf")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mmap_threshold", [1, 10 * 1024 * 1024])
+async def test_extract_text_from_path(sample_resume_pdf, mmap_threshold):
+    """Test PDF extraction from a Path through both the bytes and mmap read paths."""
+    parser = PDFParser(mmap_threshold=mmap_threshold)
+    text = await parser.extract_text(Path(sample_resume_pdf))
+
+    assert "John Doe" in text
+    assert "Senior Developer at Tech Corp" in text
+
+
+@pytest.mark.asyncio
+async def test_extract_text_from_bytes(sample_resume_pdf):
+    """Test PDF extraction from raw bytes content."""
+    parser = PDFParser()
+    text = await parser.extract_text(Path(sample_resume_pdf).read_bytes())
+
+    assert "John Doe" in text
@@ -0,0 +1,89 @@
+import dataclasses
+import json
+import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock
+
+from src.core.domain.config import PrivacyConfig, TemplateConfig
+from src.core.domain.resume import ContactInfo
+from src.infrastructure.extractors.llm_extractor import LLMStructuredExtractor
+from src.infrastructure.privacy.anonymization_stage import AnonymizationStage
+from src.infrastructure.privacy.presidio_privacy_service import PrivacyService
+from src.infrastructure.template.jinja_template_service import JinjaTemplateService
+
+CV_TEXT = "John Doe\njohn.doe@example.com\nhttps://github.com/johndoe"
+
+
+@pytest.mark.asyncio
+async def test_anonymize_in_process_pool(privacy_config):
+    """Test that full-mode anonymization runs in worker processes and round-trips."""
+    stage = AnonymizationStage(PrivacyService(config=privacy_config), max_workers=1)
+    try:
+        anonymized, replacement_map = await stage.anonymize(CV_TEXT)
+    finally:
+        stage.shutdown()
+
+    assert anonymized == "<PERSON_0>\n<EMAIL_0>\nhttps://github.com/johndoe"
+    assert stage.privacy_service.restore_text(anonymized, replacement_map) == CV_TEXT
+
+
+@pytest.mark.asyncio
+async def test_long_documents_are_chunked_inline_in_the_pool(privacy_config):
+    """Test that a worker analyzes chunks itself instead of starting a nested pool, so shutdown completes."""
+    config = dataclasses.replace(privacy_config, chunk_size=200, chunk_overlap=20, chunk_workers=2)
+    text = "\n".join(f"Reference {i}: John Doe, john.doe{i}@example.com. Bruce Wayne reviewed it." for i in range(40))
+    stage = AnonymizationStage(PrivacyService(config=config), max_workers=1)
+    try:
+        anonymized, replacement_map = await stage.anonymize(text)
+    finally:
+        # Shutdown used to hang joining the worker's own, never shut down, chunk pool
+        shutdown = threading.Thread(target=stage.shutdown, daemon=True)
+        shutdown.start()
+        shutdown.join(timeout=60)
+    assert not shutdown.is_alive()
+
+    assert len(text) > config.chunk_size
+    assert "John Doe" not in anonymized and "Bruce Wayne" not in anonymized
+    assert stage.privacy_service.restore_text(anonymized, replacement_map) == text
+
+
+@pytest.mark.asyncio
+async def test_parse_document_sends_only_anonymized_text(privacy_config):
+    """Test that the LLM sees placeholders and the parsed model gets the original values back."""
+    ai_provider = AsyncMock()
+    ai_provider.complete.return_value = json.dumps({
+        "name": "<PERSON_0>",
+        "email": "<EMAIL_0>",
+        "links": ["https://github.com/johndoe"],
+    })
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        extractor = LLMStructuredExtractor(
+            ai_provider=ai_provider,
+            template_service=JinjaTemplateService(config=TemplateConfig.development()),
+            anonymization_stage=AnonymizationStage(
+                PrivacyService(config=privacy_config), executor=executor
+            ),
+        )
+        contact_info = await extractor.parse_document(
+            content=CV_TEXT,
+            output_model=ContactInfo,
+            template_path="prompts/parsing/resume_extractor.j2",
+        )
+
+    prompt = ai_provider.complete.call_args.args[0]
+    assert "John Doe" not in prompt and "john.doe@example.com" not in prompt
+    assert contact_info.name == "John Doe"
+    assert contact_info.email == "john.doe@example.com"
+    assert contact_info.links == ["https://github.com/johndoe"]
+
+
+@pytest.mark.asyncio
+async def test_fast_mode_runs_inline():
+    """Test that fast mode never starts a worker pool."""
+    stage = AnonymizationStage(PrivacyService(config=PrivacyConfig(mode="fast")))
+
+    anonymized, replacement_map = await stage.anonymize(CV_TEXT)
+
+    assert anonymized.startswith("<PERSON_0>\n<EMAIL_0>")
+    assert stage._executor is None
@@ -0,0 +1,63 @@
+import pytest
+from presidio_analyzer import RecognizerResult
+
+from src.core.domain.config import PrivacyConfig
+from src.infrastructure.privacy import nlp_engine_registry
+from src.infrastructure.privacy.chunked_analysis import merge_results, split_text
+from src.infrastructure.privacy.presidio_privacy_service import PrivacyService
+
+
+def test_split_text_ends_chunks_on_boundaries_and_overlaps():
+    """Test that chunks end on sentence boundaries, overlap, and cover the whole text."""
+    text = " ".join(f"Sentence number {i} mentions John Doe." for i in range(50))
+
+    chunks = split_text(text, chunk_size=200, overlap=40)
+
+    assert len(chunks) > 1
+    assert chunks[0].offset == 0
+    assert chunks[-1].offset + len(chunks[-1].text) == len(text)
+    for previous, current in zip(chunks, chunks[1:]):
+        assert previous.text.endswith(". ")
+        assert len(previous.text) <= 200
+        assert current.offset < previous.offset + len(previous.text)
+        assert text[current.offset:].startswith(current.text)
+
+
+def test_split_text_rejects_oversized_overlap():
+    """Test that an overlap of half the chunk size or more is rejected."""
+    with pytest.raises(ValueError):
+        split_text("text", chunk_size=100, overlap=50)
+
+
+def test_merge_results_deduplicates_seams():
+    """Test that duplicate and truncated spans from overlapping chunks are merged."""
+    results = [
+        RecognizerResult("PERSON", 10, 18, 0.85),
+        RecognizerResult("PERSON", 10, 14, 0.85),
+        RecognizerResult("PERSON", 10, 18, 0.85),
+        RecognizerResult("PHONE_NUMBER", 12, 20, 0.4),
+        RecognizerResult("PERSON", 30, 38, 0.85),
+    ]
+
+    merged = merge_results(results)
+
+    assert [(r.entity_type, r.start, r.end) for r in merged] == [
+        ("PERSON", 10, 18), ("PHONE_NUMBER", 12, 20), ("PERSON", 30, 38),
+    ]
+
+
+def test_chunked_anonymization_matches_single_pass(privacy_config):
+    """Test that chunked NER in worker processes gives the same result as one pass."""
+    text = "\n\n".join(
+        f"Paragraph {i}. John Doe reviewed the work of Bruce Wayne." for i in range(40)
+    )
+    chunked = PrivacyService(config=PrivacyConfig(
+        nlp_model=privacy_config.nlp_model, chunk_size=300, chunk_overlap=60, chunk_workers=2,
+    ))
+    single = PrivacyService(config=PrivacyConfig(nlp_model=privacy_config.nlp_model, chunk_size=0))
+
+    try:
+        assert chunked.anonymize_cv(text) == single.anonymize_cv(text)
+    finally:
+        nlp_engine_registry.reset()
+    assert "John Doe" not in single.anonymize_cv(text)
@@ -0,0 +1,64 @@
+from src.infrastructure.privacy.pattern_scanner import (
+    PatternScanner,
+    find_contact_name,
+    find_phone_numbers,
+    get_scanner,
+)
+
+
+def test_scan_classifies_matches():
+    """Test that emails, professional URLs and other URLs are told apart in one pass."""
+    text = (
+        "Bruce Wayne\n"
+        "bruce.wayne@wayneenterprises.com | https://www.linkedin.com/in/brucewayne\n"
+        "github/not-batman and https://wayne.example.com/about\n"
+    )
+
+    matches = get_scanner().scan(text)
+
+    assert [(m.kind, m.text) for m in matches] == [
+        ("email", "bruce.wayne@wayneenterprises.com"),
+        ("professional_url", "https://www.linkedin.com/in/brucewayne"),
+        ("professional_url", "github/not-batman"),
+        ("url", "https://wayne.example.com/about"),
+    ]
+    assert all(text[m.start:m.end] == m.text for m in matches)
+
+
+def test_scan_matches_host_labels_not_substrings():
+    """Test that professional domains are matched against whole host labels."""
+    scanner = PatternScanner(["medium"])
+
+    matches = scanner.scan("https://medium.com/@bruce https://mediumsizedcorp.com/about")
+
+    assert [m.kind for m in matches] == ["professional_url", "url"]
+
+
+def test_scan_skips_lines_without_anchors_but_finds_wrapped_emails():
+    """Test that emails split across lines are still found."""
+    text = "Summary line without links\nbruce.wayne\n@wayneenterprises.com\nAnother plain line"
+
+    matches = get_scanner().scan(text)
+
+    assert [m.text for m in matches] == ["bruce.wayne\n@wayneenterprises.com"]
+
+
+def test_scan_plain_text_has_no_matches():
+    """Test that text without anchors yields no matches."""
+    assert get_scanner().scan("Led a team of 120 scientists and engineers") == []
+
+
+def test_find_phone_numbers_ignores_years_and_short_numbers():
+    """Test that phone numbers are found while date ranges are ignored."""
+    text = "Call +44 20 7946 0958 or (555) 123-4567. Worked 2010-2015, team of 120."
+
+    phones = find_phone_numbers(text)
+
+    assert [m.text for m in phones] == ["+44 20 7946 0958", "(555) 123-4567"]
+
+
+def test_find_contact_name_from_header():
+    """Test that the name is taken from the first name-like header line."""
+    assert find_contact_name("Curriculum Vitae\nBruce Wayne\nGotham City, USA") == "Bruce Wayne"
+    assert find_contact_name("ALFRED PENNYWORTH\nalfred@email.com") == "ALFRED PENNYWORTH"
+    assert find_contact_name("Experienced engineer with 10 years in ML") is None
@@ -0,0 +1,150 @@
+import pytest
+
+from src.core.domain.config import PrivacyConfig
+from src.infrastructure.privacy import nlp_engine_registry
+from src.infrastructure.privacy.presidio_privacy_service import PrivacyService
+
+
+@pytest.fixture
+def privacy_service(privacy_config):
+    """
+    Create a PrivacyService using the test spaCy pipeline.
+    
+    :param privacy_config: Privacy configuration fixture
+    :type privacy_config: PrivacyConfig
+    :returns: Privacy service instance
+    :rtype: PrivacyService
+    """
+    return PrivacyService(config=privacy_config)
+
+
+def test_engines_are_shared_across_instances(privacy_config):
+    """Test that the analyzer is loaded once and reused by every instance."""
+    nlp_engine_registry.reset()
+
+    first = PrivacyService(config=privacy_config)
+    second = PrivacyService(config=privacy_config)
+
+    assert not nlp_engine_registry._analyzers
+    first.warm_up()
+    assert first.analyzer is second.analyzer
+
+
+def test_anonymize_cv_masks_person_phone_and_email(privacy_service):
+    """Test that names, phone numbers and emails are removed from the CV."""
+    text = "John Doe\njohn.doe@example.com\n212-555-0199"
+
+    anonymized = privacy_service.anonymize_cv(text)
+
+    assert "John Doe" not in anonymized
+    assert "john.doe@example.com" not in anonymized
+    assert "212-555-0199" not in anonymized
+    assert "<PERSON>" in anonymized
+
+
+def test_anonymize_many_matches_single_document_results(privacy_service):
+    """Test that batched anonymization gives the same output as per-document calls."""
+    texts = [
+        "John Doe\njohn.doe@example.com\n212-555-0199",
+        "Bruce Wayne, CTO at Wayne Enterprises",
+        "",
+    ]
+
+    batched = privacy_service.anonymize_many(texts, batch_size=2)
+
+    assert batched == [privacy_service.anonymize_cv(text) for text in texts]
+    assert "Bruce Wayne" not in batched[1]
+
+
+def test_anonymize_many_empty_input(privacy_service):
+    """Test that an empty batch returns an empty list."""
+    assert privacy_service.anonymize_many([]) == []
+
+
+def test_fast_mode_anonymizes_contact_block_without_ner(privacy_config):
+    """Test that fast mode masks the header name, emails and phones using patterns only."""
+    nlp_engine_registry.reset()
+    config = PrivacyConfig(mode="fast", nlp_model=privacy_config.nlp_model)
+    service = PrivacyService(config=config)
+    text = (
+        "BRUCE WAYNE\n"
+        "bruce.wayne@wayneenterprises.com | (555) 123-4567\n"
+        "https://www.linkedin.com/in/1234567890\n"
+        "Chief Technology Officer, 2015 - 2020. Bruce Wayne led 120 engineers."
+    )
+
+    anonymized = service.anonymize_cv(text)
+
+    assert anonymized == (
+        "<PERSON>\n"
+        "<EMAIL_0> | <PHONE>\n"
+        "https://www.linkedin.com/in/1234567890\n"
+        "Chief Technology Officer, 2015 - 2020. <PERSON> led 120 engineers."
+    )
+    assert service.anonymize_many([text]) == [anonymized]
+    assert not nlp_engine_registry._analyzers
+
+
+def test_anonymize_text_round_trip(privacy_service):
+    """Test that reversible anonymization uses consistent placeholders and restores exactly."""
+    text = (
+        "John Doe\n"
+        "john.doe@example.com | 212-555-0199\n"
+        "https://github.com/johndoe\n"
+        "Referee: Bruce Wayne. John Doe led the team; contact John.Doe@Example.com."
+    )
+
+    anonymized, replacement_map = privacy_service.anonymize_text(text)
+
+    assert "John Doe" not in anonymized and "Bruce Wayne" not in anonymized
+    assert "john.doe@example.com" not in anonymized.lower()
+    assert "https://github.com/johndoe" in anonymized
+    assert anonymized.count("<PERSON_0>") == 2
+    assert anonymized.count("<EMAIL_0>") == 1 and anonymized.count("<EMAIL_1>") == 1
+    assert "<PERSON_1>" in anonymized
+    assert replacement_map["<PERSON_0>"] == "John Doe"
+    assert privacy_service.restore_text(anonymized, replacement_map) == text
+
+
+def test_anonymize_text_keeps_spellings_apart(privacy_service):
+    """Test that different spellings of a value get their own placeholders and are restored as written."""
+    text = (
+        "bruce+jobs@wayne.com, bruce@wayne.com, (212) 555-0199, 212.555.0199, "
+        "Bruce Wayne and BRUCE WAYNE"
+    )
+
+    anonymized, replacement_map = privacy_service.anonymize_text(text)
+
+    assert "<EMAIL_0>" in anonymized and "<EMAIL_1>" in anonymized
+    assert len(set(replacement_map.values())) == len(replacement_map)
+    assert privacy_service.restore_text(*privacy_service.anonymize_text(text)) == text
+
+
+def test_anonymize_text_avoids_existing_placeholders(privacy_service):
+    """Test that placeholders already present in the input are not reused."""
+    text = "<PERSON_0> was written by John Doe"
+
+    anonymized, replacement_map = privacy_service.anonymize_text(text)
+
+    assert anonymized == "<PERSON_0> was written by <PERSON_1>"
+    assert privacy_service.restore_text(anonymized, replacement_map) == text
+
+
+def test_urls_are_not_anonymized_by_ner(privacy_service):
+    """Test that entities detected inside URLs do not mangle the link."""
+    text = "Portfolio: https://example.com/John Doe and linkedin.com/in/bruce"
+
+    anonymized, replacement_map = privacy_service.anonymize_text(text)
+
+    assert "https://example.com/John" in anonymized
+    assert "linkedin.com/in/bruce" in anonymized
+
+
+def test_restore_text_leaves_unknown_text_intact(privacy_service):
+    """Test that restore only replaces placeholders from the mapping."""
+    replacement_map = {"<PERSON_1>": "John Doe", "<PERSON_10>": "Bruce Wayne"}
+
+    restored = privacy_service.restore_text("<PERSON_10>, <PERSON_1> and <PERSON_2>", replacement_map)
+
+    assert restored == "Bruce Wayne, John Doe and <PERSON_2>"
+    assert privacy_service.restore_text("no placeholders", {}) == "no placeholders"
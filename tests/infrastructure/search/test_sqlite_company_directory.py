@@ -0,0 +1,64 @@
+"""
+Tests for the SQLite company directory.
+"""
+import json
+import pytest
+
+from src.core.agents.search_agents import CompanyDirectorySearchTool
+from src.core.domain.company_search import CompanyInfo
+from src.infrastructure.search.sqlite_company_directory import SQLiteCompanyDirectory
+
+
+@pytest.fixture
+def directory(tmp_path):
+    directory = SQLiteCompanyDirectory(tmp_path / "companies.sqlite")
+
+    csv_path = tmp_path / "companies.csv"
+    csv_path.write_text(
+        "name,industry,location,size,founded_year,website,aliases\n"
+        "Google,Internet search and advertising,\"Mountain View, CA\",180000,1998,https://google.com,Alphabet;Google LLC\n"
+        "Wayne Enterprises,Defense and conglomerate,\"Gotham City\",,1850,,\n"
+    )
+    jsonl_path = tmp_path / "companies.jsonl"
+    jsonl_path.write_text(
+        json.dumps({"name": "Stark Industries", "industry": "Defense technology", "aliases": ["Stark"]}) + "\n"
+        + json.dumps({"name": "Nameless", "size": "many"}) + "\n"
+    )
+
+    assert directory.load(csv_path) == 2
+    assert directory.load(jsonl_path) == 1
+    yield directory
+    directory.close()
+
+
+def test_lookup_by_name_alias_or_variant(directory):
+    """Test that companies are found under their aliases and spelling variants."""
+    google = directory.lookup("Alphabet Inc.")
+
+    assert google.name == "Google" and google.size == 180000 and google.location == "Mountain View, CA"
+    assert directory.lookup("the Wayne Enterprises, Inc.").founded_year == 1850
+    assert directory.lookup("Stark").name == "Stark Industries"
+    assert directory.lookup("Acme") is None
+
+
+def test_reloading_replaces_records(directory):
+    """Test that loading a company again updates it instead of duplicating it."""
+    directory.add_records([{"name": "Google LLC", "industry": "Cloud computing"}])
+
+    assert directory.lookup("Google").industry == "Cloud computing"
+    assert [result["title"] for result in directory.search("cloud Google")] == ["Google LLC"]
+
+
+def test_search_tool_matches_the_tavily_result_format(directory):
+    """Test that the directory tool returns ranked results with the fields of Tavily results."""
+    tool = CompanyDirectorySearchTool(directory=directory)
+
+    content, artifact = tool._run("defense companies in Gotham")
+
+    assert [result["title"] for result in content] == ["Wayne Enterprises", "Stark Industries"]
+    assert set(content[0]) == {"title", "url", "content", "score"}
+    assert content[0]["url"] == "local://companies/wayne enterprises"
+    assert "Location: Gotham City." in content[0]["content"]
+    assert 0 <= content[1]["score"] <= content[0]["score"] < 1
+    assert artifact == {"query": "defense companies in Gotham", "results": content}
+    assert tool._run("NEAR OR (")[1]["results"] == []
@@ -0,0 +1,21 @@
+'''
+Tests for the shared infrastructure components.
+'''
+import importlib
+
+from src.infrastructure import components
+
+
+def test_shared_components_are_created_on_first_access(monkeypatch):
+    '''Test that importing the module creates no component and each one is created once.'''
+    importlib.reload(components)
+    assert components.get_template_service.cache_info().currsize == 0
+    assert components.get_llm_extractor.cache_info().currsize == 0
+
+    created = []
+    monkeypatch.setattr(components, "create_template_service", lambda: created.append(1) or object())
+    try:
+        assert components.template_service is components.template_service
+        assert created == [1]
+    finally:
+        components.get_template_service.cache_clear()
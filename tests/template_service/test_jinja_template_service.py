@@ -76,6 +76,125 @@ def test_successful_template_rendering(template_service):
     assert result == "Hello World!"
 
 
+def test_production_config_uses_bytecode_cache(template_dir, tmp_path):
+    """
+    Test that production configuration precompiles templates into the bytecode cache.
+    
+    :param template_dir: Path to template directory
+    :type template_dir: Path
+    :param tmp_path: Pytest temporary path fixture
+    :type tmp_path: Path
+    """
+    config = TemplateConfig.production(bytecode_cache_dir=tmp_path / "bytecode")
+    config.templates_dir = template_dir
+    service = JinjaTemplateService(config)
+
+    assert service._env.auto_reload is False
+    # Only the valid template compiles; the invalid one is skipped
+    assert len(list((tmp_path / "bytecode").iterdir())) == 1
+    assert service.render_prompt("valid_template.j2", name="World") == "Hello World!"
+
+
+def test_precompile_templates_skips_invalid(template_service):
+    """
+    Test that precompilation reports only successfully compiled templates.
+    
+    :param template_service: Template service instance
+    :type template_service: JinjaTemplateService
+    """
+    assert template_service.precompile_templates() == 1
+
+
+@pytest.fixture
+def cached_template_service(template_dir):
+    """
+    Create a JinjaTemplateService instance with render caching enabled.
+    
+    :param template_dir: Path to template directory
+    :type template_dir: Path
+    :returns: Template service with render caching
+    :rtype: JinjaTemplateService
+    """
+    config = TemplateConfig.testing(templates_dir=template_dir)
+    config.cache_enabled = True
+    config.cache_ttl = 3600
+    return JinjaTemplateService(config)
+
+
+def test_render_cache_reuses_static_renders(cached_template_service, template_dir):
+    """
+    Test that renders with scalar inputs are memoised until the cache is cleared.
+    
+    :param cached_template_service: Template service with render caching
+    :type cached_template_service: JinjaTemplateService
+    :param template_dir: Path to template directory
+    :type template_dir: Path
+    """
+    assert cached_template_service.render_prompt("valid_template.j2", name="World") == "Hello World!"
+
+    (template_dir / "valid_template.j2").write_text("Goodbye {{ name }}!")
+    assert cached_template_service.render_prompt("valid_template.j2", name="World") == "Hello World!"
+    assert cached_template_service.render_prompt("valid_template.j2", name="Gotham") == "Goodbye Gotham!"
+
+    cached_template_service.clear_render_cache()
+    assert cached_template_service.render_prompt("valid_template.j2", name="World") == "Goodbye World!"
+
+
+def test_render_cache_distinguishes_value_types(cached_template_service):
+    """
+    Test that equal values of different types are cached separately.
+    
+    :param cached_template_service: Template service with render caching
+    :type cached_template_service: JinjaTemplateService
+    """
+    assert cached_template_service.render_prompt("valid_template.j2", name=1) == "Hello 1!"
+    assert cached_template_service.render_prompt("valid_template.j2", name=True) == "Hello True!"
+
+
+def test_render_cache_skips_unhashable_context(cached_template_service):
+    """
+    Test that renders with mutable inputs are never cached.
+    
+    :param cached_template_service: Template service with render caching
+    :type cached_template_service: JinjaTemplateService
+    """
+    names = ["World"]
+    assert cached_template_service.render_prompt("valid_template.j2", name=names) == "Hello ['World']!"
+    assert not cached_template_service._render_cache
+
+
+def test_template_fingerprint_tracks_dependencies(template_service, template_dir):
+    """
+    Test that a fingerprint changes with the template and the templates it includes.
+    
+    :param template_service: Template service instance
+    :type template_service: JinjaTemplateService
+    :param template_dir: Path to template directory
+    :type template_dir: Path
+    """
+    (template_dir / "partial.j2").write_text("Partial v1")
+    (template_dir / "parent.j2").write_text("{% include 'partial.j2' %}")
+
+    parent_v1 = template_service.get_template_fingerprint("parent.j2")
+    valid_v1 = template_service.get_template_fingerprint("valid_template.j2")
+    assert parent_v1 == template_service.get_template_fingerprint("parent.j2")
+
+    (template_dir / "partial.j2").write_text("Partial v2")
+    assert template_service.get_template_fingerprint("parent.j2") != parent_v1
+    assert template_service.get_template_fingerprint("valid_template.j2") == valid_v1
+
+
+def test_template_fingerprint_not_found(template_service):
+    """
+    Test that fingerprinting a missing template raises TemplateNotFoundError.
+    
+    :param template_service: Template service instance
+    :type template_service: JinjaTemplateService
+    """
+    with pytest.raises(TemplateNotFoundError):
+        template_service.get_template_fingerprint("nonexistent.j2")
+
+
 @pytest.mark.skip(reason="Not implemented yet - waiting for real templates")
 def test_with_real_templates():
     """
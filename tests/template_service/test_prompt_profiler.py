@@ -0,0 +1,61 @@
+import pytest
+from src.core.domain.config import TemplateConfig
+from src.infrastructure.template.jinja_template_service import JinjaTemplateService
+from src.infrastructure.template.prompt_profiler import (
+    ModelCostProfile,
+    PromptProfiler,
+    format_report,
+)
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    """
+    Create a PromptProfiler over a temporary template directory.
+    
+    :param tmp_path: Pytest temporary path fixture
+    :type tmp_path: Path
+    :returns: Profiler with a character-based token counter
+    :rtype: PromptProfiler
+    """
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "header.j2").write_text("Header. ")
+    (template_dir / "prompt.j2").write_text("{% include 'header.j2' %}Input: {{ input_text }}")
+
+    service = JinjaTemplateService(TemplateConfig.testing(templates_dir=template_dir))
+    cost_profile = ModelCostProfile("test-model", input_cost_per_million_tokens=1_000_000,
+                                    prefill_tokens_per_second=10, base_latency_seconds=0)
+    profiler = PromptProfiler(service, cost_profile)
+    profiler._count_tokens = len
+    return profiler
+
+
+def test_profile_splits_static_and_variable_text(profiler):
+    """
+    Test that static text includes dependencies and estimates scale with tokens.
+    
+    :param profiler: Prompt profiler instance
+    :type profiler: PromptProfiler
+    """
+    profile = profiler.profile("prompt.j2", {"input_text": "0123456789"})
+
+    assert profile.rendered_chars == len("Header. Input: 0123456789")
+    assert profile.static_chars == len("Header. Input: ")
+    assert profile.variable_chars == 10
+    assert profile.estimated_latency_seconds == pytest.approx(profile.tokens / 10)
+    assert profile.estimated_cost_usd == pytest.approx(profile.tokens)
+
+
+def test_profile_all_orders_by_size(profiler):
+    """
+    Test that all templates are profiled, largest first, and reported.
+    
+    :param profiler: Prompt profiler instance
+    :type profiler: PromptProfiler
+    """
+    profiles = profiler.profile_all({"prompt.j2": {"input_text": "some input"}})
+
+    assert [p.template_name for p in profiles] == ["prompt.j2", "header.j2"]
+    assert profiles[1].static_share == 1.0
+    assert "prompt.j2" in format_report(profiles)